@@ -0,0 +1,2 @@
+# Suite de mesures de performance, lancée en ligne de commande :
+#   python -m benchmarks --help
@@ -0,0 +1,63 @@
+import csv
+import json
+from typing import NamedTuple
+
+# Écriture des résultats (JSON / CSV) et comparaison avec une référence.
+#
+# Un résultat est un dict à plat ; "name" l'identifie d'une exécution à
+# l'autre, "median" (secondes par opération) sert à la comparaison.
+
+FIELDS = ("name", "group", "engine", "size", "density", "variant",
+          "steps", "repeats", "median", "min", "cells_per_s")
+
+# En dessous de cet écart absolu (s), une différence est du bruit de mesure
+NOISE_FLOOR = 20e-6
+
+
+class Comparison(NamedTuple):
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline > 0 else float("inf")
+
+    def regressed(self, threshold: float) -> bool:
+        return self.ratio > 1 + threshold and self.current - self.baseline > NOISE_FLOOR
+
+
+def write_json(path, meta, results):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"meta": meta, "results": results}, f, indent=1)
+
+
+def write_csv(path, results):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def load_results(path):
+    """(meta, résultats) d'un fichier JSON écrit par write_json."""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return data.get("meta", {}), data["results"]
+
+
+def compare(results, baseline):
+    """Comparaisons des cas présents dans les deux séries, dans l'ordre de `results`."""
+    reference = {r["name"]: r["median"] for r in baseline}
+    return [
+        Comparison(r["name"], reference[r["name"]], r["median"])
+        for r in results if r["name"] in reference
+    ]
+
+
+def format_comparisons(comparisons, threshold):
+    lines = [f"{'cas':<48} {'référence':>12} {'actuel':>12} {'ratio':>7}"]
+    for c in comparisons:
+        flag = "  RÉGRESSION" if c.regressed(threshold) else ""
+        lines.append(f"{c.name:<48} {c.baseline * 1000:>10.3f}ms {c.current * 1000:>10.3f}ms {c.ratio:>6.2f}x{flag}")
+    return "\n".join(lines)
@@ -0,0 +1,373 @@
+import argparse
+import fnmatch
+import os
+import platform
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from core.engines import available_engines
+from core.game import GameOfLife
+from core.version import get_version
+from gui.pattern_manager import PATTERNS, PatternManager
+from .report import compare, format_comparisons, load_results, write_csv, write_json
+
+# Cas mesurés (tous reproductibles : grilles générées depuis une graine fixe) :
+#   step/<moteur>/<taille>/<densité>/{history,nohistory} : une génération
+#   io/<format>/<taille>/<densité>/{save,load}           : un fichier de pattern
+#   gui/canvas/<taille>/<densité>/{full,diff}            : un rafraîchissement Qt (offscreen)
+# La valeur retenue est la médiane sur plusieurs répétitions du temps par opération.
+
+GROUPS = ("step", "io", "gui")
+DEFAULT_SIZES = (64, 256, 1024, 4096, 8192)
+QUICK_SIZES = (64, 256)
+DEFAULT_DENSITIES = ("gliders", "0.1", "0.5")
+DEFAULT_ENGINES = ("python", "numpy", "bitpacked", "sparse", "incremental")
+IO_FORMATS = (".json", ".rle", ".cells", ".gol")
+BASELINE = Path(__file__).parent / "baseline.json"
+
+GLIDER_SPACING = 16       # un planeur par carré de 16x16 cellules
+WORK_PER_REPEAT = 1 << 24  # cellules traitées par répétition : fixe le nombre de générations
+MAX_STEPS = 50
+
+# Cas ignorés sauf --no-limits : trop lents pour une exécution complète raisonnable
+MAX_CELLS = {"python": 128 * 128}
+MAX_LIVE = {"sparse": 25_000, ".json": 2_000_000, ".rle": 2_000_000, ".cells": 2_000_000}
+
+_app = None  # QApplication partagée par les cas "gui"
+
+
+# ---------------------------
+# Grilles de départ
+# ---------------------------
+
+def parse_density(text):
+    """"gliders" (champ de planeurs) ou une densité de soupe aléatoire dans ]0, 1]."""
+    if text == "gliders":
+        return text
+    try:
+        density = float(text)
+    except ValueError:
+        density = -1
+    if not 0 < density <= 1:
+        raise argparse.ArgumentTypeError(f"Densité invalide : {text!r} (attendu gliders ou 0-1)")
+    return density
+
+
+def density_label(density) -> str:
+    return density if density == "gliders" else f"soup{round(density * 100)}"
+
+
+def seed_cells(size: int, density, seed: int = 0) -> np.ndarray:
+    """Grille size x size : planeurs régulièrement espacés, ou soupe aléatoire."""
+    if density == "gliders":
+        cells = np.zeros((size, size), dtype=np.uint8)
+        origins = np.arange(0, size - 2, GLIDER_SPACING)
+        for dr, dc in PATTERNS["Glider"]:
+            cells[np.ix_(origins + dr, origins + dc)] = 1
+        return cells
+    # Entiers 16 bits plutôt que flottants : 4x moins de mémoire sur les grandes grilles
+    noise = np.random.default_rng(seed).integers(0, 1 << 16, (size, size), dtype=np.uint16)
+    return (noise < round(density * (1 << 16))).astype(np.uint8)
+
+
+def default_steps(size: int) -> int:
+    return max(1, min(MAX_STEPS, WORK_PER_REPEAT // (size * size)))
+
+
+# ---------------------------
+# Mesures
+# ---------------------------
+
+def _result(group, engine, size, density, variant, times, steps):
+    per_op = [t / steps for t in times]
+    median = statistics.median(per_op)
+    return {
+        "name": f"{group}/{engine}/{size}/{density_label(density)}/{variant}",
+        "group": group,
+        "engine": engine,
+        "size": size,
+        "density": density_label(density),
+        "variant": variant,
+        "steps": steps,
+        "repeats": len(times),
+        "median": median,
+        "min": min(per_op),
+        "cells_per_s": size * size / median if median > 0 else float("inf"),
+    }
+
+
+def _new_game(engine, cells, history=False):
+    game = GameOfLife(len(cells), len(cells), engine=engine, history=history)
+    game.grid = cells
+    return game
+
+
+def bench_step(engine, cells, history, steps, repeats):
+    """Temps d'une génération (GameOfLife.next_generation, historique compris)."""
+    times = []
+    for _ in range(repeats):
+        game = _new_game(engine, cells, history)
+        try:
+            game.next_generation()  # échauffement (tampons, premiers diffs)
+            start = time.perf_counter()
+            for _ in range(steps):
+                game.next_generation()
+            times.append(time.perf_counter() - start)
+        finally:
+            game.close()
+    return times
+
+
+def bench_io(suffix, cells, repeats, workdir):
+    """Temps de sauvegarde et de chargement d'un pattern ; renvoie (save, load)."""
+    filename = f"bench_{len(cells)}{suffix}"
+    save_times, load_times = [], []
+    game = _new_game("numpy", cells)
+    try:
+        for _ in range(repeats):
+            manager = PatternManager(workdir)
+            start = time.perf_counter()
+            manager.export_pattern(game, filename)
+            save_times.append(time.perf_counter() - start)
+
+            # Gestionnaire neuf : chargement à froid, sans le cache du catalogue
+            manager = PatternManager(workdir)
+            target = GameOfLife(len(cells), len(cells), engine="numpy", history=False)
+            try:
+                start = time.perf_counter()
+                manager.load_into(target, filename)
+                load_times.append(time.perf_counter() - start)
+            finally:
+                target.close()
+    finally:
+        game.close()
+    return save_times, load_times
+
+
+def qt_available() -> bool:
+    """Prépare une QApplication hors écran ; False si PyQt6 est absent."""
+    global _app
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    try:
+        from PyQt6.QtWidgets import QApplication
+    except ImportError:
+        return False
+    _app = QApplication.instance() or QApplication([])
+    return True
+
+
+def bench_gui(cells, steps, repeats):
+    """Temps de rafraîchissement du GridCanvas ; renvoie (complet, par diff)."""
+    from gui.grid_canvas import GridCanvas
+
+    full_times, diff_times = [], []
+    for _ in range(repeats):
+        game = _new_game("numpy", cells)
+        canvas = GridCanvas(len(cells), len(cells), lambda *cell: None)
+        canvas.resize(800, 800)
+        canvas.show()
+        _app.processEvents()
+        full = diff = 0.0
+        try:
+            for _ in range(steps):
+                game.next_generation()
+                grid = game.engine.to_array()
+                start = time.perf_counter()
+                canvas.set_grid(grid)
+                _app.processEvents()
+                full += time.perf_counter() - start
+
+                game.next_generation()
+                grid = game.engine.to_array()
+                changes = game.last_changes
+                start = time.perf_counter()
+                if changes is None:
+                    canvas.set_grid(grid)
+                else:
+                    canvas.update_cells(changes, grid)
+                _app.processEvents()
+                diff += time.perf_counter() - start
+        finally:
+            canvas.close()
+            canvas.deleteLater()
+            game.close()
+        full_times.append(full)
+        diff_times.append(diff)
+    return full_times, diff_times
+
+
+# ---------------------------
+# Exécution
+# ---------------------------
+
+def skip_reason(key, size, cells):
+    if size * size > MAX_CELLS.get(key, size * size):
+        return "grille trop grande"
+    if int(np.count_nonzero(cells)) > MAX_LIVE.get(key, float("inf")):
+        return "trop de cellules vivantes"
+    return None
+
+
+def run_suite(args, report=print):
+    """Exécute les cas sélectionnés ; renvoie la liste des résultats."""
+    results = []
+
+    def selected(name):
+        return not args.filter or any(fnmatch.fnmatch(name, p) for p in args.filter)
+
+    histories = {"on": (True,), "off": (False,), "both": (False, True)}[args.history]
+    gui = "gui" in args.groups and qt_available()
+    if "gui" in args.groups and not gui:
+        report("PyQt6 indisponible : cas gui ignorés")
+
+    def add(result):
+        if selected(result["name"]):
+            results.append(result)
+            report(f"{result['name']:<48} {result['median'] * 1000:>10.3f} ms")
+
+    def wanted(names, key, size, cells):
+        """Vrai si un des cas `names` est sélectionné et dans les limites."""
+        if not any(selected(name) for name in names):
+            return False
+        reason = None if args.no_limits else skip_reason(key, size, cells)
+        if reason:
+            case = names[0] if len(names) == 1 else names[0].rsplit("/", 1)[0] + "/*"
+            report(f"{case:<48} ignoré ({reason})")
+        return reason is None
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in args.sizes:
+            steps = args.steps or default_steps(size)
+            for density in args.densities:
+                label = density_label(density)
+                cells = seed_cells(size, density, args.seed)
+
+                if "step" in args.groups:
+                    for engine in args.engines:
+                        for history in histories:
+                            variant = "history" if history else "nohistory"
+                            if wanted([f"step/{engine}/{size}/{label}/{variant}"], engine, size, cells):
+                                times = bench_step(engine, cells, history, steps, args.repeats)
+                                add(_result("step", engine, size, density, variant, times, steps))
+
+                if "io" in args.groups:
+                    for suffix in IO_FORMATS:
+                        names = [f"io/{suffix[1:]}/{size}/{label}/{v}" for v in ("save", "load")]
+                        if wanted(names, suffix, size, cells):
+                            save_times, load_times = bench_io(suffix, cells, args.repeats, workdir)
+                            add(_result("io", suffix[1:], size, density, "save", save_times, 1))
+                            add(_result("io", suffix[1:], size, density, "load", load_times, 1))
+
+                if gui:
+                    names = [f"gui/canvas/{size}/{label}/{v}" for v in ("full", "diff")]
+                    if wanted(names, "gui", size, cells):
+                        full_times, diff_times = bench_gui(cells, steps, args.repeats)
+                        add(_result("gui", "canvas", size, density, "full", full_times, steps))
+                        add(_result("gui", "canvas", size, density, "diff", diff_times, steps))
+    return results
+
+
+def environment(args) -> dict:
+    """Contexte de la mesure, enregistré avec les résultats."""
+    return {
+        "version": get_version(),
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "seed": args.seed,
+        "repeats": args.repeats,
+    }
+
+
+def comma_list(convert=str):
+    def parse(text):
+        return [convert(item.strip()) for item in text.split(",") if item.strip()]
+    return parse
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Mesures de performance du Jeu de la Vie (moteurs, historique, fichiers, affichage)",
+    )
+    parser.add_argument("--groups", type=comma_list(), default=list(GROUPS),
+                        help=f"groupes de cas, parmi {','.join(GROUPS)} (défaut : tous)")
+    parser.add_argument("--engines", type=comma_list(), default=list(DEFAULT_ENGINES),
+                        help=f"moteurs mesurés, parmi {','.join(available_engines())}")
+    parser.add_argument("--sizes", type=comma_list(int), default=None,
+                        help="côtés des grilles carrées, ex. 64,1024 (défaut : 64 à 8192)")
+    parser.add_argument("--densities", type=comma_list(parse_density), default=None,
+                        help="gliders (champ de planeurs) et/ou densités de soupe, ex. gliders,0.5")
+    parser.add_argument("--history", choices=("on", "off", "both"), default="both",
+                        help="cas step avec et/ou sans historique")
+    parser.add_argument("--steps", type=int, default=0,
+                        help="générations par répétition (défaut : selon la taille)")
+    parser.add_argument("--repeats", type=int, default=5, help="répétitions par cas (médiane retenue)")
+    parser.add_argument("--seed", type=int, default=0, help="graine des soupes aléatoires")
+    parser.add_argument("--quick", action="store_true",
+                        help="exécution courte : petites grilles, 3 répétitions")
+    parser.add_argument("--filter", action="append", default=[], metavar="MOTIF",
+                        help="ne garde que les cas dont le nom correspond, ex. 'step/numpy/*'")
+    parser.add_argument("--no-limits", action="store_true",
+                        help="mesure aussi les cas très lents (moteur python sur grande grille...)")
+    parser.add_argument("--json", metavar="FICHIER", help="écrit les résultats en JSON")
+    parser.add_argument("--csv", metavar="FICHIER", help="écrit les résultats en CSV")
+    parser.add_argument("--baseline", metavar="FICHIER", default=None,
+                        help=f"résultats de référence à comparer (défaut : {BASELINE.name} s'il existe)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="remplace la référence par les résultats de cette exécution")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="ralentissement toléré avant de signaler une régression (0.25 = +25 %%)")
+    return parser
+
+
+def main(argv=None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    unknown = set(args.groups) - set(GROUPS)
+    if unknown:
+        parser.error(f"groupe inconnu : {', '.join(sorted(unknown))}")
+    unknown = set(args.engines) - set(available_engines())
+    if unknown:
+        parser.error(f"moteur inconnu : {', '.join(sorted(unknown))}")
+    if args.quick:
+        args.repeats = min(args.repeats, 3)
+    args.sizes = args.sizes or list(QUICK_SIZES if args.quick else DEFAULT_SIZES)
+    args.densities = args.densities or [parse_density(d) for d in DEFAULT_DENSITIES]
+    baseline = Path(args.baseline) if args.baseline else BASELINE
+    # Référence explicite absente : erreur immédiate, avant les mesures
+    if args.baseline and not args.update_baseline and not baseline.exists():
+        parser.error(f"référence introuvable : {baseline}")
+
+    results = run_suite(args)
+    meta = environment(args)
+    if args.json:
+        write_json(args.json, meta, results)
+    if args.csv:
+        write_csv(args.csv, results)
+
+    if args.update_baseline:
+        write_json(baseline, meta, results)
+        print(f"Référence enregistrée : {baseline}")
+        return 0
+    if not baseline.exists():
+        return 0
+
+    reference_meta, reference = load_results(baseline)
+    comparisons = compare(results, reference)
+    print()
+    print(f"Comparaison avec {baseline} ({reference_meta.get('date', '?')}, {reference_meta.get('platform', '?')})")
+    print(format_comparisons(comparisons, args.threshold))
+    regressions = [c for c in comparisons if c.regressed(args.threshold)]
+    if regressions:
+        print(f"{len(regressions)} régression(s) au-delà de +{args.threshold:.0%}.")
+        return 1
+    print(f"Aucune régression au-delà de +{args.threshold:.0%}.")
+    return 0
@@ -1,37 +1,300 @@
-import os
+import argparse
 import time
+from collections import Counter
+from contextlib import nullcontext
+from pathlib import Path
+
+import numpy as np
+
+from core.config import Config
+from core.engines import available_engines
+from core.ensemble import run_ensemble
+from core.engines.base import BOUNDARIES
 from core.game import GameOfLife
+from core.metrics import Metrics, profiling
+from core.rules import RuleError, parse_rule
+from gui.pattern_catalog import read_coords, read_pattern_rule
+from gui.pattern_manager import PatternManager
+from .terminal_renderer import MODES, TerminalRenderer
+
+
+def parse_size(text):
+    """'200x300' -> (200, 300) ; '200' -> (200, 200)."""
+    try:
+        parts = [int(p) for p in text.lower().split("x")]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Taille invalide : {text!r} (attendu LIGNESxCOLONNES)")
+    if len(parts) == 1:
+        parts *= 2
+    if len(parts) != 2 or min(parts) <= 0:
+        raise argparse.ArgumentTypeError(f"Taille invalide : {text!r} (attendu LIGNESxCOLONNES)")
+    return tuple(parts)
+
+
+def parse_rule_arg(text):
+    try:
+        return parse_rule(text)
+    except RuleError as exc:
+        raise argparse.ArgumentTypeError(str(exc))
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Jeu de la Vie en ligne de commande")
+    parser.add_argument("--headless", action="store_true",
+                        help="exécution en lot, sans affichage ni pause, avec mesure de débit")
+    parser.add_argument("--size", type=parse_size, default=None,
+                        help="taille de la grille, ex. 1000x1000 (défaut : Config.GRID_SIZE)")
+    parser.add_argument("--pattern", help="fichier de pattern à charger (JSON, RLE, .cells ou instantané .gol)")
+    parser.add_argument("--density", type=float, default=None,
+                        help="remplit la grille aléatoirement avec cette densité (0-1)")
+    parser.add_argument("--seed", type=int, default=None, help="graine du remplissage aléatoire")
+    parser.add_argument("--generations", type=int, default=100,
+                        help="nombre de générations en mode headless")
+    parser.add_argument("--engine", choices=available_engines(), default=Config.ENGINE,
+                        help="moteur de simulation (tiled : plan infini, --size donne la fenêtre affichée)")
+    parser.add_argument("--rule", type=parse_rule_arg, default=None,
+                        help="règle B/S, ex. B36/S23 ou HighLife (défaut : celle du pattern, sinon Config.RULE)")
+    parser.add_argument("--boundary", choices=BOUNDARIES, default=Config.BOUNDARY,
+                        help="bords : cellules mortes, tore (bords opposés reliés) ou miroir")
+    parser.add_argument("--output", help="dossier où écrire l’état final et les instantanés")
+    parser.add_argument("--output-interval", type=int, default=0,
+                        help="écrit un instantané toutes les N générations (0 : état final seulement)")
+    parser.add_argument("--snapshot-format", choices=("gol", "json"), default="gol",
+                        help="format des instantanés : binaire compacté (gol) ou coordonnées JSON")
+    parser.add_argument("--record", metavar="FICHIER",
+                        help="enregistre chaque génération dans un fichier .golr compressé (relisible dans la GUI)")
+    parser.add_argument("--on-cycle", choices=("stop", "skip", "continue"), default="stop",
+                        help="état périodique détecté : arrêter, sauter jusqu’à la dernière génération "
+                             "(headless), ou continuer")
+    parser.add_argument("--ensemble", type=int, metavar="N",
+                        help="simule N soupes aléatoires indépendantes (graines --seed, --seed + 1...) "
+                             "jusqu’à leur mort ou leur cycle, et affiche les statistiques")
+    parser.add_argument("--results", metavar="FICHIER",
+                        help="avec --ensemble : écrit le résultat de chaque grille en CSV")
+    parser.add_argument("--batch-size", type=int, default=Config.ENSEMBLE_BATCH_SIZE,
+                        help="avec --ensemble : grilles avancées ensemble par un processus")
+    parser.add_argument("--workers", type=int, default=Config.WORKERS,
+                        help="avec --ensemble : nombre de processus")
+    parser.add_argument("--metrics", metavar="FICHIER",
+                        help="mesure chaque génération (calcul, historique, population, rendu) "
+                             "et écrit les mesures en JSON")
+    parser.add_argument("--profile", metavar="FICHIER", nargs="?", const="",
+                        help="profile l’exécution avec cProfile : affiche les fonctions les plus coûteuses, "
+                             "ou écrit les statistiques dans FICHIER (.prof)")
+    parser.add_argument("--history", action="store_true",
+                        help="conserve l’historique en mode headless (désactivé par défaut)")
+    parser.add_argument("--delay", type=float, default=0.5,
+                        help="pause entre deux générations de l’animation (s)")
+    parser.add_argument("--render", choices=MODES, default="braille",
+                        help="affichage terminal : braille (2x4 cellules/caractère), half (1x2), ascii")
+    parser.add_argument("--full-redraw", action="store_true",
+                        help="réécrit toute l’image à chaque génération (sinon seulement les lignes modifiées)")
+    return parser
+
+
+def resolve_rule(args):
+    """Règle demandée, sinon celle enregistrée avec le pattern, sinon Config.RULE."""
+    if args.rule is not None:
+        return args.rule
+    if args.pattern:
+        # En-tête du fichier seul : pas de catalogue du dossier de l'utilisateur
+        rule = read_pattern_rule(args.pattern)
+        if rule:
+            return parse_rule(rule)
+    return parse_rule(Config.RULE)
+
+
+def create_metrics(args):
+    return Metrics(Config.METRICS_CAPACITY) if args.metrics else None
+
 
+def dump_metrics(game, args):
+    if game.metrics is not None:
+        game.metrics.dump(args.metrics)
+        print(f"Mesures écrites : {args.metrics}")
 
-def clear_console():
-    """Efface l’écran du terminal (compatible Windows / Linux / Mac)."""
-    os.system('cls' if os.name == 'nt' else 'clear')
 
+def seed_game(game, args):
+    """Place le pattern demandé, un remplissage aléatoire, ou les exemples par défaut."""
+    if args.density is not None:
+        rng = np.random.default_rng(args.seed)
+        game.grid = rng.random((game.rows, game.cols)) < args.density
+    elif args.pattern:
+        path = Path(args.pattern)
+        manager = PatternManager(path.resolve().parent)
+        if path.suffix.lower() == ".json":
+            # Lecture directe : load_into passerait par le catalogue du dossier
+            manager.apply_pattern(game, read_coords(path))
+        else:
+            manager.load_into(game, path.name)
+    else:
+        # Active certaines cellules en une seule édition groupée pour créer les patterns.
+        game.set_cells([
+            (4, 3), (4, 4), (4, 5),          # Exemple : un "oscillateur" (blinker)
+            (7, 3), (7, 4), (8, 3), (8, 4),  # Exemple : un petit carré stable (bloc)
+        ])
 
-def main():
-    # Crée une instance du jeu avec une grille 10x10
-    game = GameOfLife(20, 20)
 
-    # Exemple : un "oscillateur" (blinker)
-    game.set_cell(4, 3, 1) #Active manuellement certaines cellules pour créer un pattern.
-    game.set_cell(4, 4, 1)
-    game.set_cell(4, 5, 1)
+def write_snapshot(game, output_dir, generation, fmt="gol"):
+    """Écrit l’état courant en instantané binaire (.gol) ou en coordonnées JSON."""
+    manager = PatternManager(output_dir)
+    if fmt == "gol":
+        manager.save_snapshot(game, f"gen_{generation:08d}.gol")
+    else:
+        coords = np.argwhere(game.engine.to_array()).tolist()
+        manager.save_pattern(coords, f"gen_{generation:08d}.json", game.rule)
 
-    # Exemple : un petit carré stable (bloc)
-    game.set_cell(7, 3, 1)
-    game.set_cell(7, 4, 1)
-    game.set_cell(8, 3, 1)
-    game.set_cell(8, 4, 1)
+
+def run_headless(args):
+    """Simulation en lot : aucune sortie écran ni pause, puis rapport de performance."""
+    rows, cols = args.size or Config.GRID_SIZE
+    game = GameOfLife(rows, cols, engine=args.engine, history=args.history,
+                      detect_cycles=args.on_cycle != "continue", boundary=args.boundary,
+                      rule=resolve_rule(args), metrics=create_metrics(args))
+    seed_game(game, args)
+    if args.record:
+        game.start_recording(args.record)
+
+    generation = 0
+    computed = 0
+    io_time = 0.0
+    start = time.perf_counter()
+    try:
+        while generation < args.generations:
+            if not game.next_generation():
+                print(f"Mort totale à la génération {generation + 1}.")
+                break
+            generation += 1
+            computed += 1
+
+            if args.output and args.output_interval and generation % args.output_interval == 0:
+                io_start = time.perf_counter()
+                write_snapshot(game, args.output, generation, args.snapshot_format)
+                io_time += time.perf_counter() - io_start
+
+            if game.cycle is not None and args.on_cycle != "continue":
+                print(f"Cycle de période {game.cycle.period} depuis la génération {game.cycle.start}.")
+                if args.on_cycle == "skip":
+                    # L'état final ne dépend plus que de la phase dans le cycle
+                    remaining = args.generations - generation
+                    skipped = game.fast_forward(game.generation + remaining)
+                    computed += remaining - skipped
+                    generation = args.generations
+                    print(f"{skipped} générations sautées.")
+                break
+        elapsed = time.perf_counter() - start - io_time
+
+        if args.output:
+            write_snapshot(game, args.output, generation, args.snapshot_format)
+
+        rate = computed / elapsed if elapsed > 0 else float("inf")
+        print(f"Moteur           : {args.engine}")
+        print(f"Grille           : {rows}x{cols} ({game.rule}, bords {game.boundary})")
+        print(f"Générations      : {generation}" + (f" ({computed} calculées)" if computed != generation else ""))
+        print(f"Temps total      : {elapsed:.3f} s (+ {io_time:.3f} s d’écriture)")
+        print(f"Générations/s    : {rate:,.1f}")
+        print(f"Cellules/s       : {rate * rows * cols:,.0f}")
+        print(f"Population finale: {game.engine.population()}")
+        if game.unbounded and game.engine.bounding_box() is not None:
+            top, left, bottom, right = game.engine.bounding_box()
+            print(f"Zone vivante     : {bottom - top + 1}x{right - left + 1} depuis ({top}, {left})")
+        dump_metrics(game, args)
+    finally:
+        game.close()
+
+
+def run_ensemble_batch(args):
+    """Soupes aléatoires en lot : statistiques de durée de vie, population et période."""
+    rows, cols = args.size or Config.GRID_SIZE
+    density = 0.5 if args.density is None else args.density
+    seed = args.seed or 0
+    rule = resolve_rule(args)
+
+    statuses = Counter()
+    periods = Counter()
+    lifespans = []
+    computed = 0
+    start = time.perf_counter()
+    for result in run_ensemble(
+        args.ensemble, rows, cols, density=density, generations=args.generations, seed=seed,
+        batch_size=args.batch_size, workers=args.workers, rule=rule, boundary=args.boundary,
+        detect_cycles=args.on_cycle != "continue", output=args.results,
+    ):
+        statuses[result["status"]] += 1
+        computed += result["generations"]
+        if result["lifespan"] is not None:
+            lifespans.append(result["lifespan"])
+        if result["period"] is not None:
+            periods[result["period"]] += 1
+    elapsed = time.perf_counter() - start
+
+    print(f"Grilles          : {args.ensemble} x {rows}x{cols} ({rule}, bords {args.boundary}, densité {density})")
+    print(f"Mortes           : {statuses['dead']}")
+    print(f"Cycles           : {statuses['cycle']}")
+    print(f"Non terminées    : {statuses['running']} (après {args.generations} générations)")
+    if lifespans:
+        print(f"Durée de vie     : moyenne {np.mean(lifespans):.1f}, max {max(lifespans)}")
+    if periods:
+        print("Périodes         : " + ", ".join(f"{p} ×{n}" for p, n in sorted(periods.items())))
+    print(f"Temps total      : {elapsed:.3f} s")
+    print(f"Générations/s    : {computed / elapsed if elapsed > 0 else float('inf'):,.1f}")
+    if args.results:
+        print(f"Résultats écrits : {args.results}")
+
+
+def run_animation(args):
+    # Crée une instance du jeu (20x20 par défaut)
+    rows, cols = args.size or Config.GRID_SIZE
+    game = GameOfLife(rows, cols, engine=args.engine, history=False,
+                      detect_cycles=args.on_cycle != "continue", boundary=args.boundary,
+                      rule=resolve_rule(args), metrics=create_metrics(args))
+    seed_game(game, args)
+    if args.record:
+        game.start_recording(args.record)
+    renderer = TerminalRenderer(args.render, diff=not args.full_redraw)
 
     # Boucle principale du jeu
+    generation = 0
     try:
         while True:
-            clear_console() #Efface l’écran entre chaque génération pour l’effet “animation”.
-            game.display() #Affiche la grille actuelle (. pour morts, ■ pour vivants).
-            game.next_generation() #Calcule la génération suivante.
-            time.sleep(0.5)  # Attends 0,5 secondes pour rendre l’animation fluide.
+            # Une image par génération, écrite d’un bloc (curseur ANSI, pas d’effacement d’écran)
+            start = time.perf_counter()
+            renderer.render(
+                game.engine.to_array(),
+                f"Génération {generation} — population {game.engine.population()}",
+            )
+            if game.metrics is not None:
+                game.metrics.record_render((time.perf_counter() - start) * 1000)
+            if game.next_generation(): #Calcule la génération suivante.
+                generation += 1
+            if game.cycle is not None and args.on_cycle != "continue":
+                # État périodique : inutile de continuer à calculer
+                renderer.render(
+                    game.engine.to_array(),
+                    f"Génération {generation} — cycle de période {game.cycle.period} "
+                    f"depuis la génération {game.cycle.start}",
+                )
+                renderer.close()
+                break
+            if args.delay:
+                time.sleep(args.delay)  # Attends entre deux générations pour rendre l’animation fluide.
     except KeyboardInterrupt: #Permet d’arrêter avec Ctrl + C proprement.
-        print("\nSimulation arrêtée par l’utilisateur.")
+        renderer.close()
+        print("Simulation arrêtée par l’utilisateur.")
+    finally:
+        dump_metrics(game, args)
+        game.close()
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    with profiling(args.profile) if args.profile is not None else nullcontext():
+        if args.ensemble:
+            run_ensemble_batch(args)
+        elif args.headless:
+            run_headless(args)
+        else:
+            run_animation(args)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,95 @@
+import sys
+
+import numpy as np
+
+# Points braille : bit de chaque cellule d'un bloc de 4 lignes x 2 colonnes
+BRAILLE_BASE = 0x2800
+BRAILLE_BITS = {
+    (0, 0): 0x01, (1, 0): 0x02, (2, 0): 0x04, (3, 0): 0x40,
+    (0, 1): 0x08, (1, 1): 0x10, (2, 1): 0x20, (3, 1): 0x80,
+}
+
+# Demi-blocs : index = haut + 2 * bas
+HALF_BLOCKS = np.array([ord(" "), ord("▀"), ord("▄"), ord("█")], dtype=np.uint32)
+
+# Une cellule par caractère, comme GameOfLife.display()
+ASCII_CELLS = np.array([ord("."), ord("■")], dtype=np.uint32)
+
+MODES = ("braille", "half", "ascii")
+
+CURSOR_HOME = "\x1b[H"
+CLEAR_SCREEN = "\x1b[2J"
+CLEAR_LINE_END = "\x1b[K"
+CLEAR_BELOW = "\x1b[J"
+HIDE_CURSOR = "\x1b[?25l"
+SHOW_CURSOR = "\x1b[?25h"
+
+
+def _pad(grid, rows_multiple, cols_multiple):
+    rows, cols = grid.shape
+    return np.pad(grid, ((0, -rows % rows_multiple), (0, -cols % cols_multiple)))
+
+
+def _decode(codes: np.ndarray):
+    """Tableau 2D de points de code -> liste de lignes de texte (sans boucle par caractère)."""
+    codes = np.ascontiguousarray(codes, dtype="<u4")
+    return [row.tobytes().decode("utf-32-le") for row in codes]
+
+
+def frame_lines(grid, mode: str = "braille"):
+    """Convertit une grille (tableau 0/1) en lignes de texte.
+
+    braille : 2x4 cellules par caractère ; half : 1x2 ; ascii : 1x1.
+    """
+    grid = (np.asarray(grid) != 0).astype(np.uint32)
+    if mode == "braille":
+        grid = _pad(grid, 4, 2)
+        codes = np.full((grid.shape[0] // 4, grid.shape[1] // 2), BRAILLE_BASE, dtype=np.uint32)
+        for (dr, dc), bit in BRAILLE_BITS.items():
+            codes |= grid[dr::4, dc::2] * bit
+        return _decode(codes)
+    if mode == "half":
+        grid = _pad(grid, 2, 1)
+        return _decode(HALF_BLOCKS[grid[0::2] + 2 * grid[1::2]])
+    if mode == "ascii":
+        return _decode(ASCII_CELLS[grid])
+    raise ValueError(f"Mode d’affichage inconnu : {mode!r} (disponibles : {', '.join(MODES)})")
+
+
+class TerminalRenderer:
+    # Affichage terminal d'une image par génération : une seule écriture
+    # bufferisée, retour du curseur en haut (ANSI) au lieu d'effacer l'écran via
+    # un sous-processus, et, en mode diff, seules les lignes modifiées sont réécrites.
+
+    def __init__(self, mode: str = "braille", diff: bool = True, stream=None):
+        if mode not in MODES:
+            raise ValueError(f"Mode d’affichage inconnu : {mode!r} (disponibles : {', '.join(MODES)})")
+        self.mode = mode
+        self.diff = diff
+        self.stream = stream or sys.stdout
+        self._previous = None
+
+    def render(self, grid, header: str = ""):
+        lines = [header] + frame_lines(grid, self.mode)
+
+        if self._previous is None:
+            out = [HIDE_CURSOR, CLEAR_SCREEN, CURSOR_HOME, (CLEAR_LINE_END + "\n").join(lines)]
+        elif self.diff and len(lines) == len(self._previous):
+            out = [
+                f"\x1b[{i + 1};1H{line}{CLEAR_LINE_END}"
+                for i, (line, old) in enumerate(zip(lines, self._previous))
+                if line != old
+            ]
+        else:
+            out = [CURSOR_HOME, (CLEAR_LINE_END + "\n").join(lines), CLEAR_BELOW]
+
+        self._previous = lines
+        self.stream.write("".join(out))
+        self.stream.flush()
+
+    def close(self):
+        """Réaffiche le curseur et le place sous la dernière image."""
+        height = len(self._previous) if self._previous else 0
+        self.stream.write(f"\x1b[{height + 1};1H{SHOW_CURSOR}")
+        self.stream.flush()
+        self._previous = None
@@ -1,4 +1,5 @@
 import logging
+import os
 import sys
 
 class Config:
@@ -6,6 +7,33 @@ class Config:
     LOG_LEVEL = logging.INFO
     GRID_SIZE = (20, 20)
     DEFAULT_SPEED = 200
+    # Intervalle de rafraîchissement de l'affichage (ms), indépendant de la simulation
+    RENDER_INTERVAL = 16
+    # Moteur de simulation utilisé par la GUI et la CLI (voir core/engines)
+    ENGINE = "numpy"
+    # Moteur "tiled" (plan infini) : côté des tuiles allouées à la demande
+    TILE_SIZE = 64
+    # Mode de bord : "dead", "torus" ou "mirror" (voir core/engines/base.py)
+    BOUNDARY = "dead"
+    # Règle en notation B/S : "B3/S23" (Conway), "B36/S23" (HighLife)...
+    RULE = "B3/S23"
+    # Nombre de processus du moteur "parallel" et des exécutions en lot (core/ensemble.py)
+    WORKERS = os.cpu_count() or 1
+    # Exécutions en lot : grilles avancées ensemble par un même processus
+    ENSEMBLE_BATCH_SIZE = 64
+    # Historique : une image clé toutes les N générations, budget mémoire en octets
+    HISTORY_KEYFRAME_INTERVAL = 64
+    HISTORY_MAX_BYTES = 64 * 1024 * 1024
+    # Cache des patterns chargés : nombre maximal de cellules gardées en mémoire
+    PATTERN_CACHE_CELLS = 5_000_000
+    # Enregistrement sur disque (.golr) : une image clé par bloc de N générations
+    RECORDING_KEYFRAME_INTERVAL = 128
+    RECORDING_COMPRESSION = 6
+    # Détection des cycles : nombre d'empreintes gardées (période maximale détectée)
+    CYCLE_TABLE_SIZE = 1024
+    # Mesures par génération (core/metrics.py) : activées en mode debug ou si METRICS
+    METRICS = False
+    METRICS_CAPACITY = 4096
 
     @classmethod
     def set_debug(cls, debug):
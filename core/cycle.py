@@ -0,0 +1,72 @@
+import hashlib
+from collections import OrderedDict
+from typing import NamedTuple
+
+import numpy as np
+
+# Détection des états périodiques (vie stable, oscillateurs).
+#
+# Chaque génération est résumée par une empreinte 64 bits :
+#   - hachage de Zobrist : XOR des clés des cellules vivantes ; mis à jour en
+#     XORant seulement les clés des cellules modifiées, quand le diff est connu ;
+#   - sinon, BLAKE2 des bits compactés de la grille.
+# Une table bornée empreinte -> génération repère la première répétition.
+
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+_MIX1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX2 = np.uint64(0x94D049BB133111EB)
+
+
+def splitmix64(values) -> np.ndarray:
+    """Clés pseudo-aléatoires 64 bits, calculées à la volée (aucune table par cellule)."""
+    z = np.asarray(values).astype(np.uint64) + _GOLDEN
+    z = (z ^ (z >> np.uint64(30))) * _MIX1
+    z = (z ^ (z >> np.uint64(27))) * _MIX2
+    return z ^ (z >> np.uint64(31))
+
+
+def zobrist_hash(flat) -> int:
+    """XOR des clés des cellules `flat` (indices à plat)."""
+    return int(np.bitwise_xor.reduce(splitmix64(flat), initial=np.uint64(0)))
+
+
+def packed_hash(words) -> int:
+    """Empreinte 64 bits d'une grille compactée (voir Engine.to_packed)."""
+    digest = hashlib.blake2b(np.ascontiguousarray(words), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+class Cycle(NamedTuple):
+    start: int    # première génération de l'état qui se répète
+    period: int   # 1 : vie stable
+
+    def phase(self, generation: int) -> int:
+        """Génération équivalente à `generation` dans la première période du cycle."""
+        if generation < self.start:
+            return generation
+        return self.start + (generation - self.start) % self.period
+
+
+class CycleDetector:
+    # Table empreinte -> génération, limitée aux `max_entries` dernières
+    # générations : les périodes plus longues ne sont pas détectées.
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max(1, max_entries)
+        self._seen = OrderedDict()
+
+    def __len__(self):
+        return len(self._seen)
+
+    def reset(self):
+        self._seen.clear()
+
+    def observe(self, generation: int, key: int):
+        """Enregistre l'empreinte de `generation` ; renvoie le Cycle si elle a déjà été vue."""
+        seen = self._seen.get(key)
+        if seen is not None:
+            return Cycle(seen, generation - seen)
+        self._seen[key] = generation
+        if len(self._seen) > self.max_entries:
+            self._seen.popitem(last=False)
+        return None
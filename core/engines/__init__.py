@@ -0,0 +1,28 @@
+"""Moteurs de simulation interchangeables utilisés par GameOfLife."""
+import importlib
+
+# nom -> "module:Classe" (import paresseux : un moteur n'est chargé que s'il est utilisé)
+ENGINES = {
+    "python": "core.engines.python_engine:PythonEngine",
+    "numpy": "core.engines.numpy_engine:NumpyEngine",
+    "bitpacked": "core.engines.bitpacked:BitPackedEngine",
+    "sparse": "core.engines.sparse:SparseEngine",
+    "incremental": "core.engines.incremental:IncrementalEngine",
+    "parallel": "core.engines.parallel:ParallelEngine",
+    "tiled": "core.engines.tiled:TiledEngine",
+}
+
+
+def available_engines():
+    return list(ENGINES.keys())
+
+
+def create_engine(name: str, rows: int, cols: int, **options):
+    """Instancie le moteur `name` pour une grille rows x cols."""
+    if name not in ENGINES:
+        raise ValueError(
+            f"Moteur inconnu : {name!r} (disponibles : {', '.join(ENGINES)})"
+        )
+    module_name, class_name = ENGINES[name].split(":")
+    engine_class = getattr(importlib.import_module(module_name), class_name)
+    return engine_class(rows, cols, **options)
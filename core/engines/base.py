@@ -0,0 +1,112 @@
+import numpy as np
+
+from core.cycle import packed_hash
+from core.rules import CONWAY, parse_rule
+
+# Modes de bord : cellules mortes hors grille, tore (bords opposés reliés),
+# miroir (la cellule fantôme hors grille recopie la cellule du bord)
+BOUNDARIES = ("dead", "torus", "mirror")
+
+
+def halo_index(n: int, boundary: str) -> list:
+    """Indices sources des positions -1..n d'un axe de longueur n.
+
+    Les positions hors grille en mode "dead" renvoient n : l'appelant y place
+    une cellule toujours morte.
+    """
+    before, after = {"dead": (n, n), "torus": (n - 1, 0), "mirror": (0, n - 1)}[boundary]
+    return [before, *range(n), after]
+
+
+def fill_halo(padded: np.ndarray, boundary: str):
+    """Remplit le halo (bord de 1) d'un tampon (..., r + 2, c + 2) selon le mode de bord.
+
+    En mode "dead" le halo reste à zéro. Lignes puis colonnes : les coins
+    suivent automatiquement. Les dimensions de tête (lot de grilles) sont libres.
+    """
+    if boundary == "torus":
+        padded[..., 0, 1:-1] = padded[..., -2, 1:-1]
+        padded[..., -1, 1:-1] = padded[..., 1, 1:-1]
+        padded[..., :, 0] = padded[..., :, -2]
+        padded[..., :, -1] = padded[..., :, 1]
+    elif boundary == "mirror":
+        padded[..., 0, 1:-1] = padded[..., 1, 1:-1]
+        padded[..., -1, 1:-1] = padded[..., -2, 1:-1]
+        padded[..., :, 0] = padded[..., :, 1]
+        padded[..., :, -1] = padded[..., :, -2]
+
+
+class Engine:
+    # Interface commune des moteurs : stockage de la grille + calcul d'une génération.
+
+    name = "base"
+    unbounded = False  # True : plan infini, rows x cols n'est qu'une fenêtre (voir TiledEngine)
+
+    def __init__(self, rows: int, cols: int, boundary: str = "dead", rule=CONWAY):
+        if boundary not in BOUNDARIES:
+            raise ValueError(f"Mode de bord inconnu : {boundary!r} (disponibles : {', '.join(BOUNDARIES)})")
+        self.rows = rows
+        self.cols = cols
+        self.boundary = boundary
+        # Règle B/S compilée (table 2x9 et masques), voir core/rules.py
+        self.rule = parse_rule(rule)
+        # Cellules (N, 2) modifiées par le dernier step(), si le moteur les connaît
+        self.changed_cells = None
+
+    @property
+    def grid(self):
+        """Vue 2D indexable (grid[r][c]) de la grille courante."""
+        return self.to_array()
+
+    def contains(self, rows, cols):
+        """Vrai pour les cellules dans la grille (scalaires ou tableaux d'indices)."""
+        return (rows >= 0) & (rows < self.rows) & (cols >= 0) & (cols < self.cols)
+
+    def get_cell(self, row: int, col: int) -> int:
+        raise NotImplementedError
+
+    def set_cell(self, row: int, col: int, state: int):
+        raise NotImplementedError
+
+    def set_cells(self, rows: np.ndarray, cols: np.ndarray, state: int):
+        """Modifie un lot de cellules distinctes (indices déjà dans la grille)."""
+        for row, col in zip(rows.tolist(), cols.tolist()):
+            self.set_cell(row, col, state)
+
+    def count_neighbors(self, row: int, col: int) -> int:
+        raise NotImplementedError
+
+    def step(self) -> bool:
+        """Calcule la génération suivante.
+
+        Renvoie False, sans modifier la grille, si toutes les cellules meurent.
+        """
+        raise NotImplementedError
+
+    def to_array(self) -> np.ndarray:
+        """Grille sous forme de tableau uint8 (rows, cols)."""
+        raise NotImplementedError
+
+    def load_array(self, array):
+        """Remplace la grille par le contenu d'un tableau (rows, cols)."""
+        raise NotImplementedError
+
+    def to_packed(self) -> np.ndarray:
+        """Grille compactée en mots uint64 par ligne (format de BitPackedEngine)."""
+        from .bitpacked import pack_rows
+        return pack_rows(self.to_array())
+
+    def load_packed(self, words):
+        """Charge une grille compactée (mots uint64 par ligne, ex. tampon mmap)."""
+        from .bitpacked import unpack_rows
+        self.load_array(unpack_rows(words, self.cols))
+
+    def population(self) -> int:
+        return int(np.count_nonzero(self.to_array()))
+
+    def state_hash(self) -> int:
+        """Empreinte 64 bits de l'état complet (détection des cycles)."""
+        return packed_hash(self.to_packed())
+
+    def close(self):
+        """Libère les ressources du moteur (processus, mémoire partagée...)."""
@@ -0,0 +1,275 @@
+import numpy as np
+
+from core.rules import CONWAY
+from .base import Engine, halo_index
+
+WORD_BITS = 64
+ONE = np.uint64(1)
+HIGH_SHIFT = np.uint64(WORD_BITS - 1)
+
+# Nombre de lignes traitées à la fois : borne la taille des tableaux temporaires
+BLOCK_ROWS = 512
+
+
+def words_per_row(cols: int) -> int:
+    return max(1, -(-cols // WORD_BITS))
+
+
+def pack_rows(array: np.ndarray) -> np.ndarray:
+    """Grille (rows, cols) -> mots uint64 (rows, words_per_row(cols)), bit j du mot k = colonne 64k + j."""
+    array = np.asarray(array)
+    rows, cols = array.shape
+    as_bytes = np.zeros((rows, words_per_row(cols) * 8), dtype=np.uint8)
+    packed = np.packbits(array != 0, axis=1, bitorder="little")
+    as_bytes[:, :packed.shape[1]] = packed
+    return as_bytes.view("<u8")
+
+
+def unpack_rows(words: np.ndarray, cols: int, out: np.ndarray = None) -> np.ndarray:
+    """Inverse de pack_rows : mots (rows, n) -> grille uint8 (rows, cols), par blocs de lignes."""
+    words = np.asarray(words)
+    if out is None:
+        out = np.empty((words.shape[0], cols), dtype=np.uint8)
+    for start in range(0, words.shape[0], BLOCK_ROWS):
+        block = np.ascontiguousarray(words[start:start + BLOCK_ROWS], dtype="<u8").view(np.uint8)
+        out[start:start + BLOCK_ROWS] = np.unpackbits(block, axis=1, bitorder="little")[:, :cols]
+    return out
+
+
+def _west(x: np.ndarray) -> np.ndarray:
+    """Décale chaque ligne d'une colonne : la cellule c reçoit la valeur de c - 1."""
+    out = x << ONE
+    out[:, 1:] |= x[:, :-1] >> HIGH_SHIFT
+    return out
+
+
+def _east(x: np.ndarray) -> np.ndarray:
+    """Décale chaque ligne d'une colonne : la cellule c reçoit la valeur de c + 1."""
+    out = x >> ONE
+    out[:, :-1] |= x[:, 1:] << HIGH_SHIFT
+    return out
+
+
+def _full_add(a, b, c):
+    """Additionneur complet bit à bit : renvoie (somme, retenue)."""
+    partial = a ^ b
+    return partial ^ c, (a & b) | (partial & c)
+
+
+def edge_shifts(cols: int, boundary: str):
+    """Décalages (ouest, est) pour un mode de bord : seuls les bits de bord sont corrigés."""
+    if boundary == "dead":
+        return _west, _east
+
+    last = (cols - 1) // WORD_BITS
+    bit = np.uint64((cols - 1) % WORD_BITS)
+    if boundary == "torus":
+        def west(x):
+            out = _west(x)
+            out[:, 0] |= (x[:, last] >> bit) & ONE
+            return out
+
+        def east(x):
+            out = _east(x)
+            out[:, last] |= (x[:, 0] & ONE) << bit
+            return out
+    else:
+        def west(x):
+            out = _west(x)
+            out[:, 0] |= x[:, 0] & ONE
+            return out
+
+        def east(x):
+            out = _east(x)
+            out[:, last] |= x[:, last] & (ONE << bit)
+            return out
+    return west, east
+
+
+def count_planes(up, mid, down, west=_west, east=_east):
+    """Compte les 8 voisins de `mid` sous forme de plans de bits (1, 2, 4, 8)."""
+    ones_a, twos_a = _full_add(west(up), up, east(up))
+    ones_b, twos_b = _full_add(west(mid), east(mid), west(down))
+    down_east = east(down)
+    ones_c, twos_c = down ^ down_east, down & down_east
+
+    ones, twos_d = _full_add(ones_a, ones_b, ones_c)
+    twos_partial, fours_a = _full_add(twos_a, twos_b, twos_c)
+    twos = twos_partial ^ twos_d
+    fours_b = twos_partial & twos_d
+    return ones, twos, fours_a ^ fours_b, fours_a & fours_b
+
+
+def _count_terms(counts):
+    """Nombres de voisins -> termes : bits requis des plans (1, 2, 4, 8), None = indifférent.
+
+    2k et 2k + 1 ne diffèrent que par le plan 1 : ils forment un seul terme.
+    Seul 8 lève le plan 8 (les autres plans sont alors nuls) : le plan 8 n'est
+    testé que pour 8 lui-même et pour 0 / 1.
+    """
+    terms = []
+    for n in sorted(counts):
+        if n == 8:
+            terms.append((None, None, None, 1))
+            continue
+        if n % 2 and n - 1 in counts:
+            continue  # fusionné avec n - 1
+        ones = None if n + 1 in counts and n % 2 == 0 else n & 1
+        eights = 0 if n < 2 and ones != 1 else None
+        terms.append((ones, (n >> 1) & 1, (n >> 2) & 1, eights))
+    return terms
+
+
+def compile_rule(rule):
+    """Formule bit à bit d'une règle B/S : f(ones, twos, fours, eights, mid) -> nouveaux mots.
+
+    Chaque nombre de voisins devient un produit de plans (ou de leur complément),
+    calculé une fois par génération et partagé entre naissance et survie.
+    """
+    if rule == CONWAY:
+        # Conway : exactement 3 voisins, ou 2 voisins et vivante
+        return lambda ones, twos, fours, eights, mid: twos & ~fours & ~eights & (ones | mid)
+
+    birth_terms = _count_terms(rule.birth)
+    survive_terms = _count_terms(rule.survive)
+
+    def apply(ones, twos, fours, eights, mid):
+        planes = (ones, twos, fours, eights)
+        inverse = {}
+        cache = {}
+
+        def term(bits):
+            if bits not in cache:
+                result = None
+                for index, bit in enumerate(bits):
+                    if bit is None:
+                        continue
+                    if not bit and index not in inverse:
+                        inverse[index] = ~planes[index]
+                    operand = planes[index] if bit else inverse[index]
+                    result = operand if result is None else result & operand
+                cache[bits] = result
+            return cache[bits]
+
+        def union(terms):
+            result = None
+            for bits in terms:
+                result = term(bits) if result is None else result | term(bits)
+            return result
+
+        born = union(birth_terms)
+        kept = union(survive_terms)
+        new = np.zeros_like(mid)
+        if born is not None:
+            new |= born & ~mid
+        if kept is not None:
+            new |= kept & mid
+        return new
+
+    return apply
+
+
+class BitPackedEngine(Engine):
+    # Moteur SWAR : chaque ligne est compactée en mots uint64 (64 cellules par mot,
+    # bit j du mot k = colonne 64k + j). Les voisins sont comptés par des
+    # additionneurs complets appliqués à des mots entiers. Bords : lignes de
+    # halo recopiées, et bits des colonnes de bord corrigés après décalage.
+
+    name = "bitpacked"
+
+    def __init__(self, rows: int, cols: int, boundary: str = "dead", rule=CONWAY):
+        super().__init__(rows, cols, boundary, rule)
+        self.row_words = words_per_row(cols)
+        # Une ligne de halo au-dessus et en dessous de la grille
+        self._buffers = [np.zeros((rows + 2, self.row_words), dtype=np.uint64) for _ in range(2)]
+        self._front = 0
+        self._west, self._east = edge_shifts(cols, boundary)
+        self._halo_rows = halo_index(rows, boundary)
+        self._halo_cols = halo_index(cols, boundary)
+        self._apply_rule = compile_rule(self.rule)
+
+        # Masque des bits valides du dernier mot de chaque ligne
+        tail = cols % WORD_BITS
+        self._tail_mask = np.uint64((1 << tail) - 1) if tail else ~np.uint64(0)
+
+    @property
+    def words(self) -> np.ndarray:
+        """Mots de la grille courante, forme (rows, row_words), sans copie."""
+        return self._buffers[self._front][1:-1]
+
+    def get_cell(self, row: int, col: int) -> int:
+        word = int(self.words[row, col // WORD_BITS])
+        return (word >> (col % WORD_BITS)) & 1
+
+    def set_cell(self, row: int, col: int, state: int):
+        index = col // WORD_BITS
+        word = int(self.words[row, index])
+        bit = 1 << (col % WORD_BITS)
+        word = word | bit if state else word & ~bit
+        self.words[row, index] = np.uint64(word)
+
+    def set_cells(self, rows: np.ndarray, cols: np.ndarray, state: int):
+        indices = (rows, cols // WORD_BITS)
+        bits = np.left_shift(ONE, (cols % WORD_BITS).astype(np.uint64))
+        words = self.words
+        if state:
+            np.bitwise_or.at(words, indices, bits)
+        else:
+            np.bitwise_and.at(words, indices, ~bits)
+
+    def count_neighbors(self, row: int, col: int) -> int:
+        count = -self.get_cell(row, col)
+        for r in self._halo_rows[row:row + 3]:
+            for c in self._halo_cols[col:col + 3]:
+                if r < self.rows and c < self.cols:
+                    count += self.get_cell(r, c)
+        return count
+
+    def _fill_halo(self, front):
+        if self.boundary == "torus":
+            front[0] = front[-2]
+            front[-1] = front[1]
+        elif self.boundary == "mirror":
+            front[0] = front[1]
+            front[-1] = front[-2]
+
+    def step(self) -> bool:
+        front = self._buffers[self._front]
+        back = self._buffers[1 - self._front]
+        alive_found = False
+        self._fill_halo(front)
+
+        for start in range(1, self.rows + 1, BLOCK_ROWS):
+            stop = min(start + BLOCK_ROWS, self.rows + 1)
+            mid = front[start:stop]
+            ones, twos, fours, eights = count_planes(
+                front[start - 1:stop - 1], mid, front[start + 1:stop + 1], self._west, self._east
+            )
+            new = self._apply_rule(ones, twos, fours, eights, mid)
+            new[:, -1] &= self._tail_mask
+            back[start:stop] = new
+            alive_found = alive_found or bool(new.any())
+
+        if not alive_found:
+            return False
+
+        self._front = 1 - self._front
+        return True
+
+    def to_array(self) -> np.ndarray:
+        return unpack_rows(self.words, self.cols)
+
+    def load_array(self, array):
+        self.words[...] = pack_rows(np.asarray(array).reshape(self.rows, self.cols))
+
+    def to_packed(self) -> np.ndarray:
+        return self.words
+
+    def load_packed(self, words):
+        self.words[...] = words
+        self.words[:, -1] &= self._tail_mask
+
+    def population(self) -> int:
+        if hasattr(np, "bitwise_count"):
+            return int(np.bitwise_count(self.words).sum(dtype=np.int64))
+        return int(np.count_nonzero(self.to_array()))
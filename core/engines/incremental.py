@@ -0,0 +1,127 @@
+import numpy as np
+
+from core.rules import CONWAY
+from .base import Engine, fill_halo
+from .bitpacked import unpack_rows
+from .numpy_engine import apply_rule, count_neighbors_at, count_neighbors_padded
+
+
+def dilate(mask: np.ndarray, wrap: bool = False) -> np.ndarray:
+    """Étend un masque booléen 2D à ses 8 voisins (en reliant les bords opposés si `wrap`)."""
+    padded = np.pad(mask, 1, mode="wrap" if wrap else "constant")
+    out = np.zeros_like(mask)
+    rows, cols = mask.shape
+    for dr in range(3):
+        for dc in range(3):
+            out |= padded[dr:dr + rows, dc:dc + cols]
+    return out
+
+
+class IncrementalEngine(Engine):
+    # Moteur incrémental : la grille est découpée en tuiles de tile_size x tile_size.
+    # Seules les tuiles modifiées à la génération précédente (et leurs voisines)
+    # sont recalculées ; les tuiles stables (natures mortes) sont ignorées.
+    # Les cellules modifiées par la dernière génération sont exposées dans
+    # `changed_cells` pour que l'appelant puisse consommer le diff.
+
+    name = "incremental"
+
+    def __init__(self, rows: int, cols: int, tile_size: int = 32, boundary: str = "dead", rule=CONWAY):
+        super().__init__(rows, cols, boundary, rule)
+        self.tile_size = tile_size
+        self._padded = np.zeros((rows + 2, cols + 2), dtype=np.uint8)
+        self._population = 0
+
+        tiles_shape = (-(-rows // tile_size), -(-cols // tile_size))
+        # Au départ toutes les tuiles sont à calculer
+        self._dirty = np.ones(tiles_shape, dtype=bool)
+
+        self.changed_cells = np.empty((0, 2), dtype=np.int64)
+        self.computed_tiles = 0  # nombre de tuiles recalculées à la dernière génération
+
+    @property
+    def cells(self) -> np.ndarray:
+        return self._padded[1:-1, 1:-1]
+
+    @property
+    def grid(self):
+        return self.cells
+
+    def _mark_dirty(self, row: int, col: int):
+        self._dirty[row // self.tile_size, col // self.tile_size] = True
+
+    def get_cell(self, row: int, col: int) -> int:
+        return int(self.cells[row, col])
+
+    def set_cell(self, row: int, col: int, state: int):
+        new = 1 if state else 0
+        old = int(self.cells[row, col])
+        if new != old:
+            self.cells[row, col] = new
+            self._population += new - old
+            self._mark_dirty(row, col)
+
+    def set_cells(self, rows: np.ndarray, cols: np.ndarray, state: int):
+        before = int(np.count_nonzero(self.cells[rows, cols]))
+        self.cells[rows, cols] = 1 if state else 0
+        after = int(np.count_nonzero(self.cells[rows, cols]))
+        self._population += after - before
+        self._dirty[rows // self.tile_size, cols // self.tile_size] = True
+
+    def count_neighbors(self, row: int, col: int) -> int:
+        return count_neighbors_at(self._padded, row, col, self.boundary)
+
+    def step(self) -> bool:
+        size = self.tile_size
+        padded = self._padded
+        updates = []
+        changed_tiles = np.zeros_like(self._dirty)
+        population = self._population
+
+        # Tore : une tuile de bord influence aussi la tuile du bord opposé
+        fill_halo(padded, self.boundary)
+        active = np.argwhere(dilate(self._dirty, wrap=self.boundary == "torus"))
+        for tr, tc in active.tolist():
+            r0, c0 = tr * size, tc * size
+            r1, c1 = min(r0 + size, self.rows), min(c0 + size, self.cols)
+            window = padded[r0:r1 + 2, c0:c1 + 2]
+            counts = count_neighbors_padded(window, np.empty((r1 - r0, c1 - c0), dtype=np.uint8))
+            old = window[1:-1, 1:-1]
+            new = apply_rule(old, counts, np.empty(old.shape, dtype=bool), self.rule)
+            diff = new != old
+            if diff.any():
+                changed_tiles[tr, tc] = True
+                population += int(np.count_nonzero(new)) - int(np.count_nonzero(old))
+                updates.append((r0, c0, new, diff))
+
+        self.computed_tiles = len(active)
+        if population == 0:
+            return False
+
+        # Les écritures sont différées : tous les calculs lisent l'ancienne génération
+        changed = []
+        for r0, c0, new, diff in updates:
+            self.cells[r0:r0 + new.shape[0], c0:c0 + new.shape[1]] = new
+            changed.append(np.argwhere(diff) + (r0, c0))
+
+        self._population = population
+        self._dirty = changed_tiles
+        self.changed_cells = np.concatenate(changed) if changed else np.empty((0, 2), dtype=np.int64)
+        return True
+
+    def to_array(self) -> np.ndarray:
+        return self.cells
+
+    def load_array(self, array):
+        array = np.asarray(array).reshape(self.rows, self.cols)
+        self.cells[...] = array != 0
+        self._population = int(np.count_nonzero(self.cells))
+        self._dirty[...] = True
+
+    def load_packed(self, words):
+        unpack_rows(words, self.cols, out=self.cells)
+        self._population = int(np.count_nonzero(self.cells))
+        self._dirty[...] = True
+
+    def population(self) -> int:
+        return self._population
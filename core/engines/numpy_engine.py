@@ -0,0 +1,117 @@
+import numpy as np
+
+from core.rules import CONWAY
+from .base import Engine, fill_halo
+from .bitpacked import unpack_rows
+
+
+def count_neighbors_padded(padded: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """Somme des 8 voisins de chaque cellule intérieure d'une grille à bord (halo) de 1.
+
+    `padded` a la forme (..., r + 2, c + 2), `out` la forme (..., r, c) : les
+    dimensions de tête permettent de traiter un lot de grilles d'un bloc.
+    """
+    np.add(padded[..., :-2, :-2], padded[..., :-2, 1:-1], out=out)
+    out += padded[..., :-2, 2:]
+    out += padded[..., 1:-1, :-2]
+    out += padded[..., 1:-1, 2:]
+    out += padded[..., 2:, :-2]
+    out += padded[..., 2:, 1:-1]
+    out += padded[..., 2:, 2:]
+    return out
+
+
+def count_neighbors_at(padded: np.ndarray, row: int, col: int, boundary: str) -> int:
+    """Voisins de la cellule (row, col) d'un tampon à halo de 1.
+
+    Seul le halo touche une cellule de bord : il n'est rafraîchi que pour
+    elles (et jamais en mode "dead", où il reste à zéro).
+    """
+    if boundary != "dead" and (row in (0, padded.shape[0] - 3) or col in (0, padded.shape[1] - 3)):
+        fill_halo(padded, boundary)
+    window = padded[row:row + 3, col:col + 3]
+    return int(window.sum(dtype=np.int64)) - int(padded[row + 1, col + 1])
+
+
+def apply_rule(cells: np.ndarray, counts: np.ndarray, out: np.ndarray, rule=CONWAY,
+               scratch: np.ndarray = None) -> np.ndarray:
+    """Applique une règle B/S : bit `counts` du masque de naissance ou de survie.
+
+    Coût constant quelle que soit la règle (4 passes). `cells` vaut 0 ou 1 ;
+    `scratch` : tampon uint16 de la forme de `cells`, réutilisé d'un appel à l'autre.
+    """
+    masks = scratch if scratch is not None else np.empty(cells.shape, dtype=np.uint16)
+    np.multiply(cells, rule.birth_mask ^ rule.survive_mask, out=masks)
+    masks ^= rule.birth_mask
+    masks >>= counts
+    np.bitwise_and(masks, 1, out=out, casting="unsafe")
+    return out
+
+
+class NumpyEngine(Engine):
+    # Moteur vectorisé : grille uint8 entourée d'un halo (mort, ou recopié
+    # selon le mode de bord avant chaque génération), voisins comptés par
+    # sommes de tableaux décalés. Double tampon pour éviter toute allocation
+    # de grille à chaque génération.
+
+    name = "numpy"
+
+    def __init__(self, rows: int, cols: int, boundary: str = "dead", rule=CONWAY):
+        super().__init__(rows, cols, boundary, rule)
+        self._buffers = self._allocate_buffers((rows + 2, cols + 2))
+        self._front = 0
+        self._counts = np.zeros((rows, cols), dtype=np.uint8)
+        self._masks = np.zeros((rows, cols), dtype=np.uint16)
+
+    def _allocate_buffers(self, shape):
+        """Les deux tampons (grille + halo), remis à zéro ; voir ParallelEngine."""
+        return [np.zeros(shape, dtype=np.uint8) for _ in range(2)]
+
+    @property
+    def cells(self) -> np.ndarray:
+        """Vue (sans copie) de l'intérieur du tampon courant."""
+        return self._buffers[self._front][1:-1, 1:-1]
+
+    @property
+    def grid(self):
+        return self.cells
+
+    def get_cell(self, row: int, col: int) -> int:
+        return int(self.cells[row, col])
+
+    def set_cell(self, row: int, col: int, state: int):
+        self.cells[row, col] = 1 if state else 0
+
+    def set_cells(self, rows: np.ndarray, cols: np.ndarray, state: int):
+        self.cells[rows, cols] = 1 if state else 0
+
+    def count_neighbors(self, row: int, col: int) -> int:
+        return count_neighbors_at(self._buffers[self._front], row, col, self.boundary)
+
+    def step(self) -> bool:
+        front = self._buffers[self._front]
+        back = self._buffers[1 - self._front]
+        fill_halo(front, self.boundary)
+        counts = count_neighbors_padded(front, self._counts)
+        new_cells = back[1:-1, 1:-1]
+        apply_rule(front[1:-1, 1:-1], counts, new_cells, self.rule, self._masks)
+
+        if not new_cells.any():
+            return False
+
+        self._front = 1 - self._front
+        return True
+
+    def to_array(self) -> np.ndarray:
+        return self.cells
+
+    def load_array(self, array):
+        array = np.asarray(array).reshape(self.rows, self.cols)
+        self.cells[...] = array != 0
+
+    def load_packed(self, words):
+        # Décompression directe dans le tampon de la grille, sans tableau intermédiaire complet
+        unpack_rows(words, self.cols, out=self.cells)
+
+    def population(self) -> int:
+        return int(np.count_nonzero(self.cells))
@@ -0,0 +1,102 @@
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from core.config import Config
+from core.rules import CONWAY
+from .base import fill_halo
+from .numpy_engine import NumpyEngine, apply_rule, count_neighbors_padded
+
+# Tampons partagés vus depuis un processus travailleur (initialisés par _attach)
+_worker_buffers = []
+_worker_segments = []
+
+
+def _open_segment(name: str) -> shared_memory.SharedMemory:
+    try:
+        # Python >= 3.13 : ne pas laisser le resource_tracker du travailleur libérer le segment
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+def _attach(names, shape):
+    """Initialisation d'un travailleur : ouverture des deux tampons partagés."""
+    for name in names:
+        segment = _open_segment(name)
+        _worker_segments.append(segment)
+        _worker_buffers.append(np.ndarray(shape, dtype=np.uint8, buffer=segment.buf))
+
+
+def _step_band(front: int, start: int, stop: int, rule=CONWAY) -> int:
+    """Calcule les lignes [start, stop) dans le tampon arrière ; renvoie leur population.
+
+    Les lignes de halo de la bande (start - 1 et stop) sont lues directement dans
+    le tampon partagé : l'échange de halo entre bandes ne copie rien.
+    """
+    src = _worker_buffers[front]
+    dst = _worker_buffers[1 - front]
+    window = src[start:stop + 2]
+    counts = count_neighbors_padded(window, np.empty((stop - start, src.shape[1] - 2), dtype=np.uint8))
+    new = dst[start + 1:stop + 1, 1:-1]
+    apply_rule(window[1:-1, 1:-1], counts, new, rule)
+    return int(np.count_nonzero(new))
+
+
+def _release(executor, segments):
+    executor.shutdown(wait=True, cancel_futures=True)
+    for segment in segments:
+        segment.close()
+        segment.unlink()
+
+
+class ParallelEngine(NumpyEngine):
+    # Moteur multi-cœurs : la grille (avec halo) vit dans deux tampons
+    # multiprocessing.shared_memory ; chaque génération est découpée en bandes
+    # de lignes calculées par un pool de processus. Seuls des indices transitent
+    # entre processus, jamais la grille. Accès aux cellules hérités de
+    # NumpyEngine, même noyau : résultats identiques bit à bit.
+
+    name = "parallel"
+
+    def __init__(self, rows: int, cols: int, workers: int = None, boundary: str = "dead", rule=CONWAY):
+        super().__init__(rows, cols, boundary, rule)
+        self.workers = max(1, workers or Config.WORKERS)
+
+        band = -(-rows // self.workers) if rows else 1
+        self._bands = [(start, min(start + band, rows)) for start in range(0, rows, band)]
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_attach,
+            initargs=([s.name for s in self._segments], self._buffers[0].shape),
+        )
+        self._finalizer = weakref.finalize(self, _release, self._executor, self._segments)
+
+    def _allocate_buffers(self, shape):
+        size = max(1, shape[0] * shape[1])
+        self._segments = [shared_memory.SharedMemory(create=True, size=size) for _ in range(2)]
+        buffers = [np.ndarray(shape, dtype=np.uint8, buffer=s.buf) for s in self._segments]
+        for buffer in buffers:
+            buffer.fill(0)
+        return buffers
+
+    def step(self) -> bool:
+        # Halo rempli une fois par le processus principal, lu par toutes les bandes
+        fill_halo(self._buffers[self._front], self.boundary)
+        futures = [
+            self._executor.submit(_step_band, self._front, start, stop, self.rule)
+            for start, stop in self._bands
+        ]
+        population = sum(future.result() for future in futures)
+
+        if population == 0:
+            return False
+
+        self._front = 1 - self._front
+        return True
+
+    def close(self):
+        self._finalizer()
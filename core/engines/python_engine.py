@@ -0,0 +1,84 @@
+import numpy as np
+
+from core.rules import CONWAY
+from .base import Engine, halo_index
+
+
+class PythonEngine(Engine):
+    # Moteur de référence en Python pur (liste de listes), cellule par cellule.
+    # Les voisins de chaque ligne et colonne sont précalculés selon le mode de
+    # bord : la boucle ne fait aucun test de limites.
+
+    name = "python"
+
+    def __init__(self, rows: int, cols: int, boundary: str = "dead", rule=CONWAY):
+        super().__init__(rows, cols, boundary, rule)
+        self._grid = [[0 for _ in range(cols)] for _ in range(rows)]
+
+        # (précédente, courante, suivante) ; l'indice rows / cols désigne une cellule morte
+        row_index = halo_index(rows, boundary)
+        col_index = halo_index(cols, boundary)
+        self._row_windows = [tuple(row_index[r:r + 3]) for r in range(rows)]
+        self._col_windows = [tuple(col_index[c:c + 3]) for c in range(cols)]
+
+    def _extended(self):
+        """Grille avec une ligne et une colonne mortes supplémentaires (cible du mode "dead")."""
+        extended = [row + [0] for row in self._grid]
+        extended.append([0] * (self.cols + 1))
+        return extended
+
+    @property
+    def grid(self):
+        return self._grid
+
+    def get_cell(self, row: int, col: int) -> int:
+        return self._grid[row][col]
+
+    def set_cell(self, row: int, col: int, state: int):
+        self._grid[row][col] = 1 if state else 0
+
+    def set_cells(self, rows: np.ndarray, cols: np.ndarray, state: int):
+        value = 1 if state else 0
+        grid = self._grid
+        for row, col in zip(rows.tolist(), cols.tolist()):
+            grid[row][col] = value
+
+    def count_neighbors(self, row: int, col: int) -> int:
+        # Lecture directe de la grille, sans copie : les indices sentinelles sont morts
+        grid = self._grid
+        window_cols = [c for c in self._col_windows[col] if c < self.cols]
+        total = sum(grid[r][c] for r in self._row_windows[row] if r < self.rows for c in window_cols)
+        return total - grid[row][col]
+
+    def _count(self, extended, row: int, col: int) -> int:
+        window_cols = self._col_windows[col]
+        total = sum(extended[r][c] for r in self._row_windows[row] for c in window_cols)
+        return total - self._grid[row][col]
+
+    def step(self) -> bool:
+        new_grid = [[0 for _ in range(self.cols)] for _ in range(self.rows)]
+        alive_found = False
+        extended = self._extended()
+        table = self.rule.table.tolist()  # table[état][voisins]
+
+        for r in range(self.rows):
+            for c in range(self.cols):
+                neighbors = self._count(extended, r, c)
+                new_state = table[self._grid[r][c]][neighbors]
+
+                new_grid[r][c] = new_state
+                if new_state == 1:
+                    alive_found = True
+
+        if not alive_found:
+            return False
+
+        self._grid = new_grid
+        return True
+
+    def to_array(self) -> np.ndarray:
+        return np.array(self._grid, dtype=np.uint8).reshape(self.rows, self.cols)
+
+    def load_array(self, array):
+        array = np.asarray(array, dtype=np.uint8).reshape(self.rows, self.cols)
+        self._grid = (array != 0).astype(np.uint8).tolist()
@@ -0,0 +1,91 @@
+from collections import Counter
+
+import numpy as np
+
+from core.rules import CONWAY
+from .base import Engine, halo_index
+
+NEIGHBOR_OFFSETS = (
+    (-1, -1), (-1, 0), (-1, 1),
+    (0, -1),           (0, 1),
+    (1, -1),  (1, 0),  (1, 1),
+)
+
+
+class SparseEngine(Engine):
+    # Moteur creux : seules les cellules vivantes sont stockées (ensemble de
+    # coordonnées). Une génération ne visite que les cellules vivantes et leurs
+    # voisines : le coût suit la population, pas la surface de la grille.
+
+    name = "sparse"
+
+    def __init__(self, rows: int, cols: int, boundary: str = "dead", rule=CONWAY):
+        super().__init__(rows, cols, boundary, rule)
+        if self.rule.births_from_nothing:
+            # Les cellules sans voisin vivant ne sont jamais visitées
+            raise ValueError(f"Règle {self.rule} (B0) incompatible avec le moteur creux")
+        self.live = set()
+        # Voisin r + dr -> ligne réelle (rows / cols : hors grille, cellule morte)
+        self._row_map = halo_index(rows, boundary)
+        self._col_map = halo_index(cols, boundary)
+        self.changed_cells = np.empty((0, 2), dtype=np.int64)  # diff publié à chaque step
+
+    def get_cell(self, row: int, col: int) -> int:
+        return 1 if (row, col) in self.live else 0
+
+    def set_cell(self, row: int, col: int, state: int):
+        if state:
+            self.live.add((row, col))
+        else:
+            self.live.discard((row, col))
+
+    def set_cells(self, rows: np.ndarray, cols: np.ndarray, state: int):
+        cells = zip(rows.tolist(), cols.tolist())
+        if state:
+            self.live.update(cells)
+        else:
+            self.live.difference_update(cells)
+
+    def count_neighbors(self, row: int, col: int) -> int:
+        row_map, col_map = self._row_map, self._col_map
+        return sum((row_map[row + dr + 1], col_map[col + dc + 1]) in self.live for dr, dc in NEIGHBOR_OFFSETS)
+
+    def step(self) -> bool:
+        live = self.live
+        row_map, col_map = self._row_map, self._col_map
+        counts = Counter(
+            (row_map[r + dr + 1], col_map[c + dc + 1]) for r, c in live for dr, dc in NEIGHBOR_OFFSETS
+        )
+        rows, cols = self.rows, self.cols
+        birth, survive = self.rule.birth, self.rule.survive
+        new_live = {
+            cell for cell, n in counts.items()
+            if (n in survive if cell in live else n in birth)
+            and cell[0] < rows and cell[1] < cols
+        }
+        if 0 in survive:
+            # Cellules isolées : absentes du comptage, elles survivent avec S0
+            new_live.update(cell for cell in live if cell not in counts)
+
+        if not new_live:
+            return False
+
+        changed = new_live ^ live
+        self.changed_cells = np.array(list(changed), dtype=np.int64).reshape(-1, 2)
+        self.live = new_live
+        return True
+
+    def to_array(self) -> np.ndarray:
+        array = np.zeros((self.rows, self.cols), dtype=np.uint8)
+        if self.live:
+            rows, cols = zip(*self.live)
+            array[list(rows), list(cols)] = 1
+        return array
+
+    def load_array(self, array):
+        array = np.asarray(array).reshape(self.rows, self.cols)
+        rows, cols = np.nonzero(array)
+        self.live = set(zip(rows.tolist(), cols.tolist()))
+
+    def population(self) -> int:
+        return len(self.live)
@@ -0,0 +1,189 @@
+import hashlib
+
+import numpy as np
+
+from core.config import Config
+from core.rules import CONWAY
+from .base import Engine
+from .numpy_engine import apply_rule, count_neighbors_padded
+from .sparse import NEIGHBOR_OFFSETS
+
+# Construction du tampon (tile + 2) d'une tuile : (décalage de la tuile source,
+# zone du tampon, zone recopiée de la source). La tuile elle-même, puis le halo
+# recopié des 8 voisines : bords opposés et coins opposés.
+_ALL = slice(None)
+_INNER = slice(1, -1)
+HALO = (
+    ((0, 0), (_INNER, _INNER), (_ALL, _ALL)),
+    ((-1, 0), (0, _INNER), (-1, _ALL)),
+    ((1, 0), (-1, _INNER), (0, _ALL)),
+    ((0, -1), (_INNER, 0), (_ALL, -1)),
+    ((0, 1), (_INNER, -1), (_ALL, 0)),
+    ((-1, -1), (0, 0), (-1, -1)),
+    ((-1, 1), (0, -1), (-1, 0)),
+    ((1, -1), (-1, 0), (0, -1)),
+    ((1, 1), (-1, -1), (0, 0)),
+)
+
+
+class TiledEngine(Engine):
+    # Plan infini : les cellules vivent dans des tuiles carrées (Config.TILE_SIZE)
+    # allouées à la demande et libérées dès qu'elles sont vides. Les coordonnées
+    # sont quelconques (négatives comprises) ; rows x cols n'est que la fenêtre
+    # rendue par to_array(), à partir de `origin`. Une génération ne calcule que
+    # les tuiles vivantes et leurs voisines touchées par une cellule de bord,
+    # empilées en un seul lot pour le noyau du moteur numpy.
+
+    name = "tiled"
+    unbounded = True
+
+    def __init__(self, rows: int, cols: int, boundary: str = "dead", rule=CONWAY, tile: int = None):
+        super().__init__(rows, cols, boundary, rule)
+        if boundary != "dead":
+            raise ValueError(f"Plan infini : mode de bord {boundary!r} sans objet")
+        if self.rule.births_from_nothing:
+            # B0 remplirait tout le plan dès la première génération
+            raise ValueError(f"Règle {self.rule} (B0) incompatible avec le plan infini")
+        self.tile = tile or Config.TILE_SIZE
+        self.tiles = {}        # (ligne de tuile, colonne de tuile) -> tableau uint8 tile x tile
+        self.origin = (0, 0)   # cellule en haut à gauche de la fenêtre to_array()
+
+    def contains(self, rows, cols):
+        return np.ones(np.broadcast(rows, cols).shape, dtype=bool) if np.ndim(rows) else True
+
+    # ---------------------------
+    # Cellules
+    # ---------------------------
+
+    def get_cell(self, row: int, col: int) -> int:
+        tile = self.tiles.get((row // self.tile, col // self.tile))
+        return 0 if tile is None else int(tile[row % self.tile, col % self.tile])
+
+    def set_cell(self, row: int, col: int, state: int):
+        self.set_cells(np.array([row]), np.array([col]), state)
+
+    def set_cells(self, rows: np.ndarray, cols: np.ndarray, state: int):
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        if not len(rows):
+            return
+        size = self.tile
+        keys, inverse = np.unique(np.column_stack((rows // size, cols // size)), axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        order = np.argsort(inverse, kind="stable")
+        bounds = np.searchsorted(inverse[order], np.arange(len(keys) + 1))
+
+        for k, key in enumerate(map(tuple, keys.tolist())):
+            cells = order[bounds[k]:bounds[k + 1]]
+            tile = self.tiles.get(key)
+            if state:
+                if tile is None:
+                    tile = self.tiles[key] = np.zeros((size, size), dtype=np.uint8)
+                tile[rows[cells] % size, cols[cells] % size] = 1
+            elif tile is not None:
+                tile[rows[cells] % size, cols[cells] % size] = 0
+                if not tile.any():
+                    del self.tiles[key]
+
+    def count_neighbors(self, row: int, col: int) -> int:
+        return sum(self.get_cell(row + dr, col + dc) for dr, dc in NEIGHBOR_OFFSETS)
+
+    def live_cells(self) -> np.ndarray:
+        """Coordonnées (N, 2) de toutes les cellules vivantes du plan."""
+        if not self.tiles:
+            return np.empty((0, 2), dtype=np.int64)
+        return np.concatenate([
+            np.argwhere(tile) + (ty * self.tile, tx * self.tile)
+            for (ty, tx), tile in self.tiles.items()
+        ])
+
+    def bounding_box(self):
+        """(haut, gauche, bas, droite) inclus de la zone vivante, ou None si le plan est vide."""
+        cells = self.live_cells()
+        if not len(cells):
+            return None
+        (top, left), (bottom, right) = cells.min(axis=0), cells.max(axis=0)
+        return int(top), int(left), int(bottom), int(right)
+
+    # ---------------------------
+    # Génération
+    # ---------------------------
+
+    def _active_keys(self):
+        """Tuiles vivantes + voisines dont le bord commun porte une cellule vivante."""
+        keys = list(self.tiles)
+        stack = np.stack([self.tiles[key] for key in keys])
+        edges = (
+            stack[:, 0].any(axis=1), stack[:, -1].any(axis=1),
+            stack[:, :, 0].any(axis=1), stack[:, :, -1].any(axis=1),
+            stack[:, 0, 0], stack[:, 0, -1], stack[:, -1, 0], stack[:, -1, -1],
+        )
+        # Même ordre que HALO[1:] : voisine du haut, du bas, de gauche, de droite, puis coins
+        active = set(keys)
+        offsets = [offset for offset, _, _ in HALO[1:]]
+        for (ty, tx), *touched in zip(keys, *(edge.tolist() for edge in edges)):
+            for (dy, dx), hit in zip(offsets, touched):
+                if hit:
+                    active.add((ty + dy, tx + dx))
+        return list(active)
+
+    def _padded(self, keys) -> np.ndarray:
+        """Tuiles `keys` entourées d'un halo recopié des tuiles voisines : (K, tile + 2, tile + 2)."""
+        padded = np.zeros((len(keys), self.tile + 2, self.tile + 2), dtype=np.uint8)
+        get = self.tiles.get
+        for k, (ty, tx) in enumerate(keys):
+            for (dy, dx), target, source in HALO:
+                tile = get((ty + dy, tx + dx))
+                if tile is not None:
+                    padded[k][target] = tile[source]
+        return padded
+
+    def step(self) -> bool:
+        if not self.tiles:
+            return False
+        keys = self._active_keys()
+        padded = self._padded(keys)
+        shape = (len(keys), self.tile, self.tile)
+        counts = count_neighbors_padded(padded, np.empty(shape, dtype=np.uint8))
+        new = apply_rule(padded[:, 1:-1, 1:-1], counts, np.empty(shape, dtype=np.uint8), self.rule)
+
+        alive = new.any(axis=(1, 2)).tolist()
+        if not any(alive):
+            return False
+        # Les tuiles devenues vides ne sont pas conservées
+        self.tiles = {key: new[k] for k, key in enumerate(keys) if alive[k]}
+        return True
+
+    # ---------------------------
+    # Fenêtre rows x cols et état complet
+    # ---------------------------
+
+    def to_array(self) -> np.ndarray:
+        """Fenêtre rows x cols du plan, à partir de `origin`."""
+        array = np.zeros((self.rows, self.cols), dtype=np.uint8)
+        top, left = self.origin
+        size = self.tile
+        for (ty, tx), tile in self.tiles.items():
+            r0, c0 = ty * size - top, tx * size - left
+            r1, c1 = max(r0, 0), max(c0, 0)
+            r2, c2 = min(r0 + size, self.rows), min(c0 + size, self.cols)
+            if r1 < r2 and c1 < c2:
+                array[r1:r2, c1:c2] = tile[r1 - r0:r2 - r0, c1 - c0:c2 - c0]
+        return array
+
+    def load_array(self, array):
+        """Remplace tout le plan par le contenu de la fenêtre `array`."""
+        rows, cols = np.nonzero(np.asarray(array).reshape(self.rows, self.cols))
+        self.tiles = {}
+        self.set_cells(rows + self.origin[0], cols + self.origin[1], 1)
+
+    def population(self) -> int:
+        return sum(int(np.count_nonzero(tile)) for tile in self.tiles.values())
+
+    def state_hash(self) -> int:
+        # Tout le plan, pas seulement la fenêtre : tuiles non vides, dans l'ordre des clés
+        digest = hashlib.blake2b(digest_size=8)
+        for key in sorted(self.tiles):
+            digest.update(np.array(key, dtype=np.int64).tobytes())
+            digest.update(np.packbits(self.tiles[key]).tobytes())
+        return int.from_bytes(digest.digest(), "little")
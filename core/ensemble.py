@@ -0,0 +1,194 @@
+import csv
+from contextlib import nullcontext
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from core.config import Config
+from core.cycle import CycleDetector, packed_hash
+from core.engines.base import BOUNDARIES, fill_halo
+from core.engines.numpy_engine import apply_rule, count_neighbors_padded
+from core.rules import CONWAY, parse_rule
+
+# Exécution en lot de nombreuses grilles indépendantes (recherches sur soupes
+# aléatoires) : durée de vie, population finale et période de chaque grille.
+
+# Colonnes des résultats, une ligne par grille :
+#   status     : "dead" (morte), "cycle" (vie stable ou oscillateur), "running" (limite atteinte)
+#   lifespan   : génération de la mort, ou de la première apparition de l'état qui se répète
+#   period     : période du cycle (vide sinon)
+#   population : population finale
+FIELDS = ("board", "seed", "status", "generations", "lifespan", "period", "population")
+
+
+class Ensemble:
+    # Lot de grilles de même taille empilées dans un tableau (N, rows + 2, cols + 2)
+    # et avancées d'un bloc par le noyau du moteur numpy. Chaque grille s'arrête
+    # dès qu'elle meurt ou entre dans un cycle ; les grilles terminées sont
+    # retirées du lot, qui rétrécit au fil des générations.
+
+    def __init__(self, boards, rule=CONWAY, boundary: str = "dead", detect_cycles: bool = True,
+                 max_period: int = None):
+        if boundary not in BOUNDARIES:
+            raise ValueError(f"Mode de bord inconnu : {boundary!r} (disponibles : {', '.join(BOUNDARIES)})")
+        boards = np.asarray(boards)
+        count, self.rows, self.cols = boards.shape
+        self.rule = parse_rule(rule)
+        self.boundary = boundary
+        self.generation = 0
+
+        self._front = np.zeros((count, self.rows + 2, self.cols + 2), dtype=np.uint8)
+        self._front[:, 1:-1, 1:-1] = boards != 0
+        self._back = np.zeros_like(self._front)
+        self._counts = np.zeros((count, self.rows, self.cols), dtype=np.uint8)
+        self._masks = np.zeros((count, self.rows, self.cols), dtype=np.uint16)
+
+        self.ids = np.arange(count)  # indice d'origine des grilles encore actives
+        self.results = [None] * count
+        self._detectors = [
+            CycleDetector(max_period or Config.CYCLE_TABLE_SIZE) for _ in range(count)
+        ] if detect_cycles else None
+        self._check()
+
+    def __len__(self):
+        """Nombre de grilles encore actives."""
+        return len(self.ids)
+
+    @property
+    def cells(self) -> np.ndarray:
+        """Grilles actives (vue sans copie), forme (len(self), rows, cols)."""
+        return self._front[:, 1:-1, 1:-1]
+
+    def step(self) -> int:
+        """Avance toutes les grilles actives d'une génération ; renvoie le nombre restant."""
+        fill_halo(self._front, self.boundary)
+        counts = count_neighbors_padded(self._front, self._counts)
+        apply_rule(self.cells, counts, self._back[:, 1:-1, 1:-1], self.rule, self._masks)
+        self._front, self._back = self._back, self._front
+        self.generation += 1
+        self._check()
+        return len(self.ids)
+
+    def run(self, generations: int):
+        """Avance jusqu'à ce que toutes les grilles soient terminées ou jusqu'à `generations`.
+
+        Renvoie les résultats (dicts, voir FIELDS) dans l'ordre des grilles.
+        """
+        while len(self.ids) and self.generation < generations:
+            self.step()
+        self._finish(np.ones(len(self.ids), dtype=bool), "running")
+        return self.results
+
+    # ---------------------------
+    # Arrêt anticipé
+    # ---------------------------
+
+    def _check(self):
+        if not len(self.ids):
+            return
+        cells = self.cells
+        populations = np.count_nonzero(cells, axis=(1, 2))
+        done = np.zeros(len(self.ids), dtype=bool)
+        if not self.rule.births_from_nothing:
+            done = populations == 0
+            self._finish(done, "dead", populations)
+
+        if self._detectors is not None:
+            packed = np.packbits(cells, axis=-1)
+            cycles = np.zeros(len(self.ids), dtype=bool)
+            for i in np.flatnonzero(~done).tolist():
+                cycle = self._detectors[i].observe(self.generation, packed_hash(packed[i]))
+                if cycle is not None:
+                    cycles[i] = True
+                    self._store(i, "cycle", cycle.start, cycle.period, populations[i])
+            done |= cycles
+
+        if done.any():
+            # Compactage : les grilles terminées ne sont plus calculées
+            keep = ~done
+            self._front = self._front[keep]
+            self._back = self._back[keep]
+            self._counts = self._counts[:len(self._front)]
+            self._masks = self._masks[:len(self._front)]
+            self.ids = self.ids[keep]
+            if self._detectors is not None:
+                self._detectors = [d for d, k in zip(self._detectors, keep.tolist()) if k]
+
+    def _finish(self, mask, status, populations=None):
+        if populations is None:
+            populations = np.count_nonzero(self.cells, axis=(1, 2))
+        for i in np.flatnonzero(mask).tolist():
+            lifespan = self.generation if status == "dead" else None
+            self._store(i, status, lifespan, None, populations[i])
+
+    def _store(self, i, status, lifespan, period, population):
+        board = int(self.ids[i])
+        self.results[board] = {
+            "board": board,
+            "status": status,
+            "generations": self.generation,
+            "lifespan": lifespan,
+            "period": period,
+            "population": int(population),
+        }
+
+
+# ---------------------------
+# Soupes aléatoires, en parallèle
+# ---------------------------
+
+def random_board(rows: int, cols: int, density: float, seed: int) -> np.ndarray:
+    """Soupe aléatoire ; mêmes cellules que la CLI avec --density et --seed."""
+    return np.random.default_rng(seed).random((rows, cols)) < density
+
+
+def _run_batch(first, count, rows, cols, density, seed, generations, rule, boundary, detect_cycles):
+    """Tâche d'un processus : les grilles first .. first + count - 1."""
+    boards = np.stack([random_board(rows, cols, density, seed + first + i) for i in range(count)])
+    ensemble = Ensemble(boards, rule, boundary, detect_cycles)
+    results = ensemble.run(generations)
+    for result in results:
+        result["board"] += first
+        result["seed"] = seed + result["board"]
+    return results
+
+
+def run_ensemble(count: int, rows: int, cols: int, density: float = 0.5, generations: int = 1000,
+                 seed: int = 0, batch_size: int = None, workers: int = None, rule=CONWAY,
+                 boundary: str = "dead", detect_cycles: bool = True, output=None):
+    """Simule `count` soupes aléatoires ; génère les résultats grille par grille, dans l'ordre.
+
+    La grille i est tirée avec la graine seed + i : les résultats ne dépendent
+    ni de la taille des lots ni du nombre de processus. Les lots sont répartis
+    sur `workers` processus ; avec `output`, chaque résultat est aussi écrit
+    en CSV dès que son lot est terminé.
+    """
+    batch_size = max(1, batch_size or Config.ENSEMBLE_BATCH_SIZE)
+    workers = max(1, workers or Config.WORKERS)
+    rule = parse_rule(rule)
+    tasks = [
+        (first, min(batch_size, count - first), rows, cols, density, seed, generations,
+         rule, boundary, detect_cycles)
+        for first in range(0, count, batch_size)
+    ]
+
+    writer = None
+    with open(output, "w", newline="", encoding="utf-8") if output else nullcontext() as f:
+        if f is not None:
+            writer = csv.DictWriter(f, fieldnames=FIELDS)
+            writer.writeheader()
+        if workers == 1 or len(tasks) == 1:
+            batches = (_run_batch(*task) for task in tasks)
+            yield from _emit(batches, writer, f)
+        else:
+            with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as executor:
+                batches = executor.map(_run_batch, *zip(*tasks))
+                yield from _emit(batches, writer, f)
+
+
+def _emit(batches, writer, f):
+    for results in batches:
+        if writer is not None:
+            writer.writerows(results)
+            f.flush()
+        yield from results
@@ -1,39 +1,128 @@
+import time
+from contextlib import contextmanager
+
+import numpy as np
+
+from core.config import Config
+from core.cycle import CycleDetector, zobrist_hash
+from core.engines import create_engine
+from core.history import History
+from core.recording import Recorder
+
+
 class GameOfLife:
     # Moteur du Jeu de la Vie, avec historique pour debug.
+    # Le calcul des générations est délégué à un moteur interchangeable
+    # (voir core/engines) : "python" (référence) ou "numpy" (vectorisé).
+    # Avec un moteur à plan infini ("tiled"), rows x cols n'est que la fenêtre
+    # affichée : les coordonnées ne sont pas bornées et l'historique est désactivé.
 
-    def __init__(self, rows: int, cols: int):
+    def __init__(self, rows: int, cols: int, engine: str = "python", history: bool = True,
+                 detect_cycles: bool = True, boundary: str = "dead", rule="B3/S23", metrics=None):
         self.rows = rows
         self.cols = cols
-        self.grid = [[0 for _ in range(cols)] for _ in range(rows)]
+        # Bords : "dead" (cellules mortes), "torus" (bords opposés reliés), "mirror"
+        self.boundary = boundary
+        self.engine = create_engine(engine, rows, cols, boundary=boundary, rule=rule)
+        self.rule = self.engine.rule  # règle B/S compilée (core/rules.py)
+        self.unbounded = self.engine.unbounded
+        self.generation = 0  # générations calculées depuis la création
+
+        # --- Détection des cycles (vie stable, oscillateurs) ---
+        self.cycles = CycleDetector(Config.CYCLE_TABLE_SIZE) if detect_cycles else None
+        self.cycle = None     # Cycle(start, period) une fois la répétition détectée
+        self._zobrist = None  # empreinte incrémentale (None : empreinte des bits compactés)
 
-        # --- Historique ---
-        self.history = []
+        # --- Historique (images clés + diffs, mémoire bornée) ---
+        # history=False (exécutions en lot) : ni undo ni timeline, aucun coût par génération.
+        # Plan infini : les images rows x cols ne décriraient pas tout l'état
+        self.history = History(
+            (rows, cols),
+            keyframe_interval=Config.HISTORY_KEYFRAME_INTERVAL,
+            max_bytes=Config.HISTORY_MAX_BYTES,
+        ) if history and not self.unbounded else None
         self.current_index = -1
+        # Cellules (N, 2) modifiées par la dernière génération, édition ou restauration
+        self.last_changes = None
+        self._batch_depth = 0  # > 0 : éditions groupées, historique différé
+        self.recorder = None   # enregistrement sur disque (voir start_recording)
+        self.metrics = metrics  # core.metrics.Metrics : mesures par génération (None : désactivé)
         self.save_state()  # enregistre l’état initial
 
+    @property
+    def grid(self):
+        """Grille courante du moteur (indexable par grid[r][c])."""
+        return self.engine.grid
+
+    @grid.setter
+    def grid(self, value):
+        """Remplace toute la grille, enregistrée comme une édition (historique, enregistrement, cycles)."""
+        self.engine.load_array(np.asarray(value, dtype=np.uint8))
+        if not self._batch_depth:
+            self.save_state()
+
     # ---------------------------
     # Gestion de l'historique
     # ---------------------------
 
-    def save_state(self):
-        """Enregistre une copie de la grille dans l’historique."""
+    def save_state(self, changes=None):
+        """Enregistre la grille dans l’historique (diff par rapport à l’image précédente).
+
+        `changes` : indices à plat des cellules modifiées, s’ils sont déjà connus.
+        Une modification manuelle relance la détection de cycles.
+        """
+        self._record(changes)
+        self._reset_cycles()
+
+    def _record(self, changes=None):
+        """Historique + enregistrement ; renvoie le diff à plat, s’il est connu."""
+        if self.history is None:
+            self.last_changes = self._coords(changes)
+            if self.recorder is not None:
+                self.recorder.append(self.engine.to_array(), changes)
+            return changes
+
         # Si on a reculé puis modifié : supprimer le futur
         if self.current_index < len(self.history) - 1:
-            self.history = self.history[:self.current_index + 1]
+            self.history.truncate(self.current_index + 1)
+
+        cells = self.engine.to_array()
+        appended = self.history.append(cells, changes)
+        self.last_changes = self._coords(self.history.last_diff)
+        if self.recorder is not None:
+            self.recorder.append(cells, self.history.last_diff)
 
         # Ne pas enregistrer si identique au précédent
-        if self.history and self.grid == self.history[-1]:
-            return
-        
-        # Sauvegarde profonde
-        self.history.append([row[:] for row in self.grid])
-        self.current_index += 1
+        if appended:
+            # L'éviction d'images anciennes décale les indices : l'état courant est le dernier
+            self.current_index = len(self.history) - 1
+        return self.history.last_diff
+
+    def start_recording(self, path):
+        """Enregistre sur disque chaque état sauvegardé, à partir de l’état courant."""
+        self.stop_recording()
+        self.recorder = Recorder(
+            path, (self.rows, self.cols),
+            keyframe_interval=Config.RECORDING_KEYFRAME_INTERVAL,
+            level=Config.RECORDING_COMPRESSION,
+        )
+        self.recorder.append(self.engine.to_array())
+
+    def stop_recording(self):
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
 
     def restore_state(self, index: int):
-        """Restaure un état précédent."""
-        if 0 <= index < len(self.history):
+        """Restaure un état précédent (reconstruit depuis l’image clé la plus proche)."""
+        if self.history is not None and 0 <= index < len(self.history):
             self.current_index = index
-            self.grid = [row[:] for row in self.history[index]]
+            before = self.engine.to_array().copy()
+            self.engine.load_array(self.history.frame(index))
+            self.last_changes = np.argwhere(before != self.engine.to_array())
+            if self.recorder is not None:
+                self.recorder.append(self.engine.to_array())
+            self._reset_cycles()
 
     def previous_generation(self):
         """Revenir à la génération précédente."""
@@ -45,51 +134,142 @@ class GameOfLife:
     # ---------------------------
 
     def display(self):
-        for row in self.grid:
-            print(" ".join("■" if cell else "." for cell in row))
-        print()
+        # Une seule écriture pour toute la grille
+        lines = (" ".join("■" if cell else "." for cell in row) for row in self.engine.to_array().tolist())
+        print("\n".join(lines) + "\n")
+
+    def get_cell(self, row: int, col: int) -> int:
+        return self.engine.get_cell(row, col)
 
     def set_cell(self, row: int, col: int, state: int):
-        if 0 <= row < self.rows and 0 <= col < self.cols:
-            self.grid[row][col] = 1 if state else 0
+        if self.engine.contains(row, col):
+            self.engine.set_cell(row, col, state)
             # Important : on enregistre le changement manuel dans l’historique
+            if not self._batch_depth:
+                self.save_state()
+
+    def set_cells(self, coords, state: int = 1):
+        """Modifie un lot de cellules [(ligne, colonne), ...] en une seule passe.
+
+        Les coordonnées hors grille sont ignorées (aucune sur un plan infini) ;
+        une seule entrée d’historique est enregistrée pour tout le lot.
+        """
+        coords = np.asarray(coords, dtype=np.int64).reshape(-1, 2)
+        rows, cols = coords[:, 0], coords[:, 1]
+        if self.unbounded:
+            self.engine.set_cells(rows, cols, state)
+        else:
+            inside = self.engine.contains(rows, cols)
+            if inside.any():
+                flat = np.unique(rows[inside] * self.cols + cols[inside])
+                self.engine.set_cells(flat // self.cols, flat % self.cols, state)
+        if not self._batch_depth:
             self.save_state()
 
-    def count_neighbors(self, row: int, col: int) -> int:
-        directions = [
-            (-1, -1), (-1, 0), (-1, 1),
-            (0, -1),          (0, 1),
-            (1, -1),  (1, 0), (1, 1)
-        ]
-        count = 0
-        for dr, dc in directions:
-            r, c = row + dr, col + dc
-            if 0 <= r < self.rows and 0 <= c < self.cols:
-                count += self.grid[r][c]
-        return count
+    @contextmanager
+    def batch(self):
+        """Regroupe des éditions : l’historique n’est enregistré qu’une fois, à la sortie.
 
-    def next_generation(self):
-        """Calcul de la génération suivante + enregistrement dans l’historique."""
-        new_grid = [[0 for _ in range(self.cols)] for _ in range(self.rows)]
-        alive_found = False
+            with game.batch():
+                game.set_cell(0, 0, 1)
+                game.set_cell(0, 1, 1)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.save_state()
 
-        for r in range(self.rows):
-            for c in range(self.cols):
-                neighbors = self.count_neighbors(r, c)
+    def count_neighbors(self, row: int, col: int) -> int:
+        return self.engine.count_neighbors(row, col)
 
-                if self.grid[r][c] == 1:
-                    new_state = 1 if neighbors in (2, 3) else 0
-                else:
-                    new_state = 1 if neighbors == 3 else 0
+    def _coords(self, flat):
+        """Indices à plat -> tableau (N, 2) de (ligne, colonne)."""
+        if flat is None:
+            return None
+        rows, cols = np.divmod(np.asarray(flat, dtype=np.int64), self.cols)
+        return np.column_stack((rows, cols))
 
-                new_grid[r][c] = new_state
-                if new_state == 1:
-                    alive_found = True
+    def _engine_changes(self):
+        """Diff publié par le moteur (indices à plat), ou None s’il faut le calculer."""
+        cells = self.engine.changed_cells
+        if cells is None or self._batch_depth:
+            return None
+        return cells[:, 0] * self.cols + cells[:, 1]
 
+    def next_generation(self):
+        """Calcul de la génération suivante + enregistrement dans l’historique."""
+        metrics = self.metrics
+        if metrics is not None:
+            start = time.perf_counter()
         # Si aucune cellule vivante → fin automatique
-        if not alive_found:
+        if not self.engine.step():
+            self.last_changes = np.empty((0, 2), dtype=np.int64)
             return False  # renvoie False pour signaler "mort totale"
 
-        self.grid = new_grid
-        self.save_state()
+        if metrics is not None:
+            stepped = time.perf_counter()
+        changes = self._record(self._engine_changes())
+        self.generation += 1
+        if metrics is not None:
+            self._measure(metrics, start, stepped)
+        if self.cycles is not None and self.cycle is None:
+            self._observe_cycle(changes)
         return True
+
+    def fast_forward(self, target: int) -> int:
+        """Atteint la génération `target` en ne calculant que la phase du cycle détecté.
+
+        Renvoie le nombre de générations sautées (0 sans cycle connu).
+        """
+        if self.cycle is None or target <= self.generation:
+            return 0
+        for _ in range((target - self.generation) % self.cycle.period):
+            self.next_generation()
+        skipped = target - self.generation
+        self.generation = target
+        return skipped
+
+    def _measure(self, metrics, start, stepped):
+        recorded = time.perf_counter()
+        changed = -1 if self.last_changes is None else len(self.last_changes)
+        metrics.record(
+            self.generation, (stepped - start) * 1000, (recorded - stepped) * 1000,
+            self.engine.population(), changed,
+        )
+
+    # ---------------------------
+    # Détection des cycles
+    # ---------------------------
+
+    def _reset_cycles(self):
+        """Oublie les empreintes et enregistre celle de l’état courant."""
+        if self.cycles is None:
+            return
+        self.cycles.reset()
+        self.cycle = None
+        self._zobrist = None
+        # Diffs attendus (historique ou moteur qui les publie) : empreinte de Zobrist incrémentale
+        diffs = self.history is not None or self.engine.changed_cells is not None
+        self._observe_cycle(np.empty(0, dtype=np.int64) if diffs else None)
+
+    def _observe_cycle(self, changes):
+        if changes is None:
+            if self._zobrist is not None:
+                self.cycles.reset()
+                self._zobrist = None
+            key = self.engine.state_hash()
+        elif self._zobrist is None:
+            # Passage en mode incrémental : empreinte complète de départ
+            self.cycles.reset()
+            self._zobrist = key = zobrist_hash(np.flatnonzero(self.engine.to_array()))
+        else:
+            self._zobrist ^= zobrist_hash(changes)
+            key = self._zobrist
+        self.cycle = self.cycles.observe(self.generation, key)
+
+    def close(self):
+        self.stop_recording()
+        self.engine.close()
@@ -0,0 +1,304 @@
+import logging
+
+import numpy as np
+
+from core.rules import CONWAY, parse_rule
+
+logger = logging.getLogger(__name__)
+
+
+class Node:
+    # Nœud canonique d'un quadtree : 4 enfants (nw, ne, sw, se) de niveau
+    # level - 1, couvrant un carré de 2**level cellules de côté.
+
+    __slots__ = ("nw", "ne", "sw", "se", "level", "population")
+
+    def __init__(self, nw, ne, sw, se, level, population):
+        self.nw = nw
+        self.ne = ne
+        self.sw = sw
+        self.se = se
+        self.level = level
+        self.population = population
+
+
+# Feuilles (niveau 0) : une cellule morte ou vivante
+DEAD = Node(None, None, None, None, 0, 0)
+ALIVE = Node(None, None, None, None, 0, 1)
+
+
+class HashLife:
+    # Moteur HashLife (Gosper) : quadtree mémoïsé à nœuds canonicalisés.
+    # Un plan infini est représenté par la racine `root` dont le coin haut-gauche
+    # est en (origin_row, origin_col). advance(n) saute n générations en
+    # décomposant n en puissances de 2, chacune calculée en un seul appel.
+
+    def __init__(self, max_nodes: int = 1_000_000, rule=CONWAY):
+        self.max_nodes = max_nodes
+        self.rule = parse_rule(rule)
+        if self.rule.births_from_nothing:
+            # Le vide infini naîtrait en entier : aucune représentation finie
+            raise ValueError(f"Règle {self.rule} (B0) incompatible avec HashLife")
+        self.birth = self.rule.birth
+        self.survive = self.rule.survive
+
+        self._nodes = {}      # (nw, ne, sw, se) -> Node canonique
+        self._results = {}    # (Node, j) -> Node central avancé de 2**j générations
+        self._empty = [DEAD]  # nœud vide de chaque niveau
+
+        self.generation = 0
+        self.origin_row = 0
+        self.origin_col = 0
+        self.root = self._get_empty(3)
+
+    # ---------------------------
+    # Construction des nœuds
+    # ---------------------------
+
+    def join(self, nw, ne, sw, se) -> Node:
+        """Renvoie le nœud canonique ayant ces 4 enfants."""
+        key = (nw, ne, sw, se)
+        node = self._nodes.get(key)
+        if node is None:
+            node = Node(nw, ne, sw, se, nw.level + 1,
+                        nw.population + ne.population + sw.population + se.population)
+            self._nodes[key] = node
+        return node
+
+    def _get_empty(self, level: int) -> Node:
+        while len(self._empty) <= level:
+            e = self._empty[-1]
+            self._empty.append(self.join(e, e, e, e))
+        return self._empty[level]
+
+    def _centre(self, node: Node) -> Node:
+        """Place `node` au centre d'un nœud de niveau supérieur entouré de vide."""
+        e = self._get_empty(node.level - 1)
+        return self.join(
+            self.join(e, e, e, node.nw), self.join(e, e, node.ne, e),
+            self.join(e, node.sw, e, e), self.join(node.se, e, e, e),
+        )
+
+    def _inner(self, node: Node) -> Node:
+        """Moitié centrale d'un nœud (niveau - 1), sans calcul de génération."""
+        return self.join(node.nw.se, node.ne.sw, node.sw.ne, node.se.nw)
+
+    # ---------------------------
+    # Calcul des générations
+    # ---------------------------
+
+    def _life_4x4(self, m: Node) -> Node:
+        """Cas de base : centre 2x2 d'un bloc 4x4 après une génération."""
+        cells = [
+            [m.nw.nw, m.nw.ne, m.ne.nw, m.ne.ne],
+            [m.nw.sw, m.nw.se, m.ne.sw, m.ne.se],
+            [m.sw.nw, m.sw.ne, m.se.nw, m.se.ne],
+            [m.sw.sw, m.sw.se, m.se.sw, m.se.se],
+        ]
+        bits = [[cell.population for cell in row] for row in cells]
+        out = []
+        for r in (1, 2):
+            for c in (1, 2):
+                n = sum(bits[r + dr][c + dc]
+                        for dr in (-1, 0, 1) for dc in (-1, 0, 1)) - bits[r][c]
+                rule = self.survive if bits[r][c] else self.birth
+                out.append(ALIVE if n in rule else DEAD)
+        return self.join(*out)
+
+    def _successor(self, m: Node, j: int) -> Node:
+        """Nœud central (niveau - 1) de `m` avancé de 2**j générations (j <= niveau - 2)."""
+        if m.population == 0:
+            return m.nw
+        key = (m, j)
+        result = self._results.get(key)
+        if result is not None:
+            return result
+
+        if m.level == 2:
+            result = self._life_4x4(m)
+        else:
+            a, b, c, d = m.nw, m.ne, m.sw, m.se
+            join = self.join
+            c1 = self._successor(join(a.nw, a.ne, a.sw, a.se), j)
+            c2 = self._successor(join(a.ne, b.nw, a.se, b.sw), j)
+            c3 = self._successor(join(b.nw, b.ne, b.sw, b.se), j)
+            c4 = self._successor(join(a.sw, a.se, c.nw, c.ne), j)
+            c5 = self._successor(join(a.se, b.sw, c.ne, d.nw), j)
+            c6 = self._successor(join(b.sw, b.se, d.nw, d.ne), j)
+            c7 = self._successor(join(c.nw, c.ne, c.sw, c.se), j)
+            c8 = self._successor(join(c.ne, d.nw, c.se, d.sw), j)
+            c9 = self._successor(join(d.nw, d.ne, d.sw, d.se), j)
+
+            if j < m.level - 2:
+                # Pas de seconde avance : on ne garde que les centres
+                result = join(
+                    join(c1.se, c2.sw, c4.ne, c5.nw), join(c2.se, c3.sw, c5.ne, c6.nw),
+                    join(c4.se, c5.sw, c7.ne, c8.nw), join(c5.se, c6.sw, c8.ne, c9.nw),
+                )
+            else:
+                result = join(
+                    self._successor(join(c1, c2, c4, c5), j),
+                    self._successor(join(c2, c3, c5, c6), j),
+                    self._successor(join(c4, c5, c7, c8), j),
+                    self._successor(join(c5, c6, c8, c9), j),
+                )
+
+        self._results[key] = result
+        return result
+
+    def _advance_pow2(self, j: int):
+        """Avance la racine de 2**j générations en un seul appel récursif."""
+        root = self.root
+        # Le motif doit tenir dans la moitié centrale, et la racine être assez grande
+        while root.level < j + 2 or self._inner(root).population != root.population:
+            self.origin_row -= 1 << (root.level - 1)
+            self.origin_col -= 1 << (root.level - 1)
+            root = self._centre(root)
+        # Marge supplémentaire : la croissance (au plus 2**j cellules) reste dans le résultat
+        self.origin_row -= 1 << (root.level - 1)
+        self.origin_col -= 1 << (root.level - 1)
+        root = self._centre(root)
+
+        root = self._successor(root, j)
+        self.origin_row += 1 << (root.level - 1)
+        self.origin_col += 1 << (root.level - 1)
+        self.root = root
+        self.generation += 1 << j
+
+        if len(self._nodes) > self.max_nodes:
+            self.collect()
+
+    def advance(self, generations: int):
+        """Avance de `generations` générations (2**k générations = un seul saut)."""
+        if generations < 0:
+            raise ValueError("Le nombre de générations doit être positif")
+        j = 0
+        while generations:
+            if generations & 1:
+                self._advance_pow2(j)
+            generations >>= 1
+            j += 1
+
+    def step(self):
+        self.advance(1)
+
+    # ---------------------------
+    # Cache borné
+    # ---------------------------
+
+    def collect(self):
+        """GC : vide le cache de résultats et ne garde que les nœuds atteignables depuis la racine."""
+        before = len(self._nodes)
+        self._results.clear()
+        self._nodes = {}
+        self._empty = [DEAD]
+
+        seen = set()
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if node.level == 0 or id(node) in seen:
+                continue
+            seen.add(id(node))
+            self._nodes[(node.nw, node.ne, node.sw, node.se)] = node
+            stack.extend((node.nw, node.ne, node.sw, node.se))
+
+        logger.debug(f"HashLife GC : {before} -> {len(self._nodes)} nœuds")
+
+    @property
+    def node_count(self) -> int:
+        return len(self._nodes)
+
+    # ---------------------------
+    # Import / export
+    # ---------------------------
+
+    @property
+    def population(self) -> int:
+        return self.root.population
+
+    def load_coords(self, coords):
+        """Charge des coordonnées [ligne, colonne] (format JSON des patterns)."""
+        cells = {(int(r), int(c)) for r, c in coords}
+        self.generation = 0
+        if not cells:
+            self.origin_row = self.origin_col = 0
+            self.root = self._get_empty(3)
+            return
+
+        r0 = min(r for r, _ in cells)
+        c0 = min(c for _, c in cells)
+        extent = max(max(r - r0, c - c0) for r, c in cells) + 1
+        level = max(3, (extent - 1).bit_length())
+
+        # Construction ascendante : on regroupe les nœuds par blocs 2x2
+        layer = {(r - r0, c - c0): ALIVE for r, c in cells}
+        for lvl in range(level):
+            empty = self._get_empty(lvl)
+            parents = {}
+            for (r, c) in layer:
+                parents.setdefault((r >> 1, c >> 1), None)
+            layer = {
+                (pr, pc): self.join(
+                    layer.get((2 * pr, 2 * pc), empty), layer.get((2 * pr, 2 * pc + 1), empty),
+                    layer.get((2 * pr + 1, 2 * pc), empty), layer.get((2 * pr + 1, 2 * pc + 1), empty),
+                )
+                for pr, pc in parents
+            }
+        self.root = layer[(0, 0)]
+        self.origin_row, self.origin_col = r0, c0
+
+    def load_grid(self, grid):
+        """Charge une grille 2D (liste de listes ou tableau) ; (0, 0) = coin haut-gauche."""
+        rows, cols = np.nonzero(np.asarray(grid))
+        self.load_coords(zip(rows.tolist(), cols.tolist()))
+
+    @classmethod
+    def from_coords(cls, coords, **options):
+        hashlife = cls(**options)
+        hashlife.load_coords(coords)
+        return hashlife
+
+    @classmethod
+    def from_grid(cls, grid, **options):
+        hashlife = cls(**options)
+        hashlife.load_grid(grid)
+        return hashlife
+
+    def iter_cells(self):
+        """Itère sur les coordonnées absolues (ligne, colonne) des cellules vivantes."""
+        stack = [(self.root, self.origin_row, self.origin_col)]
+        while stack:
+            node, r, c = stack.pop()
+            if node.population == 0:
+                continue
+            if node.level == 0:
+                yield r, c
+                continue
+            half = 1 << (node.level - 1)
+            stack.append((node.nw, r, c))
+            stack.append((node.ne, r, c + half))
+            stack.append((node.sw, r + half, c))
+            stack.append((node.se, r + half, c + half))
+
+    def to_coords(self):
+        """Liste triée de [ligne, colonne], sérialisable comme les patterns JSON."""
+        return sorted([r, c] for r, c in self.iter_cells())
+
+    def to_grid(self, rows: int, cols: int, origin=(0, 0)) -> np.ndarray:
+        """Fenêtre rows x cols (uint8) du plan, coin haut-gauche en `origin`."""
+        grid = np.zeros((rows, cols), dtype=np.uint8)
+        top, left = origin
+        for r, c in self.iter_cells():
+            if top <= r < top + rows and left <= c < left + cols:
+                grid[r - top, c - left] = 1
+        return grid
+
+    def bounding_box(self):
+        """(ligne min, colonne min, ligne max, colonne max) ou None si vide."""
+        cells = list(self.iter_cells())
+        if not cells:
+            return None
+        rows = [r for r, _ in cells]
+        cols = [c for _, c in cells]
+        return min(rows), min(cols), max(rows), max(cols)
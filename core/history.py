@@ -0,0 +1,133 @@
+import bisect
+
+import numpy as np
+
+# Coût fixe estimé d'une entrée (objets Python, tuple...) pour le budget mémoire
+ENTRY_OVERHEAD = 64
+
+
+class History:
+    # Historique compact des générations : images clés périodiques (bits
+    # compactés) + diffs XOR entre images successives (indices des cellules
+    # qui ont changé). Un budget mémoire borne la taille totale : les groupes
+    # les plus anciens (image clé + ses diffs) sont évincés en premier.
+
+    def __init__(self, shape, keyframe_interval: int = 64, max_bytes: int = 64 * 1024 * 1024):
+        self.shape = tuple(shape)
+        self.size = int(np.prod(self.shape))
+        self.keyframe_interval = max(1, keyframe_interval)
+        self.max_bytes = max_bytes
+        self.index_dtype = np.uint32 if self.size < 2**32 else np.uint64
+
+        self._entries = []        # ("key", bits compactés) ou ("diff", indices)
+        self._keyframes = []      # positions des images clés dans _entries
+        self._last = None         # dernière image, en clair (pour calculer les diffs)
+        self._cached = None       # (index, image) de la dernière reconstruction
+        self.nbytes = 0
+        self.evicted = 0          # nombre total d'images évincées
+        self.last_diff = None     # indices modifiés par le dernier append (None : image initiale)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        if index < 0:
+            index += len(self._entries)
+        return self.frame(index)
+
+    # ---------------------------
+    # Écriture
+    # ---------------------------
+
+    def append(self, cells, changes=None) -> bool:
+        """Ajoute une image. Renvoie False si elle est identique à la précédente.
+
+        `changes` (indices à plat des cellules modifiées) évite la comparaison
+        complète avec l'image précédente quand le moteur les connaît déjà.
+        """
+        cells = np.asarray(cells, dtype=np.uint8).reshape(self.shape)
+
+        if self._last is None:
+            self.last_diff = None
+            self._add_keyframe(cells)
+            return True
+
+        if changes is None:
+            changes = np.flatnonzero(cells.reshape(-1) != self._last.reshape(-1))
+        changes = np.asarray(changes, dtype=self.index_dtype)
+        self.last_diff = changes
+        if len(changes) == 0:
+            return False
+
+        since_key = len(self._entries) - self._keyframes[-1]
+        if since_key >= self.keyframe_interval or changes.nbytes >= self.size // 8:
+            self._add_keyframe(cells)
+        else:
+            self._push(("diff", changes))
+            self._last.reshape(-1)[changes] ^= 1
+
+        self._evict()
+        return True
+
+    def _add_keyframe(self, cells):
+        self._keyframes.append(len(self._entries))
+        self._push(("key", np.packbits(cells.reshape(-1) != 0)))
+        self._last = (cells != 0).astype(np.uint8)
+
+    def _push(self, entry):
+        self._entries.append(entry)
+        self.nbytes += entry[1].nbytes + ENTRY_OVERHEAD
+
+    def _evict(self):
+        """Supprime les groupes les plus anciens tant que le budget est dépassé."""
+        while self.nbytes > self.max_bytes and len(self._keyframes) > 1:
+            dropped = self._keyframes[1]
+            for _, data in self._entries[:dropped]:
+                self.nbytes -= data.nbytes + ENTRY_OVERHEAD
+            del self._entries[:dropped]
+            self._keyframes = [k - dropped for k in self._keyframes[1:]]
+            self.evicted += dropped
+            self._cached = None
+
+    def truncate(self, length: int):
+        """Ne garde que les `length` premières images (supprime le « futur »)."""
+        if length >= len(self._entries):
+            return
+        # Reconstruite avant la suppression : frame() renverrait sinon l'ancienne dernière image
+        last = self.frame(length - 1) if length else None
+        for _, data in self._entries[length:]:
+            self.nbytes -= data.nbytes + ENTRY_OVERHEAD
+        del self._entries[length:]
+        self._keyframes = [k for k in self._keyframes if k < length]
+        self._cached = None
+        self._last = last
+
+    def clear(self):
+        self.truncate(0)
+
+    # ---------------------------
+    # Lecture
+    # ---------------------------
+
+    def frame(self, index: int) -> np.ndarray:
+        """Reconstruit l'image `index` depuis l'image clé la plus proche."""
+        if not 0 <= index < len(self._entries):
+            raise IndexError(index)
+        if index == len(self._entries) - 1:
+            return self._last.copy()
+
+        key = self._keyframes[bisect.bisect_right(self._keyframes, index) - 1]
+
+        # Parcours séquentiel de la timeline : on repart de la dernière reconstruction
+        if self._cached is not None and key <= self._cached[0] <= index:
+            start, image = self._cached
+        else:
+            bits = np.unpackbits(self._entries[key][1], count=self.size)
+            start, image = key, bits.reshape(self.shape)
+
+        flat = image.reshape(-1)
+        for position in range(start + 1, index + 1):
+            flat[self._entries[position][1]] ^= 1
+
+        self._cached = (index, image)
+        return image.copy()
@@ -0,0 +1,169 @@
+import cProfile
+import json
+import math
+import pstats
+import sys
+from contextlib import contextmanager
+
+import numpy as np
+
+# Instrumentation du chemin critique : une mesure par génération dans un
+# tampon circulaire, et profilage cProfile à la demande (--profile).
+
+RECORD = np.dtype([
+    ("generation", np.int64),
+    ("step_ms", np.float64),     # calcul de la génération par le moteur
+    ("history_ms", np.float64),  # historique + enregistrement sur disque
+    ("population", np.int64),
+    ("changed", np.int64),       # cellules modifiées (-1 : diff inconnu)
+    ("render_ms", np.float64),   # affichage (NaN : génération non affichée)
+])
+TIMINGS = ("step_ms", "history_ms", "render_ms")
+
+_profiles = None  # sessions cProfile des threads profilés (None : profilage inactif)
+
+# Python >= 3.12 : cProfile repose sur sys.monitoring, commun à tous les threads.
+# La session de profiling() les couvre tous ; une seconde session lèverait ValueError.
+PER_THREAD_PROFILES = sys.version_info < (3, 12)
+
+
+class Metrics:
+    # Tampon circulaire pré-alloué : les mesures les plus anciennes sont
+    # écrasées, aucune allocation par génération. Désactivé
+    # (GameOfLife.metrics = None), le coût se limite à un test par génération.
+
+    def __init__(self, capacity: int = 4096, callback=None):
+        self.capacity = max(1, capacity)
+        self.callback = callback  # callback(mesure) à chaque génération (dict, voir RECORD)
+        self._records = np.zeros(self.capacity, dtype=RECORD)
+        self._count = 0  # mesures reçues depuis la création (ou clear)
+
+    def __len__(self):
+        return min(self._count, self.capacity)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def clear(self):
+        self._count = 0
+
+    def record(self, generation, step_ms, history_ms, population, changed):
+        self._records[self._count % self.capacity] = (
+            generation, step_ms, history_ms, population, changed, math.nan,
+        )
+        self._count += 1
+        if self.callback is not None:
+            self.callback(self.last())
+
+    def record_render(self, render_ms):
+        """Temps d'affichage, attribué à la dernière génération mesurée."""
+        if self._count:
+            self._records["render_ms"][(self._count - 1) % self.capacity] = render_ms
+
+    # ---------------------------
+    # Lecture
+    # ---------------------------
+
+    def records(self) -> np.ndarray:
+        """Copie des mesures conservées, de la plus ancienne à la plus récente."""
+        if self._count <= self.capacity:
+            return self._records[:self._count].copy()
+        start = self._count % self.capacity
+        return np.concatenate((self._records[start:], self._records[:start]))
+
+    def last(self):
+        """Dernière mesure (dict), ou None."""
+        if not self._count:
+            return None
+        return _as_dict(self._records[(self._count - 1) % self.capacity])
+
+    def to_list(self):
+        return [_as_dict(row) for row in self.records()]
+
+    def summary(self) -> dict:
+        """Moyenne, 95e centile et maximum de chaque temps mesuré (ms)."""
+        records = self.records()
+        summary = {"generations": len(records)}
+        for field in TIMINGS:
+            values = records[field][~np.isnan(records[field])]
+            if len(values):
+                summary[field] = {
+                    "mean": round(float(values.mean()), 4),
+                    "p95": round(float(np.percentile(values, 95)), 4),
+                    "max": round(float(values.max()), 4),
+                }
+        return summary
+
+    def dump(self, path):
+        """Écrit le résumé et les mesures conservées en JSON."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({
+                "capacity": self.capacity,
+                "count": self._count,
+                "summary": self.summary(),
+                "records": self.to_list(),
+            }, f, indent=1)
+
+
+def _as_dict(row) -> dict:
+    record = {}
+    for name, value in zip(RECORD.names, row.tolist()):
+        if isinstance(value, float):
+            value = None if math.isnan(value) else round(value, 4)
+        record[name] = value
+    return record
+
+
+# ---------------------------
+# Profilage
+# ---------------------------
+
+@contextmanager
+def profile_thread():
+    """Profile le thread courant pendant le bloc si un profilage est actif (sinon sans effet).
+
+    Avant Python 3.12, cProfile ne suit que le thread qui l'active : chaque
+    thread de calcul ouvre sa propre session, fusionnée à la fin de profiling().
+    Depuis 3.12, la session unique suit déjà tous les threads.
+    """
+    profiles = _profiles
+    if profiles is None or not PER_THREAD_PROFILES:
+        yield
+        return
+    profile = cProfile.Profile()
+    try:
+        profile.enable()
+    except ValueError:
+        # Autre outil de profilage déjà actif : le thread continue sans profil
+        yield
+        return
+    try:
+        yield
+    finally:
+        profile.disable()
+        profiles.append(profile)
+
+
+@contextmanager
+def profiling(output=None, limit: int = 30):
+    """Profile le bloc (et les threads qui passent par profile_thread()).
+
+    Les statistiques sont écrites dans `output` (format pstats, .prof) ou,
+    sans fichier, les `limit` fonctions les plus coûteuses sont affichées.
+    """
+    global _profiles
+    _profiles = profiles = []
+    session = cProfile.Profile()
+    session.enable()
+    try:
+        yield
+    finally:
+        session.disable()
+        _profiles = None
+        stats = pstats.Stats(session, *profiles)
+        if output:
+            stats.dump_stats(output)
+            print(f"Profil enregistré : {output}")
+        else:
+            stats.sort_stats("cumulative").print_stats(limit)
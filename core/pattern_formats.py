@@ -0,0 +1,242 @@
+import re
+
+import numpy as np
+
+# Formats texte standard des collections de patterns :
+#   RLE (.rle)         : "x = 3, y = 3, rule = B3/S23" puis "bo$2bo$3o!"
+#   Plaintext (.cells) : lignes de '.' (morte) et 'O' (vivante), commentaires "!"
+# Les fichiers sont lus par blocs et décodés en lots de coordonnées (tableaux
+# (N, 2)) : la mémoire reste proportionnelle à la grille, pas au texte.
+
+CHUNK_SIZE = 1 << 16     # caractères lus à la fois
+BATCH_CELLS = 1 << 16    # cellules vivantes par lot produit
+RLE_LINE_WIDTH = 70
+
+_RLE_HEADER = re.compile(r"\s*x\s*=\s*(\d+)\s*,\s*y\s*=\s*(\d+)(?:\s*,\s*rule\s*=\s*([^\s,]+))?", re.I)
+_RLE_TOKEN = re.compile(r"(\d*)([^\d\s])")
+_TRAILING_DIGITS = re.compile(r"\d+$")
+
+
+class PatternFormatError(ValueError):
+    pass
+
+
+class PatternInfo:
+    # En-tête d'un fichier de pattern (dimensions déclarées, règle, nom).
+
+    def __init__(self, width=None, height=None, rule=None, name=None):
+        self.width = width
+        self.height = height
+        self.rule = rule
+        self.name = name
+        self.comments = []
+
+
+def _expand_runs(rows, starts, lengths) -> np.ndarray:
+    """Runs (ligne, colonne de début, longueur) -> coordonnées (N, 2) des cellules."""
+    lengths = np.asarray(lengths, dtype=np.int64)
+    total = int(lengths.sum())
+    row_idx = np.repeat(np.asarray(rows, dtype=np.int64), lengths)
+    run_offsets = np.repeat(np.cumsum(lengths) - lengths, lengths)
+    col_idx = np.repeat(np.asarray(starts, dtype=np.int64), lengths) + (np.arange(total) - run_offsets)
+    return np.column_stack((row_idx, col_idx))
+
+
+# ---------------------------
+# RLE
+# ---------------------------
+
+def read_rle_header(stream) -> PatternInfo:
+    """Lit les commentaires '#' et la ligne 'x = ..., y = ...' ; le flux reste sur le corps."""
+    info = PatternInfo()
+    for line in iter(stream.readline, ""):
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if stripped.startswith("#"):
+            if stripped[:2] == "#N":
+                info.name = stripped[2:].strip()
+            elif stripped[:2] in ("#C", "#c"):
+                info.comments.append(stripped[2:].strip())
+            continue
+        match = _RLE_HEADER.match(stripped)
+        if not match:
+            raise PatternFormatError(f"En-tête RLE invalide : {stripped[:40]!r}")
+        info.width, info.height = int(match.group(1)), int(match.group(2))
+        info.rule = match.group(3)
+        return info
+    raise PatternFormatError("Fichier RLE sans en-tête")
+
+
+def iter_rle_cells(stream, chunk_size: int = CHUNK_SIZE):
+    """Décode le corps RLE bloc par bloc ; produit des lots de coordonnées (N, 2)."""
+    row = col = 0
+    carry = ""
+    rows, starts, lengths = [], [], []
+    pending = 0
+
+    while True:
+        chunk = stream.read(chunk_size)
+        text = carry + chunk
+        carry = ""
+        if chunk:
+            # Un nombre coupé en fin de bloc est reporté au bloc suivant
+            trailing = _TRAILING_DIGITS.search(text)
+            if trailing:
+                carry, text = trailing.group(), text[:trailing.start()]
+
+        finished = not chunk
+        for count, tag in _RLE_TOKEN.findall(text):
+            n = int(count) if count else 1
+            if tag in "b.":
+                col += n
+            elif tag == "$":
+                row += n
+                col = 0
+            elif tag == "!":
+                finished = True
+                break
+            else:
+                # 'o' (ou états multiples A-X) : cellules vivantes
+                rows.append(row)
+                starts.append(col)
+                lengths.append(n)
+                pending += n
+                col += n
+
+            if pending >= BATCH_CELLS:
+                yield _expand_runs(rows, starts, lengths)
+                rows, starts, lengths = [], [], []
+                pending = 0
+
+        if finished:
+            break
+
+    if rows:
+        yield _expand_runs(rows, starts, lengths)
+
+
+def _rle_tokens(array):
+    """Jetons RLE d'une grille (run-length par ligne, sans cellules mortes finales)."""
+    last_row = 0
+    for r, row in enumerate(np.asarray(array) != 0):
+        if not row.any():
+            continue
+        if r > last_row:
+            n = r - last_row
+            yield f"{n}$" if n > 1 else "$"
+        last_row = r
+
+        edges = np.diff(np.concatenate(([0], row.astype(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1)
+        previous = 0
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            if start > previous:
+                dead = start - previous
+                yield f"{dead}b" if dead > 1 else "b"
+            alive = end - start
+            yield f"{alive}o" if alive > 1 else "o"
+            previous = end
+    yield "!"
+
+
+def write_rle(stream, array, rule: str = "B3/S23", name: str = None):
+    """Écrit une grille en RLE (lignes de 70 caractères au plus)."""
+    array = np.asarray(array)
+    height, width = array.shape
+    if name:
+        stream.write(f"#N {name}\n")
+    stream.write(f"x = {width}, y = {height}, rule = {rule}\n")
+
+    line = ""
+    for token in _rle_tokens(array):
+        if len(line) + len(token) > RLE_LINE_WIDTH:
+            stream.write(line + "\n")
+            line = ""
+        line += token
+    stream.write(line + "\n")
+
+
+# ---------------------------
+# Plaintext (.cells)
+# ---------------------------
+
+def read_cells_header(stream) -> PatternInfo:
+    """Lit les commentaires '!' de tête ; les dimensions ne sont pas déclarées."""
+    info = PatternInfo()
+    position = stream.tell()
+    for line in iter(stream.readline, ""):
+        if not line.startswith("!"):
+            break
+        text = line[1:].strip()
+        if text.lower().startswith("name:"):
+            info.name = text[5:].strip()
+        else:
+            info.comments.append(text)
+        position = stream.tell()
+    stream.seek(position)
+    return info
+
+
+def iter_cells_cells(stream):
+    """Décode un fichier .cells ligne par ligne ; produit des lots de coordonnées (N, 2)."""
+    batch = []
+    pending = 0
+    row = 0
+    for line in stream:
+        if line.startswith("!"):
+            continue
+        codes = np.frombuffer(line.rstrip("\r\n").encode("ascii", "replace"), dtype=np.uint8)
+        cols = np.flatnonzero((codes == ord("O")) | (codes == ord("*")))
+        if len(cols):
+            batch.append(np.column_stack((np.full(len(cols), row, dtype=np.int64), cols)))
+            pending += len(cols)
+            if pending >= BATCH_CELLS:
+                yield np.concatenate(batch)
+                batch, pending = [], 0
+        row += 1
+    if batch:
+        yield np.concatenate(batch)
+
+
+def write_cells(stream, array, name: str = None):
+    """Écrit une grille au format plaintext (.cells)."""
+    if name:
+        stream.write(f"!Name: {name}\n")
+    table = np.array([ord("."), ord("O")], dtype=np.uint8)
+    for row in np.asarray(array) != 0:
+        stream.write(table[row.astype(np.uint8)].tobytes().decode("ascii").rstrip(".") + "\n")
+
+
+# ---------------------------
+# Accès unifié
+# ---------------------------
+
+FORMATS = {".rle": "rle", ".cells": "cells"}
+
+
+def read_header(path) -> PatternInfo:
+    with open(path, "r", encoding="utf-8", errors="replace") as stream:
+        return read_rle_header(stream) if str(path).lower().endswith(".rle") else read_cells_header(stream)
+
+
+def iter_pattern_cells(path, chunk_size: int = CHUNK_SIZE):
+    """Lots de coordonnées (N, 2) des cellules vivantes d'un fichier .rle ou .cells."""
+    with open(path, "r", encoding="utf-8", errors="replace") as stream:
+        if str(path).lower().endswith(".rle"):
+            read_rle_header(stream)
+            yield from iter_rle_cells(stream, chunk_size)
+        else:
+            read_cells_header(stream)
+            yield from iter_cells_cells(stream)
+
+
+def crop(array):
+    """Réduit une grille au rectangle englobant ses cellules vivantes."""
+    array = np.asarray(array)
+    rows = np.flatnonzero(array.any(axis=1))
+    cols = np.flatnonzero(array.any(axis=0))
+    if not len(rows):
+        return array[:0, :0]
+    return array[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1]
@@ -0,0 +1,252 @@
+import bisect
+import struct
+import zlib
+from pathlib import Path
+
+import numpy as np
+
+# Enregistrement d'une partie sur disque (.golr), écrit au fil de l'eau :
+#
+#   en-tête  : "GOLR", version, 0, 0, lignes, colonnes, intervalle d'images clés
+#   blocs    : "CHNK", première image, nombre d'images, taille, données zlib
+#              (image clé en bits compactés, puis pour chaque image suivante :
+#              nombre de cellules modifiées + leurs indices à plat)
+#   index    : "INDX", nombre de blocs, (position, première image, nombre d'images)...
+#   fin      : position de l'index, "GEND"
+#
+# L'index n'est écrit qu'à la fermeture ; un fichier en cours d'écriture (ou
+# interrompu) est relu en parcourant les en-têtes de blocs.
+
+MAGIC = b"GOLR"
+VERSION = 1
+EXTENSION = ".golr"
+
+HEADER = struct.Struct("<4sBBHIII")
+CHUNK = struct.Struct("<4sQII")
+CHUNK_MAGIC = b"CHNK"
+INDEX_MAGIC = b"INDX"
+INDEX_ENTRY = np.dtype([("offset", "<u8"), ("first", "<u8"), ("count", "<u4")])
+TRAILER = struct.Struct("<Q4s")
+TRAILER_MAGIC = b"GEND"
+
+
+class RecordingError(ValueError):
+    pass
+
+
+def _index_dtype(size):
+    return np.dtype("<u4") if size < 2**32 else np.dtype("<u8")
+
+
+class Recorder:
+    # Écrit chaque image reçue ; un bloc (image clé + diffs) est compressé et
+    # écrit sur disque dès qu'il est complet, la mémoire utilisée reste bornée.
+
+    def __init__(self, path, shape, keyframe_interval: int = 128, level: int = 6):
+        self.path = Path(path)
+        self.shape = tuple(shape)
+        self.size = int(np.prod(self.shape))
+        self.keyframe_interval = max(1, keyframe_interval)
+        self.level = level
+        self.index_dtype = _index_dtype(self.size)
+
+        self._file = open(self.path, "wb")
+        self._file.write(HEADER.pack(MAGIC, VERSION, 0, 0, *self.shape, self.keyframe_interval))
+        self._index = []     # (position, première image, nombre d'images)
+        self._chunk = []     # morceaux du bloc en cours (non compressés)
+        self._chunk_first = 0
+        self._chunk_frames = 0
+        self._last = None    # dernière image enregistrée
+        self.frames = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._file is None
+
+    def append(self, cells, changes=None):
+        """Ajoute une image. `changes` : indices à plat des cellules modifiées, s’ils sont connus."""
+        cells = np.asarray(cells, dtype=np.uint8).reshape(self.shape)
+
+        if self._chunk_frames >= self.keyframe_interval or self._last is None:
+            self.flush()
+            self._chunk = [np.packbits(cells.reshape(-1) != 0).tobytes()]
+            self._chunk_first = self.frames
+            self._last = (cells != 0).astype(np.uint8)
+        else:
+            if changes is None:
+                changes = np.flatnonzero(cells.reshape(-1) != self._last.reshape(-1))
+            changes = np.asarray(changes, dtype=self.index_dtype)
+            self._chunk.append(struct.pack("<I", len(changes)))
+            self._chunk.append(changes.tobytes())
+            self._last.reshape(-1)[changes] ^= 1
+
+        self._chunk_frames += 1
+        self.frames += 1
+
+    def flush(self):
+        """Compresse et écrit le bloc en cours ; l'image suivante démarre un nouveau bloc."""
+        if not self._chunk_frames:
+            return
+        payload = zlib.compress(b"".join(self._chunk), self.level)
+        self._index.append((self._file.tell(), self._chunk_first, self._chunk_frames))
+        self._file.write(CHUNK.pack(CHUNK_MAGIC, self._chunk_first, self._chunk_frames, len(payload)))
+        self._file.write(payload)
+        self._file.flush()
+        self._chunk = []
+        self._chunk_frames = 0
+        self._last = None
+
+    def close(self):
+        """Écrit le dernier bloc puis l'index des images."""
+        if self._file is None:
+            return
+        self.flush()
+        index = np.array(self._index, dtype=INDEX_ENTRY)
+        index_offset = self._file.tell()
+        self._file.write(INDEX_MAGIC + struct.pack("<I", len(index)))
+        self._file.write(index.tobytes())
+        self._file.write(TRAILER.pack(index_offset, TRAILER_MAGIC))
+        self._file.close()
+        self._file = None
+
+
+class Recording:
+    # Lecture d'un enregistrement avec accès direct : seul le bloc contenant
+    # l'image demandée est décompressé (le dernier bloc lu reste en cache).
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        magic, version, _, _, rows, cols, interval = HEADER.unpack(self._read_exact(0, HEADER.size))
+        if magic != MAGIC:
+            raise RecordingError(f"{self.path} n'est pas un enregistrement")
+        if version != VERSION:
+            raise RecordingError(f"Version d'enregistrement non supportée : {version}")
+        self.rows, self.cols = rows, cols
+        self.shape = (rows, cols)
+        self.size = rows * cols
+        self.keyframe_interval = interval
+        self.index_dtype = _index_dtype(self.size)
+
+        self._index = np.empty(0, dtype=INDEX_ENTRY)
+        self._scan_from = HEADER.size
+        self._complete = False
+        self._chunk = None    # (numéro du bloc, image clé, diffs)
+        self._cached = None   # (image, tableau) de la dernière reconstruction
+        self.refresh()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        if not len(self._index):
+            return 0
+        last = self._index[-1]
+        return int(last["first"] + last["count"])
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        if index < 0:
+            index += len(self)
+        return self.frame(index)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _read_exact(self, offset, size):
+        self._file.seek(offset)
+        data = self._file.read(size)
+        if len(data) != size:
+            raise RecordingError(f"{self.path} est tronqué")
+        return data
+
+    # ---------------------------
+    # Index
+    # ---------------------------
+
+    def refresh(self):
+        """Relit l'index ; pour un enregistrement en cours, ajoute les blocs écrits depuis."""
+        if self._complete:
+            return
+        end = self._file.seek(0, 2)
+        if end >= HEADER.size + TRAILER.size:
+            index_offset, magic = TRAILER.unpack(self._read_exact(end - TRAILER.size, TRAILER.size))
+            if magic == TRAILER_MAGIC:
+                head = self._read_exact(index_offset, 8)
+                if head[:4] == INDEX_MAGIC:
+                    (count,) = struct.unpack("<I", head[4:])
+                    data = self._read_exact(index_offset + 8, count * INDEX_ENTRY.itemsize)
+                    self._index = np.frombuffer(data, dtype=INDEX_ENTRY)
+                    self._complete = True
+                    return
+
+        # Pas d'index final : parcours des en-têtes de blocs complets
+        entries = []
+        offset = self._scan_from
+        while offset + CHUNK.size <= end:
+            magic, first, count, length = CHUNK.unpack(self._read_exact(offset, CHUNK.size))
+            if magic != CHUNK_MAGIC or offset + CHUNK.size + length > end:
+                break
+            entries.append((offset, first, count))
+            offset += CHUNK.size + length
+        self._scan_from = offset
+        if entries:
+            self._index = np.concatenate((self._index, np.array(entries, dtype=INDEX_ENTRY)))
+
+    # ---------------------------
+    # Lecture
+    # ---------------------------
+
+    def _load_chunk(self, number):
+        if self._chunk is not None and self._chunk[0] == number:
+            return self._chunk
+        offset, first, count = self._index[number]
+        _, _, _, length = CHUNK.unpack(self._read_exact(int(offset), CHUNK.size))
+        data = zlib.decompress(self._read_exact(int(offset) + CHUNK.size, length))
+
+        key_bytes = (self.size + 7) // 8
+        key = np.unpackbits(np.frombuffer(data, dtype=np.uint8, count=key_bytes), count=self.size)
+        diffs = []
+        position = key_bytes
+        for _ in range(int(count) - 1):
+            (n,) = struct.unpack_from("<I", data, position)
+            position += 4
+            diffs.append(np.frombuffer(data, dtype=self.index_dtype, count=n, offset=position))
+            position += n * self.index_dtype.itemsize
+
+        self._chunk = (number, key, diffs)
+        return self._chunk
+
+    def frame(self, index: int) -> np.ndarray:
+        """Reconstruit l'image `index` depuis l'image clé de son bloc."""
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        number = bisect.bisect_right(self._index["first"], index) - 1
+        first = int(self._index[number]["first"])
+        _, key, diffs = self._load_chunk(number)
+
+        # Parcours séquentiel (slider) : on repart de la dernière reconstruction du bloc
+        if self._cached is not None and first <= self._cached[0] <= index:
+            start, image = self._cached
+        else:
+            start, image = first, key.copy()
+
+        for position in range(start + 1, index + 1):
+            image[diffs[position - first - 1]] ^= 1
+
+        self._cached = (index, image)
+        return image.reshape(self.shape).copy()
+
+
+def open_recording(path) -> Recording:
+    return Recording(path)
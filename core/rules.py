@@ -0,0 +1,91 @@
+import re
+from functools import lru_cache
+
+import numpy as np
+
+# Règles « Life-like » en notation B/S : B = nombres de voisins qui font naître
+# une cellule morte, S = nombres de voisins qui maintiennent une cellule vivante.
+
+NAMED_RULES = {
+    "Conway": "B3/S23",
+    "HighLife": "B36/S23",
+    "Day & Night": "B3678/S34678",
+    "Seeds": "B2/S",
+}
+_BY_NAME = {name.lower(): rule for name, rule in NAMED_RULES.items()}
+
+_BS = re.compile(r"^B([0-8]*)/S([0-8]*)$", re.I)
+_SB = re.compile(r"^S([0-8]*)/B([0-8]*)$", re.I)
+_LEGACY = re.compile(r"^([0-8]*)/([0-8]*)$")  # notation historique survie/naissance
+
+
+class RuleError(ValueError):
+    pass
+
+
+class Rule:
+    # Règle compilée une fois pour toutes :
+    #   table          : tableau (2, 9), table[état, voisins] -> nouvel état
+    #   birth_mask     : bit n levé si n voisins font naître (moteurs numpy)
+    #   survive_mask   : bit n levé si n voisins maintiennent en vie
+
+    __slots__ = ("birth", "survive", "table", "birth_mask", "survive_mask")
+
+    def __init__(self, birth, survive):
+        self.birth = frozenset(int(n) for n in birth)
+        self.survive = frozenset(int(n) for n in survive)
+        if not self.birth | self.survive <= set(range(9)):
+            raise RuleError(f"Nombre de voisins hors de 0-8 : {sorted(self.birth | self.survive)}")
+
+        table = np.zeros((2, 9), dtype=np.uint8)
+        table[0, sorted(self.birth)] = 1
+        table[1, sorted(self.survive)] = 1
+        table.setflags(write=False)
+        self.table = table
+        self.birth_mask = np.uint16(sum(1 << n for n in self.birth))
+        self.survive_mask = np.uint16(sum(1 << n for n in self.survive))
+
+    def __str__(self):
+        return f"B{''.join(map(str, sorted(self.birth)))}/S{''.join(map(str, sorted(self.survive)))}"
+
+    def __repr__(self):
+        return f"Rule({str(self)!r})"
+
+    def __eq__(self, other):
+        if isinstance(other, str):
+            other = parse_rule(other)
+        return isinstance(other, Rule) and (self.birth, self.survive) == (other.birth, other.survive)
+
+    def __hash__(self):
+        return hash((self.birth, self.survive))
+
+    def __reduce__(self):
+        return parse_rule, (str(self),)
+
+    @property
+    def births_from_nothing(self) -> bool:
+        """B0 : les cellules mortes sans voisin naissent (plan infini impossible)."""
+        return 0 in self.birth
+
+
+@lru_cache(maxsize=None)
+def _parse(text: str) -> Rule:
+    key = " ".join(text.strip().lower().split())
+    text = _BY_NAME.get(key, text.strip())
+    for pattern, order in ((_BS, "bs"), (_SB, "sb"), (_LEGACY, "sb")):
+        match = pattern.match(text)
+        if match:
+            first, second = match.groups()
+            birth, survive = (first, second) if order == "bs" else (second, first)
+            return Rule(birth, survive)
+    raise RuleError(f"Règle invalide : {text!r} (attendu par exemple B3/S23)")
+
+
+def parse_rule(rule) -> Rule:
+    """Rule, "B3/S23", "S23/B3", "23/3" ou nom connu ("HighLife"...) -> Rule compilée (en cache)."""
+    if isinstance(rule, Rule):
+        return rule
+    return _parse(str(rule))
+
+
+CONWAY = parse_rule("B3/S23")
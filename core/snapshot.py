@@ -0,0 +1,109 @@
+import mmap
+import struct
+
+import numpy as np
+
+from core.engines.bitpacked import BLOCK_ROWS, pack_rows, unpack_rows, words_per_row
+
+# Format binaire d'instantané (.gol) :
+#   en-tête  : magic "GOLS", version (u8), drapeaux (u8), longueur de la règle (u16),
+#              lignes (u32), colonnes (u32), puis la règle en ASCII (ex. "B3/S23"),
+#              complétée par des zéros jusqu'à un multiple de 8 octets ;
+#   corps    : pour chaque ligne, words_per_row(cols) mots uint64 little-endian,
+#              bit j du mot k = colonne 64k + j (disposition de BitPackedEngine).
+MAGIC = b"GOLS"
+VERSION = 1
+HEADER = struct.Struct("<4sBBHII")
+EXTENSION = ".gol"
+DEFAULT_RULE = "B3/S23"
+
+
+class SnapshotError(ValueError):
+    pass
+
+
+def _header_bytes(rows: int, cols: int, rule: str) -> bytes:
+    rule_bytes = rule.encode("ascii")
+    header = HEADER.pack(MAGIC, VERSION, 0, len(rule_bytes), rows, cols) + rule_bytes
+    return header + b"\0" * (-len(header) % 8)
+
+
+def save_snapshot(path, engine, rule: str = None):
+    """Écrit la grille d'un moteur (ou d'un tableau 2D) au format binaire compacté.
+
+    Par défaut la règle enregistrée est celle du moteur (Conway pour un tableau).
+    """
+    if isinstance(engine, np.ndarray):
+        rows, cols = engine.shape
+        words = pack_rows(engine)
+    else:
+        rows, cols = engine.rows, engine.cols
+        words = engine.to_packed()
+        rule = rule or str(engine.rule)
+    rule = rule or DEFAULT_RULE
+
+    with open(path, "wb") as f:
+        f.write(_header_bytes(rows, cols, rule))
+        for start in range(0, rows, BLOCK_ROWS):
+            f.write(np.ascontiguousarray(words[start:start + BLOCK_ROWS], dtype="<u8").data)
+
+
+class Snapshot:
+    # Instantané ouvert en mmap : `words` est une vue directe sur le fichier,
+    # sans lecture ni objet Python intermédiaire. À utiliser comme gestionnaire
+    # de contexte (le mmap est fermé à la sortie).
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise SnapshotError(f"Instantané vide : {path}")
+
+        if len(self._mmap) < HEADER.size:
+            self.close()
+            raise SnapshotError(f"Instantané tronqué : {path}")
+        magic, version, _flags, rule_len, self.rows, self.cols = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise SnapshotError(f"Format d'instantané non reconnu : {path}")
+
+        self.rule = bytes(self._mmap[HEADER.size:HEADER.size + rule_len]).decode("ascii")
+        offset = HEADER.size + rule_len
+        offset += -offset % 8
+        count = self.rows * words_per_row(self.cols)
+        if len(self._mmap) < offset + count * 8:
+            self.close()
+            raise SnapshotError(f"Instantané tronqué : {path}")
+
+        self.words = np.frombuffer(self._mmap, dtype="<u8", count=count, offset=offset)
+        self.words = self.words.reshape(self.rows, words_per_row(self.cols))
+
+    def to_array(self) -> np.ndarray:
+        return unpack_rows(self.words, self.cols)
+
+    def load_into(self, engine):
+        """Charge l'instantané dans un moteur de mêmes dimensions."""
+        if (engine.rows, engine.cols) != (self.rows, self.cols):
+            raise SnapshotError(
+                f"Dimensions incompatibles : instantané {self.rows}x{self.cols}, "
+                f"grille {engine.rows}x{engine.cols}"
+            )
+        engine.load_packed(self.words)
+
+    def close(self):
+        self.words = None
+        if getattr(self, "_mmap", None) is not None and not self._mmap.closed:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_snapshot(path) -> Snapshot:
+    return Snapshot(path)
@@ -0,0 +1,175 @@
+import time
+
+import numpy as np
+from PyQt6.QtWidgets import QWidget, QSizePolicy
+from PyQt6.QtGui import QColor, QImage, QPainter, QPen
+from PyQt6.QtCore import Qt, QPointF, QRect
+
+ALIVE_COLOR = QColor("#4CAF50")
+DEAD_COLOR = QColor("#DDDDDD")
+BACKGROUND_COLOR = QColor("#FFFFFF")
+
+MIN_ZOOM = 0.05
+MAX_ZOOM = 64.0
+GRID_LINES_ZOOM = 8.0  # en dessous de cette taille de cellule, pas de quadrillage
+MAX_DIRTY_RECTS = 64   # au-delà, on invalide le rectangle englobant des changements
+
+
+class GridCanvas(QWidget):
+    # Affichage de toute la grille dans un seul widget : les cellules sont un
+    # tampon uint8 (0 = morte, 1 = vivante) partagé avec une QImage indexée,
+    # dessinée en une seule opération. Molette = zoom, clic droit/milieu = déplacement,
+    # clic gauche (ou glisser) = édition des cellules.
+
+    def __init__(self, rows, cols, click_callback):
+        super().__init__()
+        self.rows = rows
+        self.cols = cols
+        self.click_callback = click_callback
+
+        # Lignes alignées sur 32 bits, comme l'exige QImage
+        stride = (cols + 3) // 4 * 4
+        self._pixels = np.zeros((rows, stride), dtype=np.uint8)
+        self._image = QImage(self._pixels.data, cols, rows, stride, QImage.Format.Format_Indexed8)
+        self._image.setColorTable([DEAD_COLOR.rgb(), ALIVE_COLOR.rgb()])
+
+        self.zoom = 25.0
+        self.offset = QPointF(0, 0)
+        self._pan_start = None
+        self._paint_state = None
+        self._last_cell = None
+        self.last_paint_ms = 0.0
+
+        self.setMinimumSize(200, 200)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.setMouseTracking(False)
+
+    # ============================================================
+    #                     DONNÉES
+    # ============================================================
+
+    def set_grid(self, grid):
+        """Copie la grille (tableau rows x cols) dans le tampon de l'image et redessine."""
+        self._pixels[:, :self.cols] = np.asarray(grid, dtype=np.uint8)
+        self.update()
+
+    def update_cells(self, changes, grid):
+        """Ne recopie et ne redessine que les cellules `changes` (tableau (N, 2))."""
+        if len(changes) == 0:
+            return
+        rows, cols = changes[:, 0], changes[:, 1]
+        self._pixels[rows, cols] = np.asarray(grid)[rows, cols]
+
+        if len(changes) <= MAX_DIRTY_RECTS:
+            for row, col in changes.tolist():
+                self.update(self._cell_rect(row, col, row, col))
+        else:
+            self.update(self._cell_rect(rows.min(), cols.min(), rows.max(), cols.max()))
+
+    def _cell_rect(self, top, left, bottom, right) -> QRect:
+        """Rectangle (coordonnées widget) couvrant les cellules [top..bottom] x [left..right]."""
+        x0 = int(self.offset.x() + left * self.zoom) - 1
+        y0 = int(self.offset.y() + top * self.zoom) - 1
+        x1 = int(self.offset.x() + (right + 1) * self.zoom) + 1
+        y1 = int(self.offset.y() + (bottom + 1) * self.zoom) + 1
+        return QRect(x0, y0, x1 - x0 + 1, y1 - y0 + 1)
+
+    def cell_alive(self, row, col) -> bool:
+        return bool(self._pixels[row, col])
+
+    # ============================================================
+    #                     VUE (zoom / déplacement)
+    # ============================================================
+
+    def fit_to_view(self):
+        """Ajuste le zoom pour afficher toute la grille, centrée."""
+        if not self.rows or not self.cols:
+            return
+        self.zoom = max(MIN_ZOOM, min(MAX_ZOOM, self.width() / self.cols, self.height() / self.rows))
+        self.offset = QPointF(
+            (self.width() - self.cols * self.zoom) / 2,
+            (self.height() - self.rows * self.zoom) / 2,
+        )
+        self.update()
+
+    def cell_at(self, pos):
+        """Cellule (ligne, colonne) sous un point du widget, ou None hors grille."""
+        col = int((pos.x() - self.offset.x()) // self.zoom)
+        row = int((pos.y() - self.offset.y()) // self.zoom)
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return row, col
+        return None
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.fit_to_view()
+
+    def paintEvent(self, event):
+        start = time.perf_counter()
+        painter = QPainter(self)
+        # Qt limite le dessin à la zone invalidée : seul event.rect() est repeint
+        painter.fillRect(event.rect(), BACKGROUND_COLOR)
+        painter.translate(self.offset)
+        painter.scale(self.zoom, self.zoom)
+        painter.drawImage(QPointF(0, 0), self._image)
+
+        if self.zoom >= GRID_LINES_ZOOM:
+            self._draw_grid_lines(painter)
+        painter.end()
+        self.last_paint_ms = (time.perf_counter() - start) * 1000
+
+    def _draw_grid_lines(self, painter):
+        """Quadrillage limité aux cellules visibles."""
+        painter.setPen(QPen(BACKGROUND_COLOR, 0))
+        first_col = max(0, int(-self.offset.x() // self.zoom))
+        last_col = min(self.cols, int((self.width() - self.offset.x()) // self.zoom) + 1)
+        first_row = max(0, int(-self.offset.y() // self.zoom))
+        last_row = min(self.rows, int((self.height() - self.offset.y()) // self.zoom) + 1)
+        for c in range(first_col, last_col + 1):
+            painter.drawLine(QPointF(c, first_row), QPointF(c, last_row))
+        for r in range(first_row, last_row + 1):
+            painter.drawLine(QPointF(first_col, r), QPointF(last_col, r))
+
+    # ============================================================
+    #                     SOURIS
+    # ============================================================
+
+    def wheelEvent(self, event):
+        factor = 1.25 if event.angleDelta().y() > 0 else 0.8
+        new_zoom = max(MIN_ZOOM, min(MAX_ZOOM, self.zoom * factor))
+        # Zoom centré sur le curseur
+        pos = event.position()
+        self.offset = pos - (pos - self.offset) * (new_zoom / self.zoom)
+        self.zoom = new_zoom
+        self.update()
+
+    def mousePressEvent(self, event):
+        if event.button() in (Qt.MouseButton.RightButton, Qt.MouseButton.MiddleButton):
+            self._pan_start = event.position() - self.offset
+            return
+        if event.button() == Qt.MouseButton.LeftButton:
+            cell = self.cell_at(event.position())
+            if cell is None:
+                return
+            # Le premier clic fixe l'état appliqué pendant le glisser
+            self._paint_state = not self.cell_alive(*cell)
+            self._toggle(cell)
+
+    def mouseMoveEvent(self, event):
+        if self._pan_start is not None:
+            self.offset = event.position() - self._pan_start
+            self.update()
+        elif self._paint_state is not None:
+            cell = self.cell_at(event.position())
+            if cell is not None and cell != self._last_cell and self.cell_alive(*cell) != self._paint_state:
+                self._toggle(cell)
+
+    def mouseReleaseEvent(self, event):
+        self._pan_start = None
+        self._paint_state = None
+        self._last_cell = None
+        self.last_paint_ms = 0.0
+
+    def _toggle(self, cell):
+        self._last_cell = cell
+        self.click_callback(cell[0], cell[1], self._paint_state)
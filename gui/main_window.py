@@ -1,16 +1,22 @@
 import logging
 import sys
+import time
 from pathlib import Path
+
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QPushButton, QGridLayout, QSlider, QFrame, QSpacerItem,
+    QLabel, QPushButton, QSlider, QFrame, QSpacerItem,
     QSizePolicy, QComboBox, QFileDialog
 )
 from PyQt6.QtCore import Qt, QTimer
 from core.config import Config
 from core.game import GameOfLife
-from .cell_widget import CellWidget
+from core.metrics import Metrics
+from core.rules import NAMED_RULES, RuleError, parse_rule
+from core.recording import EXTENSION as RECORDING_EXTENSION, RecordingError, open_recording
+from .grid_canvas import GridCanvas
 from .pattern_manager import PatternManager
+from .simulation_worker import SimulationWorker
 from core.version import get_version
 
 logger = logging.getLogger(__name__)
@@ -21,12 +27,28 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Jeu de la Vie — Patterns Sauvegardés")
         self.setGeometry(100, 100, 1000, 600)
 
-        self.rows, self.cols = 20, 20
-        self.game = GameOfLife(self.rows, self.cols)
+        self.rows, self.cols = Config.GRID_SIZE
+        self.boundary = Config.BOUNDARY
+        self.rule = parse_rule(Config.RULE)
+        # Mesures par génération (temps de calcul, d'historique, de rendu), conservées entre les jeux
+        self.metrics = Metrics(Config.METRICS_CAPACITY) if Config.DEBUG or Config.METRICS else None
+        self.game = self.new_game()
+
+        # La simulation tourne dans son propre thread ; la GUI affiche la dernière image
+        self.worker = SimulationWorker(self.game)
+        self.worker.extinct.connect(self.on_extinct)
+        self.worker.cycle_found.connect(self.on_cycle_found)
+        self.worker.start()
 
+        # Rafraîchissement de l'affichage (~60 images/s), indépendant de la simulation
         self.timer = QTimer()
-        self.timer.timeout.connect(self.update_generation)
+        self.timer.timeout.connect(self.render_frame)
+        self.frames_rendered = 0
+        self._stats_time = time.perf_counter()
+        self._stats_generations = 0
+        self._stats_frames = 0
         self.pattern_manager = PatternManager()
+        self.replay = None  # enregistrement .golr parcouru avec la timeline (mode debug)
 
         # --- Layout principal ---
         central_widget = QWidget()
@@ -39,20 +61,14 @@ class MainWindow(QMainWindow):
         # ============================================================
         #                     GRILLE GRAPHIQUE
         # ============================================================
+        # Un seul widget (QImage) pour toute la grille : zoom molette, déplacement clic droit
         self.grid_frame = QFrame()
         self.grid_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        self.grid_layout = QGridLayout()
-        self.grid_layout.setSpacing(1)
-        self.grid_frame.setLayout(self.grid_layout)
-        self.cells = []
-
-        for r in range(self.rows):
-            row_cells = []
-            for c in range(self.cols):
-                cell = CellWidget(r, c, self.on_cell_clicked)
-                self.grid_layout.addWidget(cell, r, c)
-                row_cells.append(cell)
-            self.cells.append(row_cells)
+        grid_layout = QVBoxLayout()
+        grid_layout.setContentsMargins(0, 0, 0, 0)
+        self.grid_frame.setLayout(grid_layout)
+        self.canvas = GridCanvas(self.rows, self.cols, self.on_cell_clicked)
+        grid_layout.addWidget(self.canvas)
 
         # ============================================================
         #                       DASHBOARD
@@ -73,8 +89,21 @@ class MainWindow(QMainWindow):
         self.reset_button = QPushButton("🔄 Réinitialiser")
         self.reset_button.clicked.connect(self.reset_grid)
 
+        self.fit_button = QPushButton("🔍 Ajuster la vue")
+        self.fit_button.clicked.connect(self.canvas.fit_to_view)
+
         dash_layout.addWidget(self.start_button)
         dash_layout.addWidget(self.reset_button)
+        dash_layout.addWidget(self.fit_button)
+
+        # --- Débits : simulation et affichage ---
+        self.generation_rate_label = QLabel("Générations/s : 0")
+        self.fps_label = QLabel("Images/s : 0")
+        self.cycle_label = QLabel("")
+        self.cycle_label.setWordWrap(True)
+        dash_layout.addWidget(self.generation_rate_label)
+        dash_layout.addWidget(self.fps_label)
+        dash_layout.addWidget(self.cycle_label)
 
         # ============================================================
         # DEBUG → Boutons Précédent / Suivant
@@ -101,24 +130,62 @@ class MainWindow(QMainWindow):
             self.timeline_slider.valueChanged.connect(self.on_timeline_changed)
             dash_layout.addWidget(self.timeline_slider)
 
+            # --- Enregistrement sur disque / relecture ---
+            self.record_button = QPushButton("⏺ Enregistrer")
+            self.record_button.clicked.connect(self.toggle_recording)
+            self.open_recording_button = QPushButton("📼 Ouvrir un enregistrement")
+            self.open_recording_button.clicked.connect(self.open_recording)
+            dash_layout.addWidget(self.record_button)
+            dash_layout.addWidget(self.open_recording_button)
+
+            # --- Coût d'affichage de la dernière frame ---
+            self.frame_cost_label = QLabel("Rendu : -")
+            self.frame_cost_label.setWordWrap(True)
+            dash_layout.addWidget(self.frame_cost_label)
+
+            self.export_metrics_button = QPushButton("📊 Exporter les mesures")
+            self.export_metrics_button.clicked.connect(self.export_metrics)
+            dash_layout.addWidget(self.export_metrics_button)
+
 
         # ============================================================
         #               Vitesse de simulation
         # ============================================================
-        dash_layout.addWidget(QLabel("Vitesse (ms):"))
+        dash_layout.addWidget(QLabel("Délai entre générations (ms, 0 = max):"))
         self.speed_slider = QSlider(Qt.Orientation.Horizontal)
-        self.speed_slider.setMinimum(50)
+        self.speed_slider.setMinimum(0)
         self.speed_slider.setMaximum(1000)
-        self.speed_slider.setValue(200)
+        self.speed_slider.setValue(Config.DEFAULT_SPEED)
         self.speed_slider.valueChanged.connect(self.change_speed)
         dash_layout.addWidget(self.speed_slider)
+        self.change_speed()
+
+        # ============================================================
+        #                  Bords de la grille
+        # ============================================================
+        dash_layout.addWidget(QLabel("Bords :"))
+        self.boundary_combo = QComboBox()
+        for mode, label in (("dead", "Cellules mortes"), ("torus", "Tore"), ("mirror", "Miroir")):
+            self.boundary_combo.addItem(label, mode)
+        self.boundary_combo.setCurrentIndex(self.boundary_combo.findData(self.boundary))
+        self.boundary_combo.currentIndexChanged.connect(self.change_boundary)
+        dash_layout.addWidget(self.boundary_combo)
+
+        # --- Règle B/S ---
+        dash_layout.addWidget(QLabel("Règle :"))
+        self.rule_combo = QComboBox()
+        for name, rule in NAMED_RULES.items():
+            self.rule_combo.addItem(f"{name} ({rule})", rule)
+        self.select_rule_item(self.rule)
+        self.rule_combo.currentIndexChanged.connect(self.change_rule)
+        dash_layout.addWidget(self.rule_combo)
 
         # ============================================================
         #                  Patterns prédéfinis
         # ============================================================
         dash_layout.addWidget(QLabel("Charger un Pattern:"))
         self.pattern_combo = QComboBox()
-        self.pattern_combo.addItems(self.pattern_manager.get_builtin_patterns())
+        self.refresh_pattern_combo()
         self.pattern_combo.currentTextChanged.connect(self.load_pattern)
         dash_layout.addWidget(self.pattern_combo)
 
@@ -138,143 +205,343 @@ class MainWindow(QMainWindow):
                                         QSizePolicy.Policy.Expanding))
 
         # Assemble layout
-        self.main_layout.addWidget(self.grid_frame)
+        self.main_layout.addWidget(self.grid_frame, 1)
         self.main_layout.addWidget(self.dashboard)
 
+        self.timer.start(Config.RENDER_INTERVAL)
+
     # ============================================================
     #                     MISE À JOUR GRILLE
     # ============================================================
 
     def refresh_cells(self):
-        """Met à jour l'UI selon l'état de self.game.grid."""
-        for r in range(self.rows):
-            for c in range(self.cols):
-                alive = bool(self.game.grid[r][c])
-                self.cells[r][c].alive = alive
-                self.cells[r][c].update_color()
+        """Dessine la dernière image publiée par le worker, s'il y en a une nouvelle."""
+        if self.worker.consume(self.draw_frame):
+            self.frames_rendered += 1
+            return True
+        return False
+
+    def publish_state(self):
+        """Après une action de la GUI sur le jeu : publie et affiche l'état courant."""
+        with self.worker.lock:
+            self.worker.publish()
+        self.refresh_cells()
+
+    def draw_frame(self, grid, changes=None):
+        """Copie une image dans le canvas.
+
+        Avec `changes` (cellules (N, 2) modifiées), seules ces cellules sont
+        recopiées et redessinées ; sinon toute la grille est rafraîchie.
+        """
+        start = time.perf_counter()
+        if changes is None or len(changes) * 4 > self.rows * self.cols:
+            self.canvas.set_grid(grid)
+            count = self.rows * self.cols
+        else:
+            self.canvas.update_cells(changes, grid)
+            count = len(changes)
+
+        update_ms = (time.perf_counter() - start) * 1000
+        if self.metrics is not None:
+            # Le dessin est asynchrone : on compte celui de l'image précédente
+            self.metrics.record_render(update_ms + self.canvas.last_paint_ms)
+        if Config.DEBUG:
+            self.frame_cost_label.setText(
+                f"Rendu : {count} cellules, maj {update_ms:.2f} ms, "
+                f"dessin {self.canvas.last_paint_ms:.2f} ms"
+            )
 
     # ============================================================
     #                     ÉVÉNEMENTS UI
     # ============================================================
 
     def on_cell_clicked(self, row, col, alive):
-        self.game.set_cell(row, col, 1 if alive else 0)
-        self.refresh_cells()
+        with self.worker.lock:
+            self.game.set_cell(row, col, 1 if alive else 0)
+        self.publish_state()
+
+    def pause_simulation(self):
+        self.worker.pause()
+        self.start_button.setText("▶️ Démarrer")
 
     def toggle_simulation(self):
-        if self.timer.isActive():
-            self.timer.stop()
-            self.start_button.setText("▶️ Démarrer")
+        if self.worker.running:
+            self.pause_simulation()
         else:
-            self.timer.start(self.speed_slider.value())
+            self.cycle_label.setText("")
+            self.worker.resume()
             self.start_button.setText("⏸️ Pause")
 
-    def update_generation(self):
-        alive = self.game.next_generation()
-
+    def on_extinct(self):
         # Stop si grille morte
-        if alive is False:
-            self.timer.stop()
-            self.start_button.setText("▶️ Démarrer")
-
-        self.refresh_cells()
+        self.start_button.setText("▶️ Démarrer")
 
+    def on_cycle_found(self, start, period):
+        # Le worker s'est mis en pause ; « Démarrer » reprend malgré le cycle
+        self.start_button.setText("▶️ Démarrer")
+        kind = "Vie stable" if period == 1 else f"Cycle de période {period}"
+        self.cycle_label.setText(f"{kind} depuis la génération {start}")
+
+    def render_frame(self):
+        """Tick d'affichage : dessine la dernière génération et met à jour les débits."""
+        if self.refresh_cells() and Config.DEBUG:
+            self.update_timeline()
+
+        now = time.perf_counter()
+        elapsed = now - self._stats_time
+        if elapsed >= 0.5:
+            generations = self.worker.generations
+            self.generation_rate_label.setText(
+                f"Générations/s : {(generations - self._stats_generations) / elapsed:.0f}"
+            )
+            self.fps_label.setText(f"Images/s : {(self.frames_rendered - self._stats_frames) / elapsed:.0f}")
+            self._stats_time = now
+            self._stats_generations = generations
+            self._stats_frames = self.frames_rendered
+
+    def update_timeline(self):
         # Mise à jour slider sans déclencher on_timeline_changed()
-        if Config.DEBUG:
-            self.timeline_slider.blockSignals(True)
+        self.timeline_slider.blockSignals(True)
+        if self.replay is not None:
+            self.replay.refresh()  # l'enregistrement peut encore être en cours d'écriture
+            self.timeline_slider.setMaximum(max(len(self.replay) - 1, 0))
+        elif self.game.history is not None:
             self.timeline_slider.setMaximum(len(self.game.history) - 1)
             self.timeline_slider.setValue(self.game.current_index)
-            self.timeline_slider.blockSignals(False)
+        self.timeline_slider.blockSignals(False)
 
     def on_timeline_changed(self, index):
         if not Config.DEBUG:
             return
 
-        self.timer.stop()
-        self.game.restore_state(index)
-        self.refresh_cells()
+        self.pause_simulation()
+        with self.worker.lock:
+            if self.replay is not None:
+                # Accès direct à la génération dans le fichier, sans rejouer la simulation ;
+                # l'affectation resynchronise historique, enregistrement en cours et cycles
+                self.game.grid = self.replay.frame(index)
+            else:
+                self.game.restore_state(index)
+        self.publish_state()
+
+    def toggle_recording(self):
+        with self.worker.lock:
+            if self.game.recorder is not None:
+                self.game.stop_recording()
+            else:
+                path = self.pattern_manager.data_dir / f"run_{time.strftime('%Y%m%d_%H%M%S')}{RECORDING_EXTENSION}"
+                self.game.start_recording(path)
+                logging.info(f"Enregistrement dans {path}")
+        self.update_record_button()
+
+    def update_record_button(self):
+        recording = self.game.recorder is not None
+        self.record_button.setText("⏹ Arrêter l’enregistrement" if recording else "⏺ Enregistrer")
+
+    def open_recording(self):
+        filename, _ = QFileDialog.getOpenFileName(
+            self, "Ouvrir un enregistrement",
+            str(self.pattern_manager.data_dir),
+            f"Enregistrements (*{RECORDING_EXTENSION})"
+        )
+        if not filename:
+            return
+
+        try:
+            replay = open_recording(filename)
+        except (OSError, RecordingError) as exc:
+            logging.warning(f"Enregistrement illisible : {exc}")
+            return
+        if replay.shape != (self.rows, self.cols) or not len(replay):
+            logging.warning(f"Enregistrement {replay.rows}x{replay.cols} incompatible avec la grille")
+            replay.close()
+            return
+
+        self.pause_simulation()
+        self.close_replay()
+        self.replay = replay
+        self.update_timeline()
+        self.timeline_slider.setValue(0)
+        self.on_timeline_changed(0)
+
+    def export_metrics(self):
+        filename, _ = QFileDialog.getSaveFileName(
+            self, "Exporter les mesures",
+            str(self.pattern_manager.data_dir / "metrics.json"),
+            "JSON Files (*.json)"
+        )
+        if filename:
+            with self.worker.lock:
+                self.metrics.dump(filename)
+            logging.info(f"Mesures exportées dans {filename}")
+
+    def close_replay(self):
+        if self.replay is not None:
+            self.replay.close()
+            self.replay = None
 
 
     def reset_grid(self):
-        self.timer.stop()
-        self.start_button.setText("▶️ Démarrer")
-        self.game = GameOfLife(self.rows, self.cols)
-        self.refresh_cells()
+        self.pause_simulation()
+        self.close_replay()
+        with self.worker.lock:
+            self.game.close()
+            self.game = self.new_game()
+            self.worker.game = self.game
+        self.cycle_label.setText("")
+        self.publish_state()
+        if Config.DEBUG:
+            self.update_record_button()
+
+    def new_game(self):
+        return GameOfLife(self.rows, self.cols, engine=Config.ENGINE, boundary=self.boundary, rule=self.rule,
+                          metrics=self.metrics)
+
+    def change_boundary(self):
+        self.boundary = self.boundary_combo.currentData()
+        self.rebuild_game()
+
+    def select_rule_item(self, rule):
+        """Sélectionne la règle dans la liste (ajoutée si elle n’y est pas), sans signal."""
+        index = self.rule_combo.findData(str(rule))
+        if index < 0:
+            self.rule_combo.addItem(str(rule), str(rule))
+            index = self.rule_combo.count() - 1
+        self.rule_combo.blockSignals(True)
+        self.rule_combo.setCurrentIndex(index)
+        self.rule_combo.blockSignals(False)
+
+    def change_rule(self):
+        self.rule = parse_rule(self.rule_combo.currentData())
+        self.rebuild_game()
+
+    def use_pattern_rule(self, filename):
+        """Adopte la règle enregistrée avec un pattern sauvegardé, si elle diffère."""
+        try:
+            rule = self.pattern_manager.pattern_rule(filename)
+            rule = parse_rule(rule) if rule else None
+        except RuleError as exc:
+            logging.warning(f"Règle du pattern ignorée : {exc}")
+            return
+        if rule is not None and rule != self.rule:
+            self.rule = rule
+            self.select_rule_item(rule)
+            self.rebuild_game()
+
+    def rebuild_game(self):
+        """Recrée le jeu (bords ou règle changés) en conservant les cellules affichées."""
+        self.pause_simulation()
+        self.close_replay()
+        with self.worker.lock:
+            cells = self.game.engine.to_array().copy()
+            self.game.close()
+            self.game = self.new_game()
+            self.game.grid = cells
+            self.worker.game = self.game
+        self.cycle_label.setText("")
+        self.publish_state()
+        if Config.DEBUG:
+            self.update_record_button()
 
     def change_speed(self):
-        if self.timer.isActive():
-            self.timer.start(self.speed_slider.value())
+        self.worker.interval = self.speed_slider.value() / 1000
+
+    def closeEvent(self, event):
+        self.timer.stop()
+        self.worker.stop()
+        self.close_replay()
+        self.game.close()
+        super().closeEvent(event)
 
     # ============================================================
     #               CONTROLES DEBUG (⏪ / ⏩)
     # ============================================================
 
     def go_previous(self):
-        self.timer.stop()
-        self.game.previous_generation()
-        self.refresh_cells()
+        if self.replay is not None:
+            self.timeline_slider.setValue(self.timeline_slider.value() - 1)
+            return
+        self.pause_simulation()
+        with self.worker.lock:
+            self.game.previous_generation()
+        self.publish_state()
 
         if Config.DEBUG:
-            self.timeline_slider.setValue(self.game.current_index)
+            self.update_timeline()
 
     def go_forward(self):
-        self.timer.stop()
+        if self.replay is not None:
+            self.timeline_slider.setValue(self.timeline_slider.value() + 1)
+            return
+        self.pause_simulation()
 
-        # Si nous sommes à la fin → calcule une nouvelle génération
-        if self.game.current_index == len(self.game.history) - 1:
-            alive = self.game.next_generation()
-            if alive is False:
-                # grille morte → stopper
-                return
-        else:
-            self.game.restore_state(self.game.current_index + 1)
+        with self.worker.lock:
+            # Si nous sommes à la fin → calcule une nouvelle génération
+            if self.game.current_index == len(self.game.history) - 1:
+                alive = self.game.next_generation()
+                if alive is False:
+                    # grille morte → stopper
+                    return
+            else:
+                self.game.restore_state(self.game.current_index + 1)
 
-        self.refresh_cells()
+        self.publish_state()
 
         if Config.DEBUG:
-            self.timeline_slider.setMaximum(len(self.game.history) - 1)
-            self.timeline_slider.setValue(self.game.current_index)
+            self.update_timeline()
 
 
     # ============================================================
     #                GESTION DES PATTERNS
     # ============================================================
 
+    def refresh_pattern_combo(self):
+        """Patterns prédéfinis puis patterns sauvegardés (lus depuis l’index, sans les charger)."""
+        self.pattern_combo.blockSignals(True)
+        current = self.pattern_combo.currentText()
+        self.pattern_combo.clear()
+        self.pattern_combo.addItems(self.pattern_manager.get_builtin_patterns())
+        for entry in self.pattern_manager.catalog.refresh():
+            self.pattern_combo.addItem(entry["name"])
+            self.pattern_combo.setItemData(
+                self.pattern_combo.count() - 1,
+                f"{entry['rows']}x{entry['cols']} — {entry['population']} cellules",
+                Qt.ItemDataRole.ToolTipRole,
+            )
+        if current:
+            self.pattern_combo.setCurrentText(current)
+        self.pattern_combo.blockSignals(False)
+
     def load_pattern(self, name):
         self.reset_grid()
-        coords = self.pattern_manager.get_builtin_pattern(name)
-
-        start_row = self.rows // 2 - 2
-        start_col = self.cols // 2 - 2
-
-        for r, c in coords:
-            row = start_row + r
-            col = start_col + c
-            if 0 <= row < self.rows and 0 <= col < self.cols:
-                self.cells[row][col].alive = True
-                self.cells[row][col].update_color()
-                self.game.set_cell(row, col, 1)
-
-        self.refresh_cells()
+        if name in self.pattern_manager.get_builtin_patterns():
+            coords = self.pattern_manager.get_builtin_pattern(name)
+            start_row = self.rows // 2 - 2
+            start_col = self.cols // 2 - 2
+            with self.worker.lock:
+                self.pattern_manager.apply_pattern(self.game, coords, (start_row, start_col))
+        else:
+            # Pattern sauvegardé : corps chargé à la demande (cache LRU), centré via l’index
+            self.use_pattern_rule(name)
+            origin = self.pattern_manager.centered_origin(name, self.rows, self.cols)
+            with self.worker.lock:
+                self.pattern_manager.load_into(self.game, name, origin)
+        self.publish_state()
 
     def save_pattern(self):
-        coords = []
-        for r, row in enumerate(self.cells):
-            for c, cell in enumerate(row):
-                if cell.alive:
-                    coords.append((r, c))
-
-        if not coords:
+        if not self.game.engine.population():
             return
 
         filename, _ = QFileDialog.getSaveFileName(
             self, "Sauvegarder Pattern",
             str(self.pattern_manager.data_dir),
-            "JSON Files (*.json)"
+            "JSON Files (*.json);;RLE (*.rle);;Plaintext (*.cells);;Instantané binaire (*.gol)"
         )
 
         if filename:
-            self.pattern_manager.save_pattern(coords, Path(filename).name)
+            with self.worker.lock:
+                self.pattern_manager.export_pattern(self.game, Path(filename).name)
+            self.refresh_pattern_combo()
 
     def load_pattern_file(self):
         saved = self.pattern_manager.list_saved_patterns()
@@ -284,20 +551,15 @@ class MainWindow(QMainWindow):
         filename, _ = QFileDialog.getOpenFileName(
             self, "Charger Pattern",
             str(self.pattern_manager.data_dir),
-            "JSON Files (*.json)"
+            "Patterns (*.json *.rle *.cells *.gol)"
         )
 
         if filename:
-            coords = self.pattern_manager.load_pattern(Path(filename).name)
             self.reset_grid()
-
-            for r, c in coords:
-                if 0 <= r < self.rows and 0 <= c < self.cols:
-                    self.cells[r][c].alive = True
-                    self.cells[r][c].update_color()
-                    self.game.set_cell(r, c, 1)
-
-            self.refresh_cells()
+            self.use_pattern_rule(Path(filename).name)
+            with self.worker.lock:
+                self.pattern_manager.load_into(self.game, Path(filename).name)
+            self.publish_state()
 
 
 if __name__ == "__main__":
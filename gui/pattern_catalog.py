@@ -0,0 +1,216 @@
+import hashlib
+import json
+import logging
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+from core.pattern_formats import iter_pattern_cells, read_header
+from core.snapshot import EXTENSION as SNAPSHOT_EXTENSION, open_snapshot
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = ".catalog.json"
+INDEX_VERSION = 2
+HASH_BLOCK = 1 << 20
+
+
+def file_hash(path) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def read_rule(path):
+    """Règle d'un pattern JSON au format {"rule", "cells"} (None pour une simple liste)."""
+    with open(path, "r") as f:
+        data = json.load(f)
+    return data.get("rule") if isinstance(data, dict) else None
+
+
+def read_pattern_rule(path):
+    """Règle enregistrée dans l'en-tête d'un fichier de pattern (None si absente)."""
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix in (".rle", ".cells"):
+        return read_header(path).rule
+    if suffix == ".json":
+        return read_rule(path)
+    if suffix == SNAPSHOT_EXTENSION:
+        with open_snapshot(path) as snapshot:
+            return snapshot.rule
+    return None
+
+
+def read_coords(path) -> np.ndarray:
+    """Cellules vivantes (N, 2) d'un fichier de pattern, quel que soit son format."""
+    suffix = path.suffix.lower()
+    if suffix == ".json":
+        with open(path, "r") as f:
+            data = json.load(f)
+        # Format enrichi {"cells": [...]} ou simple liste de [ligne, colonne]
+        cells = data.get("cells", []) if isinstance(data, dict) else data
+        return np.asarray(cells, dtype=np.int64).reshape(-1, 2)
+    if suffix == SNAPSHOT_EXTENSION:
+        with open_snapshot(path) as snapshot:
+            return np.argwhere(snapshot.to_array())
+    batches = list(iter_pattern_cells(path))
+    return np.concatenate(batches) if batches else np.empty((0, 2), dtype=np.int64)
+
+
+class PatternCatalog:
+    # Index des patterns d'un dossier, persistant dans data/.catalog.json :
+    # nom, format, taille, population, rectangle englobant et empreinte SHA-1.
+    # Une entrée n'est recalculée que si la taille ou la date du fichier change.
+    # Les cellules ne sont lues qu'à la demande, puis gardées dans un cache LRU
+    # borné en nombre total de cellules.
+
+    def __init__(self, data_dir, extensions, cache_cells: int = 5_000_000):
+        self.data_dir = Path(data_dir)
+        self.extensions = tuple(extensions)
+        self.cache_cells = cache_cells
+        self.index_path = self.data_dir / INDEX_FILENAME
+
+        self._entries = self._read_index()
+        self._cache = OrderedDict()   # (nom, empreinte) -> tableau (N, 2)
+        self._cached_cells = 0
+
+    # ---------------------------
+    # Index
+    # ---------------------------
+
+    def _read_index(self):
+        try:
+            with open(self.index_path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != INDEX_VERSION:
+            return {}
+        return {entry["name"]: entry for entry in data.get("entries", [])}
+
+    def _write_index(self):
+        # Dossier en lecture seule : l'index reste simplement en mémoire
+        tmp = self.index_path.with_suffix(".tmp")
+        try:
+            with open(tmp, "w") as f:
+                json.dump({"version": INDEX_VERSION, "entries": list(self._entries.values())}, f)
+            os.replace(tmp, self.index_path)
+        except OSError as exc:
+            logger.warning(f"Index des patterns non enregistré : {exc}")
+
+    def refresh(self):
+        """Met l'index à jour : seuls les fichiers ajoutés ou modifiés sont relus."""
+        changed = False
+        seen = set()
+        for item in os.scandir(self.data_dir):
+            # Fichiers cachés exclus (dont l'index lui-même)
+            if item.name.startswith(".") or not item.is_file() or not item.name.lower().endswith(self.extensions):
+                continue
+            seen.add(item.name)
+            changed |= self._update(item.name, item.stat())
+
+        for name in set(self._entries) - seen:
+            del self._entries[name]
+            changed = True
+
+        if changed:
+            self._write_index()
+        return self.entries()
+
+    def _update(self, name, stat) -> bool:
+        """Relit l'entrée `name` si sa taille ou sa date a changé ; True si l'index est modifié."""
+        entry = self._entries.get(name)
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return False
+
+        path = self.data_dir / name
+        digest = file_hash(path)
+        if entry and entry["hash"] == digest:
+            # Fichier simplement « touché » : contenu identique
+            entry["mtime_ns"] = stat.st_mtime_ns
+            return True
+        try:
+            entry = self._analyze(path, digest)
+        except (OSError, ValueError) as exc:
+            logger.warning(f"Pattern illisible ignoré : {name} ({exc})")
+            self._entries.pop(name, None)
+            return True
+        entry["size"] = stat.st_size
+        entry["mtime_ns"] = stat.st_mtime_ns
+        self._entries[name] = entry
+        return True
+
+    def _analyze(self, path, digest):
+        """Statistiques d'un fichier : population et rectangle englobant."""
+        suffix = path.suffix.lower()
+        entry = {"name": path.name, "format": suffix.lstrip("."), "hash": digest,
+                 "rule": read_pattern_rule(path)}
+        population = 0
+        bbox = None
+        batches = [read_coords(path)] if suffix in (".json", SNAPSHOT_EXTENSION) else iter_pattern_cells(path)
+        for cells in batches:
+            if not len(cells):
+                continue
+            population += len(cells)
+            low, high = cells.min(axis=0), cells.max(axis=0)
+            if bbox is not None:
+                low, high = np.minimum(low, bbox[:2]), np.maximum(high, bbox[2:])
+            bbox = np.concatenate((low, high))
+        entry["population"] = population
+        entry["bbox"] = bbox.tolist() if bbox is not None else None
+        entry["rows"] = int(bbox[2] - bbox[0] + 1) if bbox is not None else 0
+        entry["cols"] = int(bbox[3] - bbox[1] + 1) if bbox is not None else 0
+        return entry
+
+    def entries(self):
+        return [self._entries[name] for name in sorted(self._entries)]
+
+    def get(self, name):
+        return self._entries.get(name)
+
+    def invalidate(self, name):
+        """Oublie l'entrée `name` (fichier réécrit) : elle sera relue au prochain accès."""
+        self._entries.pop(name, None)
+
+    # ---------------------------
+    # Chargement paresseux + cache LRU
+    # ---------------------------
+
+    def load(self, name) -> np.ndarray:
+        """Cellules vivantes (N, 2) du pattern `name`, lues à la demande puis mises en cache.
+
+        Le fichier est revérifié (taille et date) à chaque appel : un pattern
+        réécrit depuis la dernière lecture est réanalysé.
+        """
+        path = self.data_dir / name
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            if self._entries.pop(name, None) is not None:
+                self._write_index()
+            raise
+        if self._update(name, stat):
+            self._write_index()
+        entry = self._entries.get(name)
+        if entry is None:
+            raise ValueError(f"Pattern illisible : {name}")
+
+        key = (name, entry["hash"])
+        cells = self._cache.get(key)
+        if cells is not None:
+            self._cache.move_to_end(key)
+            return cells
+
+        cells = read_coords(self.data_dir / name)
+        cells.setflags(write=False)
+        self._cache[key] = cells
+        self._cached_cells += len(cells)
+        while self._cached_cells > self.cache_cells and len(self._cache) > 1:
+            _, evicted = self._cache.popitem(last=False)
+            self._cached_cells -= len(evicted)
+        return cells
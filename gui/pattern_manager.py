@@ -2,6 +2,16 @@ import json
 import os
 from pathlib import Path
 
+import numpy as np
+
+from core.config import Config
+from core.pattern_formats import crop, iter_pattern_cells, write_cells, write_rle
+from core.snapshot import EXTENSION as SNAPSHOT_EXTENSION, open_snapshot, save_snapshot
+from .pattern_catalog import PatternCatalog
+
+# Extensions reconnues pour les patterns sauvegardés
+PATTERN_EXTENSIONS = (".json", SNAPSHOT_EXTENSION, ".rle", ".cells")
+
 # --- Patterns prédéfinis ---
 PATTERNS = {
     "Glider": [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)],
@@ -11,9 +21,17 @@ PATTERNS = {
 }
 
 class PatternManager:
-    def __init__(self):
-        self.data_dir = Path("data")
-        self.data_dir.mkdir(exist_ok=True)
+    def __init__(self, data_dir="data"):
+        self.data_dir = Path(data_dir)
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        self._catalog = None
+
+    @property
+    def catalog(self):
+        """Index des patterns sauvegardés (créé au premier usage)."""
+        if self._catalog is None:
+            self._catalog = PatternCatalog(self.data_dir, PATTERN_EXTENSIONS, Config.PATTERN_CACHE_CELLS)
+        return self._catalog
 
     def get_builtin_patterns(self):
         return list(PATTERNS.keys())
@@ -21,17 +39,112 @@ class PatternManager:
     def get_builtin_pattern(self, name):
         return PATTERNS.get(name, [])
 
-    def save_pattern(self, coords, filename):
+    def apply_pattern(self, game, coords, origin=(0, 0)):
+        """Place un pattern sur la grille en une seule édition groupée."""
+        if len(coords) == 0:
+            return
+        game.set_cells(np.asarray(coords, dtype=np.int64).reshape(-1, 2) + origin)
+
+    def save_pattern(self, coords, filename, rule=None):
+        """Sauvegarde JSON : liste de [ligne, colonne], ou {"rule", "cells"} si la règle est donnée."""
         path = self.data_dir / filename
         with open(path, "w") as f:
-            json.dump(coords, f)
+            json.dump({"rule": str(rule), "cells": coords} if rule else coords, f)
+        self._written(filename)
 
     def load_pattern(self, filename):
         path = self.data_dir / filename
         if path.exists():
-            with open(path, "r") as f:
-                return json.load(f)
+            return self.catalog.load(filename).tolist()
         return []
 
+    def save_snapshot(self, game, filename, rule=None):
+        """Sauvegarde la grille complète au format binaire compacté (.gol)."""
+        save_snapshot(self.data_dir / filename, game.engine, rule)
+        self._written(filename)
+
+    def export_pattern(self, game, filename, rule=None):
+        """Sauvegarde la grille du jeu ; le format dépend de l'extension.
+
+        .gol : grille complète ; .rle / .cells / .json : cellules vivantes
+        (rectangle englobant pour RLE et plaintext). La règle du jeu est
+        enregistrée (sauf en plaintext, qui n'a pas d'en-tête de règle).
+        Sur un plan infini, .gol ne garde que la fenêtre rows x cols, les
+        autres formats tout le plan.
+        """
+        rule = str(rule or game.rule)
+        path = self.data_dir / filename
+        suffix = path.suffix.lower()
+        if suffix == SNAPSHOT_EXTENSION:
+            self.save_snapshot(game, filename, rule)
+        elif suffix in (".rle", ".cells"):
+            cells = crop(self._live_array(game))
+            with open(path, "w", encoding="utf-8") as f:
+                if suffix == ".rle":
+                    write_rle(f, cells, rule=rule, name=path.stem)
+                else:
+                    write_cells(f, cells, name=path.stem)
+            self._written(filename)
+        else:
+            coords = game.engine.live_cells() if game.unbounded else np.argwhere(game.engine.to_array())
+            self.save_pattern(coords.tolist(), filename, rule)
+
+    def _written(self, filename):
+        # Même taille et même date possibles après réécriture : l'entrée est oubliée
+        if self._catalog is not None:
+            self._catalog.invalidate(filename)
+
+    @staticmethod
+    def _live_array(game):
+        """Grille du jeu ; sur un plan infini, rectangle englobant de toute la zone vivante."""
+        if not game.unbounded:
+            return game.engine.to_array()
+        cells = game.engine.live_cells()
+        if not len(cells):
+            return np.zeros((0, 0), dtype=np.uint8)
+        cells -= cells.min(axis=0)
+        array = np.zeros(tuple(cells.max(axis=0) + 1), dtype=np.uint8)
+        array[cells[:, 0], cells[:, 1]] = 1
+        return array
+
+    def load_into(self, game, filename, origin=(0, 0)):
+        """Charge un fichier de pattern (JSON, RLE, .cells ou instantané .gol) sur la grille.
+
+        RLE et .cells sont décodés par blocs directement en éditions groupées ;
+        un instantané de mêmes dimensions est décompressé depuis le mmap dans la
+        grille du moteur.
+        """
+        path = self.data_dir / filename
+        suffix = path.suffix.lower()
+        if suffix in (".rle", ".cells"):
+            with game.batch():
+                for cells in iter_pattern_cells(path):
+                    game.set_cells(cells + origin)
+            return
+        if suffix != SNAPSHOT_EXTENSION:
+            self.apply_pattern(game, self.catalog.load(filename), origin)
+            return
+
+        with open_snapshot(path) as snapshot:
+            if (snapshot.rows, snapshot.cols) == (game.rows, game.cols) and tuple(origin) == (0, 0):
+                snapshot.load_into(game.engine)
+                game.save_state()
+            else:
+                self.apply_pattern(game, np.argwhere(snapshot.to_array()), origin)
+
     def list_saved_patterns(self):
-        return [f.name for f in self.data_dir.glob("*.json")]
+        return [entry["name"] for entry in self.catalog.refresh()]
+
+    def pattern_rule(self, filename):
+        """Règle enregistrée avec un pattern sauvegardé (None si le format n'en a pas)."""
+        self.catalog.refresh()
+        entry = self.catalog.get(filename)
+        return entry["rule"] if entry else None
+
+    def centered_origin(self, filename, rows, cols):
+        """Décalage qui centre un pattern sauvegardé sur une grille rows x cols."""
+        entry = self.catalog.get(filename)
+        if not entry or not entry["bbox"]:
+            return (0, 0)
+        top, left = entry["bbox"][:2]
+        return (rows - entry["rows"]) // 2 - top, (cols - entry["cols"]) // 2 - left
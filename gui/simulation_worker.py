@@ -0,0 +1,135 @@
+import threading
+import time
+
+import numpy as np
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from core.metrics import profile_thread
+
+
+class SimulationWorker(QThread):
+    # Fait avancer la simulation hors du thread GUI, aussi vite que possible ou
+    # avec un délai minimal entre générations. Chaque image calculée est publiée
+    # dans un double tampon ; la GUI ne dessine que la dernière image disponible
+    # (les images intermédiaires sont abandonnées, leurs diffs cumulés).
+
+    extinct = pyqtSignal()  # émis quand toutes les cellules sont mortes
+    cycle_found = pyqtSignal(int, int)  # (génération de départ, période) : simulation en pause
+
+    def __init__(self, game):
+        super().__init__()
+        self.game = game
+        self.lock = threading.RLock()  # protège self.game entre la GUI et le worker
+        self.interval = 0.0            # délai minimal entre deux générations (s), 0 = max
+        self.generations = 0           # générations calculées depuis le lancement
+
+        self._running = threading.Event()
+        self._quit = False
+
+        # Double tampon : le worker écrit dans _back, la GUI lit _front
+        self._frame_lock = threading.Lock()
+        self._front = None
+        self._back = None
+        self._frame_id = 0
+        self._rendered_id = 0
+        self._changes = []   # diffs depuis la dernière image rendue (None : tout redessiner)
+        self._pending = 0
+
+        with self.lock:
+            self.publish()
+
+    # ---------------------------
+    # Contrôle
+    # ---------------------------
+
+    @property
+    def running(self) -> bool:
+        return self._running.is_set()
+
+    def resume(self):
+        self._running.set()
+
+    def pause(self):
+        self._running.clear()
+
+    def stop(self):
+        """Arrête le thread et attend sa fin."""
+        self._quit = True
+        self._running.set()
+        self.wait()
+
+    def run(self):
+        with profile_thread():  # sans effet hors de main.py --profile
+            self._loop()
+
+    def _loop(self):
+        while not self._quit:
+            if not self._running.wait(0.1) or self._quit:
+                continue
+
+            start = time.perf_counter()
+            with self.lock:
+                known = self.game.cycle
+                alive = self.game.next_generation()
+                if alive:
+                    self.publish()
+                cycle = self.game.cycle
+
+            if not alive:
+                self._running.clear()
+                self.extinct.emit()
+                continue
+
+            self.generations += 1
+            if cycle is not None and known is None:
+                # État périodique : inutile de continuer à calculer
+                self._running.clear()
+                self.cycle_found.emit(cycle.start, cycle.period)
+                continue
+            remaining = self.interval - (time.perf_counter() - start)
+            if remaining > 0:
+                time.sleep(remaining)
+
+    # ---------------------------
+    # Échange d'images
+    # ---------------------------
+
+    def publish(self):
+        """Publie l'état courant du jeu comme dernière image (à appeler avec self.lock)."""
+        grid = self.game.engine.to_array()
+        if self._back is None or self._back.shape != grid.shape:
+            self._back = np.empty(grid.shape, dtype=np.uint8)
+        np.copyto(self._back, grid)
+        changes = self.game.last_changes
+
+        with self._frame_lock:
+            self._front, self._back = self._back, self._front
+            self._frame_id += 1
+            if changes is None or self._changes is None:
+                self._changes = None
+            else:
+                self._changes.append(changes)
+                self._pending += len(changes)
+                # Trop de changements cumulés : un rafraîchissement complet est moins cher
+                if self._pending * 4 > grid.size:
+                    self._changes = None
+
+    def consume(self, render) -> bool:
+        """Appelle render(grille, changements) si une nouvelle image est disponible.
+
+        `changements` vaut None quand toute la grille doit être redessinée.
+        """
+        with self._frame_lock:
+            if self._frame_id == self._rendered_id:
+                return False
+            self._rendered_id = self._frame_id
+            if self._changes is None:
+                changes = None
+            elif self._changes:
+                changes = np.concatenate(self._changes)
+            else:
+                changes = np.empty((0, 2), dtype=np.int64)
+            self._changes = []
+            self._pending = 0
+            render(self._front, changes)
+        return True
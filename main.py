@@ -1,8 +1,10 @@
  
 import sys
 import logging
+from contextlib import nullcontext
 from PyQt6.QtWidgets import QApplication
 from core.config import Config
+from core.metrics import profiling
 from gui.main_window import MainWindow
 
 def main():
@@ -12,11 +14,15 @@ def main():
     Config.setup_logging()
     logger = logging.getLogger(__name__)
     logger.info(f"Lancement en mode {'DEBUG' if debug else 'RELEASE'}")
+    # --profile : statistiques cProfile affichées à la fermeture ; --profile=FICHIER : écrites en .prof
+    profile = next((arg.partition("=")[2] for arg in sys.argv if arg.split("=")[0] == "--profile"), None)
 
     app = QApplication(sys.argv)
-    window = MainWindow()
-    window.show()
-    sys.exit(app.exec())
+    with profiling(profile) if profile is not None else nullcontext():
+        window = MainWindow()
+        window.show()
+        code = app.exec()
+    sys.exit(code)
 
 if __name__ == "__main__":
     main()
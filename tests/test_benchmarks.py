@@ -0,0 +1,54 @@
+import csv
+import json
+
+import numpy as np
+import pytest
+
+from benchmarks import suite
+from benchmarks.report import Comparison, compare
+from benchmarks.suite import main, seed_cells
+
+
+def test_seed_cells_is_reproducible():
+    assert np.array_equal(seed_cells(64, 0.5, seed=3), seed_cells(64, 0.5, seed=3))
+    assert 0.45 < seed_cells(64, 0.5).mean() < 0.55
+    assert seed_cells(64, "gliders").sum() == 5 * 4 * 4
+
+
+def test_compare_flags_regressions():
+    comparisons = compare([{"name": "a", "median": 0.3}, {"name": "b", "median": 0.1}],
+                          [{"name": "a", "median": 0.1}, {"name": "c", "median": 1.0}])
+    assert comparisons == [Comparison("a", 0.1, 0.3)]
+    assert comparisons[0].regressed(0.25)
+    assert not Comparison("a", 0.1, 0.12).regressed(0.25)
+    assert not Comparison("a", 1e-6, 3e-6).regressed(0.25)  # bruit de mesure
+
+
+def test_run_writes_results_and_checks_baseline(tmp_path, capsys):
+    baseline = tmp_path / "baseline.json"
+    args = ["--groups", "step,io", "--engines", "numpy", "--sizes", "32", "--densities", "gliders",
+            "--history", "off", "--repeats", "1", "--steps", "2", "--baseline", str(baseline)]
+    assert main(args + ["--json", str(tmp_path / "r.json"), "--csv", str(tmp_path / "r.csv"),
+                        "--update-baseline"]) == 0
+
+    results = json.loads((tmp_path / "r.json").read_text())["results"]
+    names = [r["name"] for r in results]
+    assert "step/numpy/32/gliders/nohistory" in names
+    assert "io/rle/32/gliders/load" in names
+    with open(tmp_path / "r.csv", newline="") as f:
+        assert [row["name"] for row in csv.DictReader(f)] == names
+
+    # Référence beaucoup plus rapide : toutes les mesures régressent
+    data = json.loads(baseline.read_text())
+    for result in data["results"]:
+        result["median"] /= 1000
+    baseline.write_text(json.dumps(data))
+    assert main(args) == 1
+    assert "RÉGRESSION" in capsys.readouterr().out
+
+
+def test_missing_baseline_fails_before_running(tmp_path, monkeypatch):
+    monkeypatch.setattr(suite, "run_suite", lambda args: pytest.fail("suite exécutée"))
+    with pytest.raises(SystemExit) as exc:
+        main(["--baseline", str(tmp_path / "absente.json")])
+    assert exc.value.code == 2
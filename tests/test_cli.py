@@ -0,0 +1,47 @@
+import json
+
+from cli.main_cli import build_parser, main, parse_size, resolve_rule, seed_game
+from core.game import GameOfLife
+
+
+def test_parse_size():
+    assert parse_size("200x300") == (200, 300)
+    assert parse_size("64") == (64, 64)
+
+
+def test_headless_run_writes_snapshots(tmp_path, capsys):
+    main([
+        "--headless", "--size", "30x30", "--density", "0.3", "--seed", "2",
+        "--generations", "10", "--output", str(tmp_path), "--output-interval", "5",
+        "--snapshot-format", "json",
+    ])
+    report = capsys.readouterr().out
+    assert "Générations/s" in report and "Cellules/s" in report
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["gen_00000005.json", "gen_00000010.json"]
+    data = json.loads((tmp_path / "gen_00000010.json").read_text())
+    assert data["rule"] == "B3/S23"
+    cells = data["cells"]
+    assert all(0 <= r < 30 and 0 <= c < 30 for r, c in cells)
+
+
+def test_headless_binary_snapshot_roundtrip(tmp_path, capsys):
+    main(["--headless", "--size", "20x70", "--density", "0.4", "--seed", "3",
+          "--generations", "3", "--output", str(tmp_path)])
+    snapshot = tmp_path / "gen_00000003.gol"
+    assert snapshot.exists()
+    main(["--headless", "--size", "20x70", "--pattern", str(snapshot), "--generations", "0"])
+    assert "Population finale" in capsys.readouterr().out
+
+
+def test_pattern_rule_read_without_catalog(tmp_path):
+    pattern = tmp_path / "seed.json"
+    pattern.write_text(json.dumps({"rule": "B36/S23", "cells": [[1, 1], [1, 2], [1, 3]]}))
+    (tmp_path / "other.json").write_text("[[0, 0]]")
+    args = build_parser().parse_args(["--headless", "--pattern", str(pattern)])
+    assert str(resolve_rule(args)) == "B36/S23"
+
+    game = GameOfLife(8, 8, engine="numpy", rule=resolve_rule(args))
+    seed_game(game, args)
+    assert game.engine.population() == 3
+    # Aucun index écrit dans le dossier de l'utilisateur
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["other.json", "seed.json"]
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from cli.main_cli import main
+from core.cycle import Cycle, CycleDetector, zobrist_hash
+from core.game import GameOfLife
+
+BLINKER = [(4, 3), (4, 4), (4, 5)]
+BLOCK = [(9, 9), (9, 10), (10, 9), (10, 10)]
+GLIDER = [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
+
+
+def test_zobrist_hash_is_incremental():
+    a = np.array([3, 17, 42])
+    b = np.array([3, 17, 99])
+    changed = np.setxor1d(a, b)
+    assert zobrist_hash(a) ^ zobrist_hash(changed) == zobrist_hash(b)
+    assert zobrist_hash(np.empty(0, dtype=np.int64)) == 0
+
+
+def test_detector_table_is_bounded():
+    detector = CycleDetector(max_entries=3)
+    for generation, key in enumerate((1, 2, 3, 4)):
+        assert detector.observe(generation, key) is None
+    assert len(detector) == 3
+    assert detector.observe(4, 1) is None       # empreinte évincée
+    assert detector.observe(5, 3) == Cycle(2, 3)
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy", "bitpacked", "sparse", "incremental"])
+@pytest.mark.parametrize("history", [True, False])
+def test_still_life_and_oscillator(engine, history):
+    game = GameOfLife(12, 12, engine=engine, history=history)
+    game.set_cells(BLOCK)
+    game.next_generation()
+    assert game.cycle == Cycle(0, 1)
+
+    game.set_cells(BLINKER)  # une édition relance la détection
+    assert game.cycle is None
+    game.next_generation()
+    assert game.cycle is None
+    game.next_generation()
+    assert game.cycle == Cycle(1, 2)
+
+
+def test_glider_on_bounded_grid_settles():
+    # Le planeur finit en bloc dans le coin de la grille
+    game = GameOfLife(8, 8, engine="numpy", history=False)
+    game.set_cells(GLIDER)
+    while game.cycle is None:
+        assert game.next_generation()
+    assert game.cycle.period == 1
+    assert game.generation == game.cycle.start + 1
+
+
+def test_fast_forward_matches_full_run():
+    game = GameOfLife(12, 12, engine="numpy", history=False)
+    game.set_cells(BLINKER)
+    game.next_generation()
+    game.next_generation()
+    assert game.fast_forward(1001) == 1001 - 3
+    assert game.generation == 1001
+
+    reference = GameOfLife(12, 12, engine="numpy", history=False, detect_cycles=False)
+    reference.set_cells(BLINKER)
+    for _ in range(1001):
+        reference.next_generation()
+    assert np.array_equal(game.engine.to_array(), reference.engine.to_array())
+
+
+def test_headless_stops_or_skips_on_cycle(capsys):
+    # Le blinker et le bloc d'exemple interagissent puis se stabilisent
+    main(["--headless", "--generations", "1000"])
+    out = capsys.readouterr().out
+    assert "Cycle de période 1 depuis la génération 195" in out
+    assert "Générations      : 196\n" in out
+
+    main(["--headless", "--generations", "1000", "--on-cycle", "skip"])
+    out = capsys.readouterr().out
+    assert "804 générations sautées" in out
+    assert "Générations      : 1000 (196 calculées)" in out
@@ -0,0 +1,292 @@
+import numpy as np
+import pytest
+
+from core.engines import available_engines, create_engine
+from core.game import GameOfLife
+
+ENGINES = ["python", "numpy", "bitpacked", "sparse", "incremental"]
+
+
+def random_board(rows, cols, density=0.35, seed=0):
+    rng = np.random.default_rng(seed)
+    return (rng.random((rows, cols)) < density).astype(np.uint8)
+
+
+def test_engines_are_registered():
+    for name in ENGINES:
+        assert name in available_engines()
+
+
+def test_unknown_engine_raises():
+    with pytest.raises(ValueError):
+        create_engine("inexistant", 3, 3)
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_blinker_pattern(engine):
+    """Le blinker horizontal devient vertical avec chaque moteur."""
+    game = GameOfLife(5, 5, engine=engine)
+    for c in (1, 2, 3):
+        game.set_cell(2, c, 1)
+    assert game.next_generation() is True
+    expected = np.zeros((5, 5), dtype=np.uint8)
+    expected[1:4, 2] = 1
+    assert np.array_equal(game.engine.to_array(), expected)
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_matches_reference_engine(engine):
+    """Chaque moteur doit reproduire exactement le moteur Python de référence."""
+    board = random_board(23, 37)
+    reference = create_engine("python", 23, 37)
+    candidate = create_engine(engine, 23, 37)
+    reference.load_array(board)
+    candidate.load_array(board)
+
+    for _ in range(30):
+        assert reference.step() == candidate.step()
+        assert np.array_equal(reference.to_array(), candidate.to_array())
+        assert reference.population() == candidate.population()
+
+
+@pytest.mark.parametrize("cols", [1, 63, 64, 65, 130])
+def test_bitpacked_word_boundaries(cols):
+    """Les voisins traversent correctement les frontières entre mots uint64."""
+    board = random_board(9, cols, seed=cols)
+    reference = create_engine("python", 9, cols)
+    packed = create_engine("bitpacked", 9, cols)
+    reference.load_array(board)
+    packed.load_array(board)
+    for _ in range(10):
+        assert reference.step() == packed.step()
+        assert np.array_equal(reference.to_array(), packed.to_array())
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_count_neighbors_at_edges(engine):
+    game = GameOfLife(3, 3, engine=engine)
+    game.set_cell(0, 1, 1)
+    game.set_cell(1, 0, 1)
+    game.set_cell(1, 2, 1)
+    assert game.count_neighbors(1, 1) == 3
+    assert game.count_neighbors(0, 0) == 2
+    assert game.get_cell(0, 1) == 1
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_total_death_keeps_last_grid(engine):
+    """Une génération sans survivant renvoie False et laisse la grille intacte."""
+    game = GameOfLife(4, 4, engine=engine)
+    game.set_cell(1, 1, 1)
+    assert game.next_generation() is False
+    assert game.get_cell(1, 1) == 1
+
+
+def test_sparse_glider_stays_in_bounds():
+    """Un planeur qui sort de la grille finit en bloc contre le bord, comme en référence."""
+    reference = create_engine("python", 8, 8)
+    sparse = create_engine("sparse", 8, 8)
+    for r, c in [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]:
+        reference.set_cell(r, c, 1)
+        sparse.set_cell(r, c, 1)
+    for _ in range(40):
+        assert reference.step() == sparse.step()
+        assert np.array_equal(reference.to_array(), sparse.to_array())
+    assert all(0 <= r < 8 and 0 <= c < 8 for r, c in sparse.live)
+
+
+def test_incremental_reports_changed_cells():
+    board = random_board(40, 50, seed=3)
+    engine = create_engine("incremental", 40, 50, tile_size=8)
+    engine.load_array(board)
+    for _ in range(15):
+        before = engine.to_array().copy()
+        assert engine.step()
+        expected = np.argwhere(before != engine.to_array())
+        assert np.array_equal(np.sort(engine.changed_cells, axis=0), np.sort(expected, axis=0))
+
+
+def test_incremental_skips_still_lifes():
+    """Un bloc isolé est stable : plus aucune tuile n'est recalculée."""
+    engine = create_engine("incremental", 64, 64, tile_size=16)
+    for r, c in [(7, 3), (7, 4), (8, 3), (8, 4)]:
+        engine.set_cell(r, c, 1)
+    engine.step()
+    assert len(engine.changed_cells) == 0
+    engine.step()
+    assert engine.computed_tiles == 0
+    assert engine.population() == 4
+
+
+def test_parallel_engine_is_bit_identical():
+    board = random_board(61, 45, seed=7)
+    reference = create_engine("numpy", 61, 45)
+    parallel = create_engine("parallel", 61, 45, workers=3)
+    try:
+        reference.load_array(board)
+        parallel.load_array(board)
+        for _ in range(12):
+            assert reference.step() == parallel.step()
+            assert np.array_equal(reference.to_array(), parallel.to_array())
+    finally:
+        parallel.close()
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_set_cells_matches_set_cell(engine):
+    board = random_board(12, 70, seed=5)
+    rows, cols = np.nonzero(board)
+    bulk = create_engine(engine, 12, 70)
+    bulk.set_cells(rows, cols, 1)
+    assert np.array_equal(bulk.to_array(), board)
+    assert bulk.population() == int(board.sum())
+    bulk.set_cells(rows[::2], cols[::2], 0)
+    board[rows[::2], cols[::2]] = 0
+    assert np.array_equal(bulk.to_array(), board)
+    assert bulk.population() == int(board.sum())
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_history_consistent_with_engine_diffs(engine):
+    """Les diffs publiés par les moteurs reconstruisent fidèlement l'historique."""
+    board = random_board(20, 20, seed=11)
+    game = GameOfLife(20, 20, engine=engine)
+    game.grid = board
+    frames = [game.engine.to_array().copy()]
+    for _ in range(8):
+        game.next_generation()
+        frames.append(game.engine.to_array().copy())
+    assert len(game.history) == len(frames) + 1
+    for offset, frame in enumerate(frames):
+        assert np.array_equal(game.history[offset + 1], frame)
+
+
+def padded_neighbors(board, boundary):
+    """Voisins de référence indépendants : np.pad selon le mode de bord."""
+    mode = {"dead": "constant", "torus": "wrap", "mirror": "symmetric"}[boundary]
+    padded = np.pad(board, 1, mode=mode).astype(np.int64)
+    rows, cols = board.shape
+    return sum(
+        padded[1 + dr:1 + dr + rows, 1 + dc:1 + dc + cols]
+        for dr in (-1, 0, 1) for dc in (-1, 0, 1) if (dr, dc) != (0, 0)
+    )
+
+
+def padded_step(board, boundary):
+    counts = padded_neighbors(board, boundary)
+    return ((counts == 3) | ((counts == 2) & (board == 1))).astype(np.uint8)
+
+
+@pytest.mark.parametrize("boundary", ["torus", "mirror"])
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("shape", [(17, 29), (9, 65)])
+def test_boundary_modes(engine, boundary, shape):
+    board = random_board(*shape, seed=shape[1])
+    candidate = create_engine(engine, *shape, boundary=boundary)
+    candidate.load_array(board)
+    for _ in range(12):
+        expected = padded_step(board, boundary)
+        assert candidate.step() == bool(expected.any())
+        if not expected.any():
+            break
+        board = expected
+        assert np.array_equal(candidate.to_array(), board)
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_torus_glider_wraps_around(engine):
+    """Sur un tore, un planeur revient à sa position après 4 * taille générations."""
+    game = GameOfLife(8, 8, engine=engine, boundary="torus", detect_cycles=False)
+    game.set_cells([(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)])
+    start = game.engine.to_array().copy()
+    for _ in range(32):
+        assert game.next_generation()
+    assert np.array_equal(game.engine.to_array(), start)
+    assert game.count_neighbors(0, 1) == padded_neighbors(start, "torus")[0, 1]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_mirror_count_neighbors(engine):
+    board = random_board(6, 7, seed=4)
+    candidate = create_engine(engine, 6, 7, boundary="mirror")
+    candidate.load_array(board)
+    expected = padded_neighbors(board, "mirror")
+    for r, c in [(0, 0), (0, 6), (5, 3), (2, 2)]:
+        assert candidate.count_neighbors(r, c) == expected[r, c]
+
+
+@pytest.mark.parametrize("boundary", ["dead", "torus", "mirror"])
+@pytest.mark.parametrize("engine", ENGINES + ["parallel"])
+def test_count_neighbors_after_edge_edit(engine, boundary):
+    """Le halo est relu après une édition : aucune valeur périmée sur les bords."""
+    board = random_board(6, 7, seed=5)
+    options = {"workers": 1} if engine == "parallel" else {}
+    candidate = create_engine(engine, 6, 7, boundary=boundary, **options)
+    try:
+        candidate.load_array(board)
+        candidate.count_neighbors(0, 0)
+        for row, col in [(5, 6), (0, 3), (2, 6)]:
+            board[row, col] ^= 1
+            candidate.set_cell(row, col, board[row, col])
+        expected = padded_neighbors(board, boundary)
+        for r in range(6):
+            for c in range(7):
+                assert candidate.count_neighbors(r, c) == expected[r, c]
+    finally:
+        candidate.close()
+
+
+def test_parallel_torus_matches_numpy():
+    board = random_board(33, 20, seed=9)
+    reference = create_engine("numpy", 33, 20, boundary="torus")
+    parallel = create_engine("parallel", 33, 20, workers=2, boundary="torus")
+    try:
+        reference.load_array(board)
+        parallel.load_array(board)
+        for _ in range(8):
+            assert reference.step() == parallel.step()
+            assert np.array_equal(reference.to_array(), parallel.to_array())
+    finally:
+        parallel.close()
+
+
+def test_unknown_boundary_raises():
+    with pytest.raises(ValueError):
+        create_engine("numpy", 3, 3, boundary="klein")
+
+
+def test_tiled_matches_numpy_across_tile_seams():
+    """Plan infini : même évolution qu'une grande grille, coordonnées négatives comprises."""
+    board = random_board(30, 30, density=0.4, seed=6)
+    reference = create_engine("numpy", 200, 200)
+    padded = np.zeros((200, 200), dtype=np.uint8)
+    padded[85:115, 85:115] = board
+    reference.load_array(padded)
+    tiled = create_engine("tiled", 10, 10, tile=8)
+    rows, cols = np.nonzero(board)
+    tiled.set_cells(rows - 15, cols - 15, 1)
+
+    for _ in range(60):
+        assert reference.step() == tiled.step()
+        cells = tiled.live_cells() + 100
+        assert np.array_equal(cells[np.lexsort(cells.T[::-1])], np.argwhere(reference.to_array()))
+
+
+def test_tiled_glider_leaves_window_and_frees_tiles():
+    tiled = create_engine("tiled", 8, 8, tile=8)
+    glider = np.array([(0, 0), (0, 1), (0, 2), (1, 0), (2, 1)])  # vers le haut à gauche
+    tiled.set_cells(glider[:, 0] + 4, glider[:, 1] + 4, 1)
+    for _ in range(80):
+        tiled.step()
+    assert tiled.bounding_box() == (-16, -16, -14, -14)
+    assert tiled.population() == 5 and len(tiled.tiles) <= 4
+    assert not tiled.to_array().any()  # hors de la fenêtre 8x8
+    tiled.origin = (-20, -20)
+    assert tiled.to_array().sum() == 5
+
+
+def test_tiled_rejects_bounded_modes_and_b0():
+    with pytest.raises(ValueError):
+        create_engine("tiled", 5, 5, boundary="torus")
+    with pytest.raises(ValueError):
+        create_engine("tiled", 5, 5, rule="B03/S23")
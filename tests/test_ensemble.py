@@ -0,0 +1,62 @@
+import csv
+
+import numpy as np
+import pytest
+
+from cli.main_cli import main
+from core.ensemble import Ensemble, random_board, run_ensemble
+from core.game import GameOfLife
+
+
+def reference(board, generations, boundary="dead", rule="B3/S23"):
+    """Même mesure avec un GameOfLife par grille."""
+    game = GameOfLife(*board.shape, engine="numpy", history=False, boundary=boundary, rule=rule)
+    game.grid = board
+    while game.generation < generations:
+        if not game.next_generation():
+            return "dead", game.generation + 1, None
+        if game.cycle is not None:
+            return "cycle", game.cycle.start, game.cycle.period
+    return "running", None, None
+
+
+@pytest.mark.parametrize("boundary", ["dead", "torus", "mirror"])
+def test_ensemble_matches_single_games(boundary):
+    boards = np.stack([random_board(12, 12, 0.35, seed) for seed in range(12)])
+    results = Ensemble(boards, boundary=boundary).run(300)
+    for board, result in zip(boards, results):
+        expected = reference(board, 300, boundary)
+        assert (result["status"], result["lifespan"], result["period"]) == expected
+
+
+def test_dead_board_and_generation_limit():
+    boards = np.zeros((2, 8, 8), dtype=np.uint8)
+    boards[0, 1, 1] = 1                          # meurt à la génération 1
+    boards[1, 1, 2] = boards[1, 2, 3] = 1        # planeur : ne se répète pas
+    boards[1, 3, 1:4] = 1
+    ensemble = Ensemble(boards, detect_cycles=False)
+    results = ensemble.run(5)
+    assert results[0]["status"] == "dead" and results[0]["lifespan"] == 1
+    assert results[1] == {"board": 1, "status": "running", "generations": 5,
+                          "lifespan": None, "period": None, "population": 5}
+    assert len(ensemble) == 1
+
+
+def test_run_ensemble_is_independent_of_batching(tmp_path):
+    output = tmp_path / "results.csv"
+    serial = list(run_ensemble(10, 10, 10, generations=200, seed=5, batch_size=10, workers=1))
+    parallel = list(run_ensemble(10, 10, 10, generations=200, seed=5, batch_size=3, workers=2,
+                                 output=output))
+    assert serial == parallel
+    assert [r["seed"] for r in serial] == list(range(5, 15))
+    with open(output, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [int(row["board"]) for row in rows] == list(range(10))
+
+
+def test_cli_ensemble(tmp_path, capsys):
+    main(["--ensemble", "8", "--size", "10", "--generations", "300", "--workers", "1",
+          "--results", str(tmp_path / "r.csv")])
+    report = capsys.readouterr().out
+    assert "Grilles          : 8 x 10x10" in report
+    assert len((tmp_path / "r.csv").read_text().splitlines()) == 9
@@ -1,3 +1,6 @@
+import numpy as np
+import pytest
+
 from core.game import GameOfLife
 
 
@@ -43,3 +46,62 @@ def test_blinker_pattern():
         [0, 0, 0, 0, 0],
     ]
     assert game.grid == expected
+
+
+def test_set_cells_records_single_history_entry():
+    """set_cells() applique tout le lot et n'ajoute qu'une entrée d'historique."""
+    game = GameOfLife(5, 5)
+    game.set_cells([(2, 1), (2, 2), (2, 3), (9, 9)])
+    assert game.grid[2] == [0, 1, 1, 1, 0]
+    assert len(game.history) == 2
+
+
+def test_batch_context_manager():
+    """Les éditions dans game.batch() ne créent qu'un seul état."""
+    game = GameOfLife(4, 4)
+    with game.batch():
+        game.set_cell(0, 0, 1)
+        game.set_cell(0, 1, 1)
+        game.set_cells([(1, 1)])
+    assert len(game.history) == 2
+    game.previous_generation()
+    assert all(cell == 0 for row in game.grid for cell in row)
+
+
+def test_last_changes_after_step_edit_and_restore():
+    """last_changes publie les cellules modifiées par chaque opération."""
+    game = GameOfLife(5, 5)
+    game.set_cells([(2, 1), (2, 2), (2, 3)])
+    assert sorted(map(tuple, game.last_changes.tolist())) == [(2, 1), (2, 2), (2, 3)]
+    game.next_generation()
+    assert sorted(map(tuple, game.last_changes.tolist())) == [(1, 2), (2, 1), (2, 3), (3, 2)]
+    game.previous_generation()
+    assert sorted(map(tuple, game.last_changes.tolist())) == [(1, 2), (2, 1), (2, 3), (3, 2)]
+
+
+def test_unbounded_game_accepts_any_coordinates():
+    game = GameOfLife(10, 10, engine="tiled", history=True)
+    assert game.unbounded and game.history is None
+    game.set_cell(-500, 10_000, 1)
+    game.set_cells([(-3, -3), (-3, -2), (-2, -3), (-2, -2)])  # bloc
+    assert game.get_cell(-500, 10_000) == 1
+    assert game.engine.population() == 5 and not game.engine.to_array().any()
+
+    game.next_generation()
+    game.next_generation()
+    assert game.engine.population() == 4
+    assert game.cycle is not None and game.cycle.period == 1
+
+
+@pytest.mark.parametrize("engine", ["sparse", "incremental"])
+def test_grid_assignment_is_recorded(engine):
+    """Affecter game.grid resynchronise l'historique avec les diffs publiés par le moteur."""
+    game = GameOfLife(16, 16, engine=engine)
+    game.set_cells([(1, 2), (2, 2), (3, 2)])
+    other = np.zeros((16, 16), dtype=np.uint8)
+    other[8, 7:10] = 1
+    other[12:14, 12:14] = 1
+    game.grid = other
+    assert np.array_equal(game.history[-1], other)
+    assert game.next_generation()
+    assert np.array_equal(game.history[-1], game.engine.to_array())
@@ -0,0 +1,57 @@
+import numpy as np
+
+from core.engines import create_engine
+from core.hashlife import HashLife
+
+GLIDER = [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
+
+
+def reference_run(coords, rows, cols, offset, generations):
+    """Simulation de référence sur une grille assez grande pour ne pas toucher les bords."""
+    engine = create_engine("numpy", rows, cols)
+    for r, c in coords:
+        engine.set_cell(r + offset, c + offset, 1)
+    for _ in range(generations):
+        engine.step()
+    return {(int(r) - offset, int(c) - offset) for r, c in zip(*np.nonzero(engine.to_array()))}
+
+
+def test_coords_roundtrip():
+    hashlife = HashLife.from_coords(GLIDER)
+    assert hashlife.to_coords() == sorted([r, c] for r, c in GLIDER)
+    assert hashlife.population == 5
+
+
+def test_advance_matches_step_by_step():
+    rng = np.random.default_rng(1)
+    soup = [(int(r), int(c)) for r, c in zip(*np.nonzero(rng.random((12, 12)) < 0.4))]
+    for generations in (1, 2, 5, 16, 37):
+        hashlife = HashLife.from_coords(soup)
+        hashlife.advance(generations)
+        expected = reference_run(soup, 200, 200, 90, generations)
+        assert set(hashlife.iter_cells()) == expected
+        assert hashlife.generation == generations
+
+
+def test_glider_after_many_generations():
+    """Un planeur se déplace d'une case en diagonale toutes les 4 générations."""
+    hashlife = HashLife.from_coords(GLIDER)
+    hashlife.advance(4 * 10**6)
+    moved = {(r + 10**6, c + 10**6) for r, c in GLIDER}
+    assert set(hashlife.iter_cells()) == moved
+
+
+def test_grid_export_window():
+    hashlife = HashLife.from_grid([[0, 1, 0], [0, 1, 0], [0, 1, 0]])
+    hashlife.advance(1)
+    expected = np.zeros((3, 3), dtype=np.uint8)
+    expected[1, :] = 1
+    assert np.array_equal(hashlife.to_grid(3, 3), expected)
+
+
+def test_bounded_node_cache():
+    hashlife = HashLife.from_coords(GLIDER, max_nodes=200)
+    hashlife.advance(1000)
+    assert hashlife.node_count <= 200
+    hashlife.advance(24)
+    assert hashlife.population == 5
@@ -0,0 +1,71 @@
+import numpy as np
+
+from core.game import GameOfLife
+from core.history import History
+
+
+def frames(count, shape=(16, 16), seed=0):
+    rng = np.random.default_rng(seed)
+    return [(rng.random(shape) < 0.3).astype(np.uint8) for _ in range(count)]
+
+
+def test_frames_rebuilt_from_keyframes():
+    history = History((16, 16), keyframe_interval=4)
+    images = frames(11)
+    for image in images:
+        assert history.append(image)
+    assert len(history) == 11
+    for index in (10, 0, 5, 6, 7, 3):
+        assert np.array_equal(history[index], images[index])
+
+
+def test_identical_frame_is_skipped():
+    history = History((4, 4))
+    image = np.eye(4, dtype=np.uint8)
+    assert history.append(image)
+    assert not history.append(image.copy())
+    assert len(history) == 1
+
+
+def test_memory_budget_evicts_oldest_groups():
+    history = History((32, 32), keyframe_interval=2, max_bytes=1500)
+    images = frames(40, shape=(32, 32))
+    for image in images:
+        history.append(image)
+    assert history.nbytes <= 1500
+    assert history.evicted + len(history) == 40
+    assert np.array_equal(history[-1], images[-1])
+    assert np.array_equal(history[0], images[history.evicted])
+
+
+def test_truncate_then_append():
+    # Grande grille, modifications ponctuelles : les ajouts après truncate sont des diffs
+    history = History((64, 64), keyframe_interval=16)
+    images = [np.zeros((64, 64), dtype=np.uint8)]
+    for i in range(1, 8):
+        image = images[-1].copy()
+        image[i, i] = 1
+        images.append(image)
+    for image in images:
+        history.append(image)
+    history.truncate(3)
+
+    replacement = images[2].copy()
+    replacement[40, 40] = 1
+    assert history.append(replacement)
+    assert history.last_diff.tolist() == [40 * 64 + 40]
+    assert len(history) == 4 and history._keyframes == [0]
+    assert np.array_equal(history[2], images[2])
+    assert np.array_equal(history[3], replacement)
+    assert np.array_equal(history.frame(3), replacement)  # reconstruit depuis l'image clé
+
+
+def test_undo_with_game():
+    game = GameOfLife(5, 5)
+    for c in (1, 2, 3):
+        game.set_cell(2, c, 1)
+    game.next_generation()
+    game.previous_generation()
+    assert game.grid[2] == [0, 1, 1, 1, 0]
+    game.restore_state(len(game.history) - 1)
+    assert [row[2] for row in game.grid] == [0, 1, 1, 1, 0]
@@ -0,0 +1,82 @@
+import json
+import threading
+
+from cli.main_cli import main
+from core.game import GameOfLife
+from core.metrics import Metrics, profile_thread, profiling
+
+
+def test_ring_buffer_keeps_latest_records():
+    metrics = Metrics(capacity=3)
+    for generation in range(1, 6):
+        metrics.record(generation, 1.0, 0.5, 10, 2)
+    assert len(metrics) == 3 and metrics.count == 5
+    assert metrics.records()["generation"].tolist() == [3, 4, 5]
+    metrics.record_render(2.5)
+    assert metrics.last()["render_ms"] == 2.5
+    assert metrics.to_list()[0]["render_ms"] is None
+
+
+def test_game_records_each_generation(tmp_path):
+    seen = []
+    game = GameOfLife(10, 10, engine="numpy", metrics=Metrics(callback=seen.append))
+    game.set_cells([(1, 2), (2, 2), (3, 2)])  # blinker
+    for _ in range(4):
+        game.next_generation()
+
+    records = game.metrics.to_list()
+    assert [r["generation"] for r in records] == [1, 2, 3, 4]
+    assert all(r["population"] == 3 and r["changed"] == 4 for r in records)
+    assert all(r["step_ms"] >= 0 and r["history_ms"] >= 0 for r in records)
+    assert seen == records
+
+    path = tmp_path / "metrics.json"
+    game.metrics.dump(path)
+    data = json.loads(path.read_text())
+    assert data["summary"]["generations"] == 4 and "step_ms" in data["summary"]
+    assert "render_ms" not in data["summary"]
+
+
+def test_game_without_metrics():
+    game = GameOfLife(5, 5, engine="numpy")
+    game.set_cells([(1, 1)])
+    game.next_generation()
+    assert game.metrics is None
+
+
+def test_profiling_writes_stats(tmp_path, capsys):
+    with profiling(tmp_path / "run.prof"):
+        GameOfLife(20, 20, engine="numpy").next_generation()
+    assert (tmp_path / "run.prof").stat().st_size > 0
+
+    with profiling(limit=5):
+        GameOfLife(20, 20, engine="numpy").next_generation()
+    assert "function calls" in capsys.readouterr().out
+
+
+def test_profile_thread_inside_profiling(capsys):
+    # Thread de calcul profilé pendant la session principale (cas de main.py --profile)
+    errors = []
+
+    def worker():
+        try:
+            with profile_thread():
+                game = GameOfLife(20, 20, engine="numpy")
+                game.set_cells([(1, 2), (2, 2), (3, 2)])
+                game.next_generation()
+        except Exception as exc:
+            errors.append(exc)
+
+    with profiling(limit=50):
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+    assert errors == []
+    assert "next_generation" in capsys.readouterr().out
+
+
+def test_cli_metrics_and_profile(tmp_path, capsys):
+    main(["--headless", "--size", "30x30", "--density", "0.3", "--seed", "2", "--generations", "5",
+          "--metrics", str(tmp_path / "m.json"), "--profile", str(tmp_path / "cli.prof")])
+    assert len(json.loads((tmp_path / "m.json").read_text())["records"]) == 5
+    assert (tmp_path / "cli.prof").exists()
@@ -0,0 +1,93 @@
+import json
+import os
+
+import numpy as np
+
+from gui.pattern_catalog import INDEX_FILENAME, PatternCatalog
+from gui.pattern_manager import PATTERN_EXTENSIONS, PatternManager
+
+
+def write_json(path, coords):
+    with open(path, "w") as f:
+        json.dump(coords, f)
+
+
+def test_catalog_indexes_stats(tmp_path):
+    write_json(tmp_path / "glider.json", [[0, 1], [1, 2], [2, 0], [2, 1], [2, 2]])
+    (tmp_path / "blinker.rle").write_text("x = 3, y = 1, rule = B3/S23\n3o!\n")
+    (tmp_path / "notes.txt").write_text("ignoré")
+
+    catalog = PatternCatalog(tmp_path, PATTERN_EXTENSIONS)
+    entries = {entry["name"]: entry for entry in catalog.refresh()}
+
+    assert sorted(entries) == ["blinker.rle", "glider.json"]
+    assert entries["glider.json"]["population"] == 5
+    assert entries["glider.json"]["bbox"] == [0, 0, 2, 2]
+    assert (entries["blinker.rle"]["rows"], entries["blinker.rle"]["cols"]) == (1, 3)
+    assert entries["blinker.rle"]["rule"] == "B3/S23"
+    assert (tmp_path / INDEX_FILENAME).exists()
+
+
+def test_catalog_only_reanalyzes_changed_files(tmp_path, monkeypatch):
+    write_json(tmp_path / "a.json", [[0, 0]])
+    write_json(tmp_path / "b.json", [[1, 1]])
+    PatternCatalog(tmp_path, PATTERN_EXTENSIONS).refresh()
+
+    # Nouvelle instance : l'index persistant évite de relire les fichiers inchangés
+    catalog = PatternCatalog(tmp_path, PATTERN_EXTENSIONS)
+    analyzed = []
+    original = catalog._analyze
+    monkeypatch.setattr(catalog, "_analyze", lambda path, digest: analyzed.append(path.name) or original(path, digest))
+
+    catalog.refresh()
+    assert analyzed == []
+
+    write_json(tmp_path / "b.json", [[1, 1], [1, 2]])
+    os.utime(tmp_path / "a.json")  # contenu identique : pas de nouvelle analyse
+    entries = {entry["name"]: entry for entry in catalog.refresh()}
+    assert analyzed == ["b.json"]
+    assert entries["b.json"]["population"] == 2
+
+    (tmp_path / "a.json").unlink()
+    assert [entry["name"] for entry in catalog.refresh()] == ["b.json"]
+
+
+def test_catalog_lru_cache(tmp_path):
+    for name in ("a", "b", "c"):
+        write_json(tmp_path / f"{name}.json", [[0, 0], [0, 1]])
+    catalog = PatternCatalog(tmp_path, PATTERN_EXTENSIONS, cache_cells=4)
+    catalog.refresh()
+
+    first = catalog.load("a.json")
+    assert catalog.load("a.json") is first
+    catalog.load("b.json")
+    catalog.load("c.json")  # dépasse le budget : "a" est évincé
+    assert catalog.load("a.json") is not first
+    np.testing.assert_array_equal(first, [[0, 0], [0, 1]])
+
+    # Un fichier modifié n'est pas servi depuis le cache
+    write_json(tmp_path / "a.json", [[5, 5]])
+    catalog.refresh()
+    np.testing.assert_array_equal(catalog.load("a.json"), [[5, 5]])
+
+
+def test_manager_lists_and_centers_saved_patterns(tmp_path):
+    manager = PatternManager(tmp_path)
+    manager.save_pattern([[0, 0], [0, 1], [0, 2]], "line.json")
+
+    assert manager.list_saved_patterns() == ["line.json"]
+    assert manager.load_pattern("line.json") == [[0, 0], [0, 1], [0, 2]]
+    assert manager.centered_origin("line.json", 11, 11) == (5, 4)
+
+
+def test_load_pattern_sees_overwritten_file(tmp_path):
+    manager = PatternManager(tmp_path)
+    manager.save_pattern([[1, 1]], "a.json")
+    assert manager.load_pattern("a.json") == [[1, 1]]
+    # Même taille de fichier : seule l'invalidation ou la date révèle le changement
+    manager.save_pattern([[5, 5]], "a.json")
+    assert manager.load_pattern("a.json") == [[5, 5]]
+
+    # Réécriture hors du gestionnaire : détectée par la taille ou la date
+    write_json(tmp_path / "a.json", [[7, 7], [7, 8]])
+    assert manager.load_pattern("a.json") == [[7, 7], [7, 8]]
@@ -0,0 +1,74 @@
+import io
+
+import numpy as np
+
+from core.game import GameOfLife
+from core.pattern_formats import (
+    iter_cells_cells, iter_rle_cells, read_rle_header, write_cells, write_rle,
+)
+from gui.pattern_manager import PatternManager
+
+GLIDER_RLE = """#N Glider
+#C Le plus petit vaisseau.
+x = 3, y = 3, rule = B3/S23
+bob$2bo$3o!
+"""
+
+
+def cells_of(batches):
+    return sorted(map(tuple, np.concatenate(list(batches)).tolist()))
+
+
+def test_read_rle_glider():
+    stream = io.StringIO(GLIDER_RLE)
+    info = read_rle_header(stream)
+    assert (info.name, info.width, info.height, info.rule) == ("Glider", 3, 3, "B3/S23")
+    assert cells_of(iter_rle_cells(stream)) == [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
+
+
+def test_rle_parser_handles_tokens_split_across_chunks():
+    """Un nombre coupé entre deux blocs (ex. '1' | '2o') est correctement recollé."""
+    rng = np.random.default_rng(0)
+    board = (rng.random((40, 90)) < 0.5).astype(np.uint8)
+    text = io.StringIO()
+    write_rle(text, board)
+    stream = io.StringIO(text.getvalue())
+    read_rle_header(stream)
+    assert cells_of(iter_rle_cells(stream, chunk_size=7)) == sorted(map(tuple, np.argwhere(board).tolist()))
+
+
+def test_rle_blank_rows_and_line_width():
+    board = np.zeros((6, 200), dtype=np.uint8)
+    board[0, 0] = board[5, 199] = 1
+    text = io.StringIO()
+    write_rle(text, board)
+    lines = text.getvalue().splitlines()
+    assert lines[0] == "x = 200, y = 6, rule = B3/S23"
+    assert lines[1] == "o5$199bo!"
+    assert all(len(line) <= 70 for line in lines)
+
+
+def test_cells_roundtrip():
+    board = np.array([[0, 1, 0], [0, 0, 1], [1, 1, 1]])
+    text = io.StringIO()
+    write_cells(text, board, name="Glider")
+    assert text.getvalue() == "!Name: Glider\n.O\n..O\nOOO\n"
+    stream = io.StringIO(text.getvalue())
+    assert cells_of(iter_cells_cells(stream)) == [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
+
+
+def test_pattern_manager_import_export(tmp_path):
+    manager = PatternManager(tmp_path)
+    (tmp_path / "glider.rle").write_text(GLIDER_RLE)
+    game = GameOfLife(10, 10, engine="numpy")
+    manager.load_into(game, "glider.rle", origin=(2, 3))
+    assert len(game.history) == 2
+    assert game.engine.population() == 5
+    assert game.get_cell(2, 4) == 1
+
+    manager.export_pattern(game, "copy.cells")
+    other = GameOfLife(10, 10, engine="numpy")
+    manager.load_into(other, "copy.cells")
+    assert other.engine.population() == 5
+    assert other.get_cell(0, 1) == 1
+    assert set(manager.list_saved_patterns()) == {"glider.rle", "copy.cells"}
@@ -0,0 +1,130 @@
+import numpy as np
+
+from cli.main_cli import main
+from core.game import GameOfLife
+from core.recording import Recorder, Recording
+
+
+def frames(count, shape=(16, 16), seed=0):
+    rng = np.random.default_rng(seed)
+    return [(rng.random(shape) < 0.3).astype(np.uint8) for _ in range(count)]
+
+
+def test_random_access_across_chunks(tmp_path):
+    images = frames(23)
+    with Recorder(tmp_path / "run.golr", (16, 16), keyframe_interval=5) as recorder:
+        for image in images:
+            recorder.append(image)
+
+    with Recording(tmp_path / "run.golr") as recording:
+        assert len(recording) == 23
+        assert recording.shape == (16, 16)
+        for index in (22, 0, 7, 8, 9, 3, 15, -1):
+            assert np.array_equal(recording[index], images[index])
+
+
+def test_recording_being_written_is_readable(tmp_path):
+    images = frames(12, seed=1)
+    recorder = Recorder(tmp_path / "live.golr", (16, 16), keyframe_interval=4)
+    for image in images[:9]:
+        recorder.append(image)
+
+    # Deux blocs complets sur disque, pas encore d'index final
+    recording = Recording(tmp_path / "live.golr")
+    assert len(recording) == 8
+    assert np.array_equal(recording[5], images[5])
+
+    for image in images[9:]:
+        recorder.append(image)
+    recorder.close()
+    recording.refresh()
+    assert len(recording) == 12
+    assert np.array_equal(recording[11], images[11])
+    recording.close()
+
+
+def test_game_records_generations(tmp_path):
+    game = GameOfLife(10, 10, engine="numpy", history=False)
+    game.set_cells([(4, 3), (4, 4), (4, 5)])
+    game.start_recording(tmp_path / "game.golr")
+    expected = [game.engine.to_array().copy()]
+    for _ in range(5):
+        game.next_generation()
+        expected.append(game.engine.to_array().copy())
+    game.close()
+
+    with Recording(tmp_path / "game.golr") as recording:
+        assert len(recording) == 6
+        for index, image in enumerate(expected):
+            assert np.array_equal(recording[index], image)
+
+
+def test_headless_record(tmp_path, capsys):
+    path = tmp_path / "cli.golr"
+    main(["--headless", "--size", "32x32", "--density", "0.3", "--seed", "2",
+          "--generations", "10", "--record", str(path)])
+    capsys.readouterr()
+    with Recording(path) as recording:
+        assert len(recording) == 11
+
+
+def test_undo_then_edit_is_recorded(tmp_path):
+    # Édition après un retour arrière : le diff enregistré doit partir de l'état restauré
+    game = GameOfLife(64, 64, engine="numpy")
+    game.set_cells([(1, 2), (2, 3), (3, 1), (3, 2), (3, 3)])
+    game.start_recording(tmp_path / "undo.golr")
+    expected = [game.engine.to_array().copy()]
+
+    def snapshot():
+        expected.append(game.engine.to_array().copy())
+
+    for _ in range(4):
+        game.next_generation()
+        snapshot()
+    game.previous_generation()
+    snapshot()
+    game.previous_generation()
+    snapshot()
+    game.set_cell(40, 40, 1)
+    snapshot()
+    for _ in range(3):
+        game.next_generation()
+        snapshot()
+    game.close()
+
+    with Recording(tmp_path / "undo.golr") as recording:
+        assert len(recording) == len(expected)
+        for index, image in enumerate(expected):
+            assert np.array_equal(recording.frame(index), image)
+
+
+def test_replay_frame_loaded_while_recording(tmp_path):
+    # Timeline en mode relecture : une image d'un fichier chargée pendant un enregistrement
+    source = GameOfLife(32, 32, engine="numpy", history=False)
+    source.set_cells([(10, 10), (10, 11), (10, 12), (11, 9), (11, 10), (11, 11)])  # crapaud
+    source.start_recording(tmp_path / "source.golr")
+    for _ in range(3):
+        source.next_generation()
+    source.close()
+
+    game = GameOfLife(32, 32, engine="sparse")
+    game.set_cells([(1, 2), (2, 3), (3, 1), (3, 2), (3, 3), (20, 20), (20, 21), (20, 22)])
+    game.start_recording(tmp_path / "live.golr")
+    expected = [game.engine.to_array().copy()]
+    for _ in range(4):
+        game.next_generation()
+        expected.append(game.engine.to_array().copy())
+
+    with Recording(tmp_path / "source.golr") as replay:
+        game.grid = replay.frame(2)
+        assert np.array_equal(game.engine.to_array(), replay.frame(2))
+    expected.append(game.engine.to_array().copy())
+    for _ in range(3):
+        game.next_generation()
+        expected.append(game.engine.to_array().copy())
+    game.close()
+
+    with Recording(tmp_path / "live.golr") as recording:
+        assert len(recording) == len(expected)
+        for index, image in enumerate(expected):
+            assert np.array_equal(recording.frame(index), image)
@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+from core.engines import create_engine
+from core.game import GameOfLife
+from core.hashlife import HashLife
+from core.rules import CONWAY, Rule, RuleError, parse_rule
+from gui.pattern_manager import PatternManager
+
+ENGINES = ["python", "numpy", "bitpacked", "sparse", "incremental"]
+RULES = ["B3/S23", "B36/S23", "B3678/S34678", "B2/S", "B1357/S1357", "B3/S012345678"]
+
+
+def random_board(rows, cols, density=0.35, seed=0):
+    rng = np.random.default_rng(seed)
+    return (rng.random((rows, cols)) < density).astype(np.uint8)
+
+
+def reference_step(board, rule):
+    padded = np.pad(board, 1).astype(np.int64)
+    rows, cols = board.shape
+    counts = sum(
+        padded[1 + dr:1 + dr + rows, 1 + dc:1 + dc + cols]
+        for dr in (-1, 0, 1) for dc in (-1, 0, 1) if (dr, dc) != (0, 0)
+    )
+    return rule.table[board, counts]
+
+
+def test_parse_notations():
+    assert parse_rule("B3/S23") == CONWAY
+    assert parse_rule("s23/b3") == CONWAY
+    assert parse_rule("23/3") == CONWAY
+    assert str(parse_rule("HighLife")) == "B36/S23"
+    assert str(parse_rule("b2/s")) == "B2/S"
+    assert parse_rule("B36/S23") is parse_rule("B36/S23")  # compilée une seule fois
+    with pytest.raises(RuleError):
+        parse_rule("B9/S23")
+    with pytest.raises(RuleError):
+        parse_rule("conway?")
+
+
+def test_lookup_table():
+    rule = Rule({3, 6}, {2, 3})
+    assert rule.table.shape == (2, 9)
+    assert rule.table[0].nonzero()[0].tolist() == [3, 6]
+    assert rule.table[1].nonzero()[0].tolist() == [2, 3]
+    assert rule == "B36/S23"
+
+
+@pytest.mark.parametrize("rule", RULES)
+@pytest.mark.parametrize("engine", ENGINES)
+def test_engines_follow_rule(engine, rule):
+    rule = parse_rule(rule)
+    board = random_board(14, 70, seed=len(str(rule)))
+    candidate = create_engine(engine, 14, 70, rule=rule)
+    candidate.load_array(board)
+    for _ in range(6):
+        expected = reference_step(board, rule)
+        assert candidate.step() == bool(expected.any())
+        if not expected.any():
+            break
+        board = expected
+        assert np.array_equal(candidate.to_array(), board)
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy", "bitpacked", "incremental"])
+def test_b0_rule_on_dense_engines(engine):
+    rule = parse_rule("B0/S8")
+    board = random_board(9, 11, seed=1)
+    candidate = create_engine(engine, 9, 11, rule=rule)
+    candidate.load_array(board)
+    candidate.step()
+    assert np.array_equal(candidate.to_array(), reference_step(board, rule))
+
+
+def test_b0_rejected_where_unbounded():
+    with pytest.raises(ValueError):
+        create_engine("sparse", 5, 5, rule="B0/S8")
+    with pytest.raises(ValueError):
+        HashLife(rule="B0/S8")
+
+
+def test_hashlife_follows_rule():
+    # Réplicateur HighLife : comparaison avec le moteur numpy loin des bords
+    board = np.zeros((64, 64), dtype=np.uint8)
+    for r, c in [(30, 32), (30, 33), (30, 34), (31, 31), (31, 34), (32, 30), (32, 34), (33, 30), (33, 33), (34, 30), (34, 31), (34, 32)]:
+        board[r, c] = 1
+    engine = create_engine("numpy", 64, 64, rule="HighLife")
+    engine.load_array(board)
+    hashlife = HashLife.from_grid(board, rule="HighLife")
+    for _ in range(12):
+        engine.step()
+    hashlife.advance(12)
+    assert np.array_equal(hashlife.to_grid(64, 64), engine.to_array())
+
+
+@pytest.mark.parametrize("filename", ["rule.json", "rule.rle", "rule.gol"])
+def test_rule_saved_with_pattern(tmp_path, filename):
+    manager = PatternManager(tmp_path)
+    game = GameOfLife(10, 10, engine="numpy", rule="B36/S23")
+    game.set_cells([(1, 1), (1, 2), (2, 2)])
+    manager.export_pattern(game, filename)
+    assert parse_rule(manager.pattern_rule(filename)) == game.rule
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from core.engines import create_engine
+from core.snapshot import SnapshotError, open_snapshot, save_snapshot
+
+
+@pytest.mark.parametrize("engine", ["numpy", "bitpacked", "sparse", "incremental"])
+def test_snapshot_roundtrip(tmp_path, engine):
+    rng = np.random.default_rng(4)
+    board = (rng.random((37, 130)) < 0.3).astype(np.uint8)
+    source = create_engine("numpy", 37, 130)
+    source.load_array(board)
+    path = tmp_path / "board.gol"
+    save_snapshot(path, source, rule="B36/S23")
+
+    target = create_engine(engine, 37, 130)
+    with open_snapshot(path) as snapshot:
+        assert (snapshot.rows, snapshot.cols, snapshot.rule) == (37, 130, "B36/S23")
+        snapshot.load_into(target)
+    assert np.array_equal(target.to_array(), board)
+    assert target.population() == int(board.sum())
+
+
+def test_snapshot_is_bit_packed(tmp_path):
+    path = tmp_path / "big.gol"
+    save_snapshot(path, np.ones((256, 256), dtype=np.uint8))
+    assert path.stat().st_size < 256 * 256 // 8 + 64
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "pattern.gol"
+    path.write_text("[[0, 1], [1, 2]]" * 4)
+    with pytest.raises(SnapshotError):
+        open_snapshot(path)
+
+
+def test_dimension_mismatch(tmp_path):
+    path = tmp_path / "small.gol"
+    save_snapshot(path, np.eye(4, dtype=np.uint8))
+    with open_snapshot(path) as snapshot, pytest.raises(SnapshotError):
+        snapshot.load_into(create_engine("numpy", 5, 5))
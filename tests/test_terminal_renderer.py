@@ -0,0 +1,32 @@
+import io
+
+import numpy as np
+
+from cli.terminal_renderer import TerminalRenderer, frame_lines
+
+
+def test_braille_packs_2x4_cells():
+    grid = np.zeros((4, 4), dtype=np.uint8)
+    grid[0, 0] = 1          # point 1
+    grid[3, 1] = 1          # point 8
+    grid[:, 2:] = 1         # bloc plein
+    assert frame_lines(grid, "braille") == [chr(0x2800 | 0x01 | 0x80) + chr(0x28FF)]
+
+
+def test_half_blocks_and_ascii():
+    grid = np.array([[1, 0, 1], [0, 1, 1], [1, 0, 0]])
+    assert frame_lines(grid, "half") == ["▀▄█", "▀  "]
+    assert frame_lines(grid, "ascii") == ["■.■", ".■■", "■.."]
+
+
+def test_diff_redraws_only_changed_lines():
+    stream = io.StringIO()
+    renderer = TerminalRenderer("ascii", stream=stream)
+    grid = np.zeros((3, 3), dtype=np.uint8)
+    renderer.render(grid)
+    stream.seek(0)
+    stream.truncate()
+
+    grid[2, 1] = 1
+    renderer.render(grid)
+    assert stream.getvalue() == "\x1b[4;1H.■.\x1b[K"